@@ -6,6 +6,7 @@ import numpy as np
 from rfmodel.core.random import get_rng
 from rfmodel.core.signal import Signal
 from rfmodel.core.block import Block
+from rfmodel.core.fusion import SNRNoise
 
 
 @dataclass
@@ -30,6 +31,10 @@ class AWGNBlock(Block):
     - Noise is set from the instantaneous average power of the input block.
     - This is a simple waveform-level SNR model, not Eb/N0.
     - No path loss, fading, delay, or Doppler.
+    - In Pipeline.run_ofdm() the noise is drawn directly on the active
+      subcarriers with the variance the time-domain noise has after the
+      receiver FFT (same SNR definition, Ps measured over the useful part of
+      the OFDM symbols).
     """
 
     type_name = "awgn"
@@ -63,4 +68,28 @@ class AWGNBlock(Block):
 
         y = x + n
         return s.copy_with(x=y)
+
+    def supports_fusion(self) -> bool:
+        return True
+
+    def fusion_stages(self, fs_hz: float) -> list:
+        _ = fs_hz
+        return [SNRNoise(self._rng, 10.0 ** (self.params.snr_db / 10.0))]
+
+    def supports_freq_domain(self, grid) -> bool:
+        _ = grid
+        return True
+
+    def process_freq(self, X: np.ndarray, grid) -> np.ndarray:
+        Ps = grid.time_power(X)
+        Pn = Ps / 10.0 ** (self.params.snr_db / 10.0)
+
+        # White noise of variance Pn maps to variance Pn * noise_scale per subcarrier
+        sigma = np.sqrt(Pn * grid.noise_scale / 2.0)
+
+        n = (
+            self._rng.normal(0.0, sigma, size=X.shape)
+            + 1j * self._rng.normal(0.0, sigma, size=X.shape)
+        )
+        return X + n
     
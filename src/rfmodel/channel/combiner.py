@@ -0,0 +1,51 @@
+# src/rfmodel/channel/combiner.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional, Sequence
+import numpy as np
+
+from rfmodel.core.graph import CombinerBlock
+from rfmodel.core.signal import Signal
+
+
+@dataclass
+class SumParams:
+    gains_db: Optional[tuple[float, ...]] = None   # power gain per input, in edge order (None = 0 dB)
+
+
+class SumBlock(CombinerBlock):
+    """
+    Superposition of several signals at one receiver (fan-in node of a
+    GraphPipeline), e.g. a wanted transmitter plus interferers.
+
+        y = sum_i sqrt(G_i) * x_i
+
+    All inputs must share fs_hz and length (leading batch axes broadcast).
+    The output keeps fc_hz and meta of the first input.
+    """
+
+    type_name = "sum"
+
+    def __init__(self, name: str, params: SumParams | None = None):
+        super().__init__(name=name)
+        self.params = params or SumParams()
+
+    def combine(self, inputs: Sequence[Signal]) -> Signal:
+        if not inputs:
+            raise ValueError("SumBlock needs at least one input")
+        g_db = self.params.gains_db
+        if g_db is not None and len(g_db) != len(inputs):
+            raise ValueError(f"gains_db has {len(g_db)} entries for {len(inputs)} inputs")
+
+        s0 = inputs[0]
+        for s in inputs[1:]:
+            if s.fs_hz != s0.fs_hz:
+                raise ValueError(f"Cannot sum signals at {s0.fs_hz} Hz and {s.fs_hz} Hz")
+            if np.shape(s.x)[-1] != np.shape(s0.x)[-1]:
+                raise ValueError("Cannot sum signals of different length")
+
+        y = 0
+        for i, s in enumerate(inputs):
+            a = 1.0 if g_db is None else 10.0 ** (g_db[i] / 20.0)
+            y = y + a * np.asarray(s.x)
+        return s0.copy_with(x=y)
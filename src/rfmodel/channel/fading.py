@@ -0,0 +1,276 @@
+# src/rfmodel/channel/fading.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+
+from rfmodel.core.dsp import StreamingFIR, fir_filter, _next_pow2
+from rfmodel.core.random import get_rng
+from rfmodel.core.signal import Signal
+from rfmodel.core.block import Block
+
+
+# Exponential power-delay profiles with the rms delay spreads of the ETSI
+# HIPERLAN/2 indoor models A-E (D is the LOS model with a Rician first tap).
+# (rms_delay_s, k_factor_db of the first tap or None for Rayleigh)
+INDOOR_PROFILES: dict[str, tuple[float, Optional[float]]] = {
+    "etsi_a": (50e-9, None),     # typical office, NLOS
+    "etsi_b": (100e-9, None),    # large open space / office, NLOS
+    "etsi_c": (150e-9, None),    # large open space, NLOS
+    "etsi_d": (140e-9, 10.0),    # large open space, LOS
+    "etsi_e": (250e-9, None),    # large open space, NLOS
+}
+
+
+def exponential_pdp(rms_delay_s: float, tap_spacing_s: float = 10e-9, floor_db: float = -30.0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Exponentially decaying power-delay profile P(tau) ~ exp(-tau / tau_rms),
+    sampled every tap_spacing_s and truncated at floor_db.
+
+    Returns (delays_s, powers_db).
+    """
+    if rms_delay_s <= 0:
+        raise ValueError("rms_delay_s must be > 0")
+    tau_max = rms_delay_s * np.log(10 ** (-floor_db / 10.0))
+    delays = np.arange(0.0, tau_max + tap_spacing_s / 2, tap_spacing_s)
+    powers_db = 10.0 * np.log10(np.exp(-delays / rms_delay_s))
+    return delays, powers_db
+
+
+@dataclass
+class FadingParams:
+    profile: Optional[str] = "etsi_a"          # key of INDOOR_PROFILES, or None for delays_s/powers_db
+    delays_s: Optional[tuple[float, ...]] = None
+    powers_db: Optional[tuple[float, ...]] = None
+    k_factor_db: Optional[float] = None        # Rician K of the first tap (overrides the profile)
+    doppler_hz: float = 0.0                    # max Doppler shift; 0 = block (quasi-static) fading
+    n_sinusoids: int = 16                      # sinusoids per tap in the sum-of-sinusoids model
+    n_realizations: int = 1                    # channel drops generated for a 1D input
+    normalize: bool = True                     # unit average total power gain
+    max_doppler_phase: float = 0.01            # fd * (taps update interval) bound, in cycles
+
+
+class FadingBlock(Block):
+    """
+    Tapped-delay-line multipath fading channel with many realizations at once.
+
+    Each path of the power-delay profile is rounded onto the sample grid
+    (powers of paths landing on the same sample are combined). Tap processes:
+      - Rayleigh, or Rician on the first tap (k_factor_db),
+      - Doppler from a randomized sum-of-sinusoids (Zheng-Xiao) model with the
+        classical Jakes spectrum, evaluated for all realizations and taps in
+        one vectorized call. doppler_hz = 0 gives block (quasi-static) fading.
+
+    Application is FFT-based: the taps are held constant over frames shorter
+    than max_doppler_phase / doppler_hz and every frame is filtered with its
+    own frequency response in a batched overlap-save (time-varying
+    convolution). Static channels use the regular FIR path.
+
+    Batching
+    --------
+    A 1D input with n_realizations = R gives an (R, n_samples) output, one
+    independent channel drop per row, so EVM statistics over thousands of
+    drops run as one batched pass. An (R, n_samples) input gets one drop per
+    row.
+
+    Streaming: input history, the drawn realizations and the sample clock are
+    kept between calls, so chunked runs match a single run. reset() clears
+    them and restarts the generator: with a constructor seed the same
+    realizations are drawn again, reset(seed=...) draws the ones of another
+    seed and without any seed every reset() gives fresh ones.
+
+    In Pipeline.run_ofdm() a static channel whose delay spread fits in the
+    cyclic prefix is applied as one complex gain per subcarrier.
+    """
+
+    type_name = "fading"
+
+    def __init__(self, name: str, params: FadingParams, seed: int | None = None):
+        super().__init__(name=name)
+        self.params = params
+        self._seed = seed
+        self._rng = get_rng(seed)
+
+        if params.profile is None:
+            if params.delays_s is None or params.powers_db is None:
+                raise ValueError("Specify a profile or both delays_s and powers_db")
+            if len(params.delays_s) != len(params.powers_db):
+                raise ValueError("delays_s and powers_db must have the same length")
+            self.delays_s = np.asarray(params.delays_s, dtype=float)
+            self.powers_db = np.asarray(params.powers_db, dtype=float)
+            self.k_factor_db = params.k_factor_db
+        else:
+            if params.profile not in INDOOR_PROFILES:
+                raise KeyError(f"Unknown profile '{params.profile}'. Available: {list(INDOOR_PROFILES)}")
+            rms, k_db = INDOOR_PROFILES[params.profile]
+            self.delays_s, self.powers_db = exponential_pdp(rms)
+            self.k_factor_db = params.k_factor_db if params.k_factor_db is not None else k_db
+
+        if np.any(self.delays_s < 0):
+            raise ValueError("delays_s must be >= 0")
+        if params.doppler_hz < 0:
+            raise ValueError("doppler_hz must be >= 0")
+        if params.n_sinusoids < 1 or params.n_realizations < 1:
+            raise ValueError("n_sinusoids and n_realizations must be >= 1")
+
+        self._fs_hz: Optional[float] = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self._draws: Optional[dict] = None
+        self._fir: Optional[StreamingFIR] = None
+        self._n = 0
+
+    def reset(self, seed: int | None = None) -> None:
+        self._rng = get_rng(seed if seed is not None else self._seed)
+        self._clear()
+
+    def _setup(self, fs_hz: float) -> None:
+        d = np.rint(self.delays_s * fs_hz).astype(np.int64)
+        p_lin = 10.0 ** (self.powers_db / 10.0)
+
+        # combine paths that fall onto the same sample
+        self.tap_delays, inv = np.unique(d, return_inverse=True)
+        self.tap_powers = np.bincount(inv, weights=p_lin)
+        if self.params.normalize:
+            self.tap_powers = self.tap_powers / self.tap_powers.sum()
+
+        self.n_taps = int(self.tap_delays[-1]) + 1
+        self._fs_hz = fs_hz
+        self._clear()
+
+    def _draw(self, R: int) -> dict:
+        L = len(self.tap_delays)
+        M = self.params.n_sinusoids
+        rng = self._rng
+        u = lambda *shape: rng.uniform(-np.pi, np.pi, size=shape)
+
+        draws = {"R": R}
+        if self.params.doppler_hz == 0.0:
+            draws["g"] = (rng.standard_normal((R, L)) + 1j * rng.standard_normal((R, L))) / np.sqrt(2.0)
+        else:
+            m = np.arange(1, M + 1)
+            alpha = (2 * np.pi * m - np.pi + u(R, L, 1)) / (4 * M)        # arrival angles
+            draws["cos_a"] = np.cos(alpha)
+            draws["sin_a"] = np.sin(alpha)
+            draws["phi"] = u(R, L, M)
+            draws["psi"] = u(R, L, M)
+        draws["los_phase"] = u(R)
+        draws["los_cos"] = np.cos(u(R))
+        return draws
+
+    def tap_gains(self, t_s: np.ndarray) -> np.ndarray:
+        """
+        Complex path gains of all drawn realizations at times t_s.
+        Returns shape (R, L, len(t_s)).
+        """
+        dr = self._draws
+        t = np.asarray(t_s, dtype=float)
+        fd = self.params.doppler_hz
+
+        if fd == 0.0:
+            diffuse = np.broadcast_to(dr["g"][..., None], dr["g"].shape + t.shape)
+        else:
+            w = 2 * np.pi * fd * t                                          # (T,)
+            re = np.cos(dr["cos_a"][..., None] * w + dr["phi"][..., None]).sum(axis=-2)
+            im = np.sin(dr["sin_a"][..., None] * w + dr["psi"][..., None]).sum(axis=-2)
+            diffuse = (re + 1j * im) / np.sqrt(self.params.n_sinusoids)   # (R, L, T)
+
+        g = np.array(diffuse, dtype=np.complex128)
+        if self.k_factor_db is not None:
+            K = 10.0 ** (self.k_factor_db / 10.0)
+            los = np.exp(1j * (2 * np.pi * fd * dr["los_cos"][:, None] * t + dr["los_phase"][:, None]))
+            g[:, 0, :] = np.sqrt(K / (K + 1)) * los + np.sqrt(1 / (K + 1)) * g[:, 0, :]
+
+        return g * np.sqrt(self.tap_powers)[:, None]
+
+    def _dense_taps(self, g: np.ndarray) -> np.ndarray:
+        # (R, L, T) path gains -> (R, T, n_taps) FIR taps
+        h = np.zeros((g.shape[0], g.shape[2], self.n_taps), dtype=np.complex128)
+        h[:, :, self.tap_delays] = g.transpose(0, 2, 1)
+        return h
+
+    def process(self, s: Signal) -> Signal:
+        if s.fs_hz != self._fs_hz:
+            self._setup(s.fs_hz)
+
+        x = np.asarray(s.x)
+        if x.ndim > 2:
+            raise ValueError("FadingBlock expects s.x of shape (n_samples,) or (n_trials, n_samples)")
+        R = x.shape[0] if x.ndim == 2 else self.params.n_realizations
+
+        if self._draws is None:
+            self._draws = self._draw(R)
+            self._fir = StreamingFIR(np.zeros(self.n_taps))
+        elif self._draws["R"] != R:
+            raise ValueError("Number of realizations changed between chunks; call reset()")
+
+        N = x.shape[-1]
+        x_ext = self._fir.extend(x)                      # (..., N + n_taps - 1)
+
+        if self.params.doppler_hz == 0.0:
+            h = self._dense_taps(self.tap_gains(np.zeros(1)))[:, 0, :]    # (R, n_taps)
+            y = fir_filter(x_ext, h)
+        else:
+            y = self._time_varying(x_ext, N)
+
+        self._n += N
+        if x.ndim == 1 and R == 1:
+            y = y[0]
+        return s.copy_with(x=y)
+
+    def supports_freq_domain(self, grid) -> bool:
+        # static channel whose delay spread fits in the cyclic prefix
+        if self.params.doppler_hz != 0.0:
+            return False
+        d_max = int(np.rint(self.delays_s.max() * grid.fs_hz))
+        return d_max <= grid.cp_len
+
+    def process_freq(self, X: np.ndarray, grid) -> np.ndarray:
+        if grid.fs_hz != self._fs_hz:
+            self._setup(grid.fs_hz)
+
+        X = np.asarray(X)
+        if X.ndim > 3:
+            raise ValueError("FadingBlock expects (n_sym, n_active) or (n_trials, n_sym, n_active) subcarriers")
+        R = X.shape[0] if X.ndim == 3 else self.params.n_realizations
+
+        if self._draws is None:
+            self._draws = self._draw(R)
+        elif self._draws["R"] != R:
+            raise ValueError("Number of realizations changed between calls; call reset()")
+
+        h = self._dense_taps(self.tap_gains(np.zeros(1)))[:, 0, :]    # (R, n_taps)
+        Y = X * grid.fir_response(h)[:, None, :]                       # (R, n_sym, n_active)
+        if X.ndim == 2 and R == 1:
+            Y = Y[0]
+        return Y
+
+    def _time_varying(self, x_ext: np.ndarray, N: int) -> np.ndarray:
+        D = self.n_taps
+        fs = self._fs_hz
+
+        # frame length: taps may move at most max_doppler_phase cycles per frame
+        # (independent of the chunk length, so streaming uses the same frames)
+        max_step = max(1, int(self.params.max_doppler_phase * fs / self.params.doppler_hz))
+        nfft = min(_next_pow2(max_step + D - 1), max(_next_pow2(8 * D), 1 << 14))
+        while nfft - D + 1 > max_step and nfft // 2 >= D:
+            nfft //= 2
+        step = nfft - D + 1
+
+        # frames sit on a global grid k*step so chunked runs use the same taps
+        n0 = self._n
+        f0 = n0 // step
+        f1 = -(-(n0 + N) // step)
+        lead = n0 - f0 * step
+        tail = f1 * step - (n0 + N)
+        pad = lambda n: np.zeros(x_ext.shape[:-1] + (n,), dtype=x_ext.dtype)
+        xp = np.concatenate([pad(lead), x_ext, pad(tail + nfft - step)], axis=-1)
+
+        frames = np.lib.stride_tricks.sliding_window_view(xp, nfft, axis=-1)[..., ::step, :][..., :f1 - f0, :]
+        t = ((np.arange(f0, f1) + 0.5) * step) / fs
+        H = np.fft.fft(self._dense_taps(self.tap_gains(t)), n=nfft, axis=-1)   # (R, F, nfft)
+
+        y = np.fft.ifft(np.fft.fft(frames, axis=-1) * H, axis=-1)[..., D - 1:]
+        y = y.reshape(y.shape[:-2] + (-1,))
+        return y[..., lead:lead + N]
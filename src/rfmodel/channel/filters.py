@@ -0,0 +1,171 @@
+# src/rfmodel/channel/filters.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+import scipy.signal as signal
+
+from rfmodel.core.dsp import StreamingFIR
+from rfmodel.core.signal import Signal
+from rfmodel.core.block import Block
+
+
+@dataclass
+class FIRFilterParams:
+    cutoff_hz: float | tuple[float, float] | None = None   # band edge(s), scipy.signal.firwin style
+    n_taps: int = 129
+    window: str | tuple = ("kaiser", 8.0)
+    pass_zero: bool | str = True       # True: lowpass / bandstop, False: highpass / bandpass
+    center_hz: float = 0.0             # shift the response to a complex band centre
+    taps: Optional[np.ndarray] = None  # use these taps instead of designing
+    method: str = "auto"               # 'auto', 'direct' or 'fft' (overlap-save)
+    nfft: Optional[int] = None
+
+
+class FIRFilterBlock(Block):
+    """
+    FIR channel-select / anti-alias filter.
+
+    The taps are designed with scipy.signal.firwin from the spec at the sample
+    rate of the first Signal seen (redesigned if fs changes), or given
+    directly. A non-zero center_hz shifts the response to a complex bandpass.
+
+    Filtering uses direct convolution for short filters and FFT overlap-save
+    for long ones ('auto'). The last n_taps-1 input samples are kept between
+    calls, so chunked (streaming) runs match a single run; reset() clears them.
+    Batched signals (n_trials, n_samples) are filtered along the last axis.
+
+    The filter is causal: a linear-phase design delays the signal by
+    group_delay_samples = (n_taps - 1) / 2.
+
+    Filters no longer than the cyclic prefix are applied per subcarrier in
+    Pipeline.run_ofdm().
+    """
+
+    type_name = "fir_filter"
+
+    def __init__(self, name: str, params: FIRFilterParams):
+        super().__init__(name=name)
+        self.params = params
+
+        if params.taps is None and params.cutoff_hz is None:
+            raise ValueError("Specify either cutoff_hz or taps")
+        if params.taps is None and params.n_taps < 1:
+            raise ValueError("n_taps must be >= 1")
+
+        self._fs_hz: Optional[float] = None
+        self._fir: Optional[StreamingFIR] = None
+        if params.taps is not None:
+            self._fir = StreamingFIR(np.asarray(params.taps), nfft=params.nfft, method=params.method)
+
+    def design(self, fs_hz: float) -> np.ndarray:
+        p = self.params
+        h = signal.firwin(p.n_taps, p.cutoff_hz, window=p.window, pass_zero=p.pass_zero, fs=fs_hz)
+        if p.center_hz != 0.0:
+            n = np.arange(p.n_taps)
+            h = h * np.exp(2j * np.pi * p.center_hz / fs_hz * n)
+        return h
+
+    @property
+    def taps(self) -> Optional[np.ndarray]:
+        return None if self._fir is None else self._fir.taps
+
+    @property
+    def group_delay_samples(self) -> float:
+        n = len(self.params.taps) if self.params.taps is not None else self.params.n_taps
+        return (n - 1) / 2.0
+
+    def reset(self, seed: int | None = None) -> None:
+        _ = seed
+        if self._fir is not None:
+            self._fir.reset()
+
+    def _ensure_taps(self, fs_hz: float) -> None:
+        p = self.params
+        if p.taps is None and fs_hz != self._fs_hz:
+            self._fir = StreamingFIR(self.design(fs_hz), nfft=p.nfft, method=p.method)
+            self._fs_hz = fs_hz
+
+    def supports_freq_domain(self, grid) -> bool:
+        # exact on the subcarriers while the impulse response fits in the CP
+        n = len(self.params.taps) if self.params.taps is not None else self.params.n_taps
+        return n - 1 <= grid.cp_len
+
+    def process_freq(self, X: np.ndarray, grid) -> np.ndarray:
+        self._ensure_taps(grid.fs_hz)
+        return X * grid.fir_response(self.taps)
+
+    def process(self, s: Signal) -> Signal:
+        self._ensure_taps(s.fs_hz)
+        y = self._fir(s.x)
+        return s.copy_with(x=y)
+
+
+@dataclass
+class IIRFilterParams:
+    cutoff_hz: float | tuple[float, float] | None = None   # band edge(s) [Hz]
+    order: int = 6
+    ftype: str = "butter"            # 'butter', 'cheby1', 'cheby2', 'ellip', 'bessel'
+    btype: str = "lowpass"           # 'lowpass', 'highpass', 'bandpass', 'bandstop'
+    rp_db: Optional[float] = None    # passband ripple (cheby1, ellip)
+    rs_db: Optional[float] = None    # stopband attenuation (cheby2, ellip)
+    sos: Optional[np.ndarray] = None  # use these second-order sections instead of designing
+
+
+class IIRFilterBlock(Block):
+    """
+    IIR channel-select filter as cascaded second-order sections.
+
+    Designed with scipy.signal.iirfilter (output='sos') at the sample rate of
+    the first Signal seen, or given directly as `sos`. Applied with
+    scipy.signal.sosfilt; the section states (zi) persist between calls so
+    chunked (streaming) runs match a single run. reset() clears them.
+    Batched signals (n_trials, n_samples) keep one state per trial.
+    """
+
+    type_name = "iir_filter"
+
+    def __init__(self, name: str, params: IIRFilterParams):
+        super().__init__(name=name)
+        self.params = params
+
+        if params.sos is None and params.cutoff_hz is None:
+            raise ValueError("Specify either cutoff_hz or sos")
+
+        self._fs_hz: Optional[float] = None
+        self.sos: Optional[np.ndarray] = None
+        if params.sos is not None:
+            self.sos = np.atleast_2d(np.asarray(params.sos, dtype=float))
+            if self.sos.shape[-1] != 6:
+                raise ValueError("sos must have shape (n_sections, 6)")
+        self._zi: Optional[np.ndarray] = None
+
+    def design(self, fs_hz: float) -> np.ndarray:
+        p = self.params
+        return signal.iirfilter(
+            p.order, p.cutoff_hz, rp=p.rp_db, rs=p.rs_db,
+            btype=p.btype, ftype=p.ftype, output="sos", fs=fs_hz,
+        )
+
+    def reset(self, seed: int | None = None) -> None:
+        _ = seed
+        self._zi = None
+
+    def process(self, s: Signal) -> Signal:
+        if self.params.sos is None and s.fs_hz != self._fs_hz:
+            self.sos = self.design(s.fs_hz)
+            self._fs_hz = s.fs_hz
+            self._zi = None
+
+        x = np.asarray(s.x)
+        zi_shape = (self.sos.shape[0],) + x.shape[:-1] + (2,)
+        if self._zi is None:
+            self._zi = np.zeros(zi_shape, dtype=np.result_type(x.dtype, np.float64))
+        elif self._zi.shape != zi_shape:
+            raise ValueError(
+                f"Batch shape changed between chunks ({self._zi.shape[1:-1]} -> "
+                f"{x.shape[:-1]}); call reset() before starting a new stream"
+            )
+
+        y, self._zi = signal.sosfilt(self.sos, x, axis=-1, zi=self._zi)
+        return s.copy_with(x=y)
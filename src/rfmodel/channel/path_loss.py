@@ -5,6 +5,7 @@ import numpy as np
 
 from rfmodel.core.signal import Signal
 from rfmodel.core.block import Block
+from rfmodel.core.fusion import Gain
 import warnings
 
 
@@ -42,9 +43,8 @@ class PathLossBlock(Block):
                 UserWarning
             )
 
-    def process(self, s: Signal) -> Signal:
+    def amplitude_gain(self) -> float:
         p = self.params
-        x = s.x
 
         # Linear antenna gains
         Gt = 10 ** (p.tx_ant_gain_db / 10.0)
@@ -58,7 +58,23 @@ class PathLossBlock(Block):
         G = np.minimum(G_friis, Gt * Gr)
 
         # Convert to amplitude scaling
-        alpha = np.sqrt(G)
+        return np.sqrt(G)
+
+    def supports_fusion(self) -> bool:
+        return True
+
+    def fusion_stages(self, fs_hz: float) -> list:
+        _ = fs_hz
+        return [Gain(self.amplitude_gain())]
 
-        y = alpha * x
-        return s.copy_with(x=y)
\ No newline at end of file
+    def supports_freq_domain(self, grid) -> bool:
+        _ = grid
+        return True
+
+    def process_freq(self, X: np.ndarray, grid) -> np.ndarray:
+        _ = grid
+        return self.amplitude_gain() * X
+
+    def process(self, s: Signal) -> Signal:
+        y = self.amplitude_gain() * s.x
+        return s.copy_with(x=y)
@@ -5,6 +5,9 @@ from rfmodel.core.factory import register_block, build_block
 from rfmodel.channel.AWGN import AWGNBlock, AWGNParams
 from rfmodel.channel.path_loss import PathLossBlock, PathLossParams
 from rfmodel.channel.channel import ChannelBlock
+from rfmodel.channel.combiner import SumBlock, SumParams
+from rfmodel.channel.fading import FadingBlock, FadingParams
+from rfmodel.channel.filters import FIRFilterBlock, FIRFilterParams, IIRFilterBlock, IIRFilterParams
 
 
 @register_block("channel")
@@ -39,4 +42,85 @@ def _build_pathloss(cfg: dict) -> PathLossBlock:
         tx_ant_gain_db=float(p.get("tx_ant_gain_db", 0.0)),
         rx_ant_gain_db=float(p.get("rx_ant_gain_db", 0.0)),
     )
-    return PathLossBlock(name=name, params=params)
\ No newline at end of file
+    return PathLossBlock(name=name, params=params)
+
+
+def _cutoff(v):
+    if v is None:
+        return None
+    if isinstance(v, (list, tuple)):
+        return tuple(float(f) for f in v)
+    return float(v)
+
+
+@register_block("fir_filter")
+def _build_fir_filter(cfg: dict) -> FIRFilterBlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    window = p.get("window", ("kaiser", 8.0))
+    taps = p.get("taps", None)
+    params = FIRFilterParams(
+        cutoff_hz=_cutoff(p.get("cutoff_hz")),
+        n_taps=int(p.get("n_taps", 129)),
+        window=tuple(window) if isinstance(window, list) else window,
+        pass_zero=p.get("pass_zero", True),
+        center_hz=float(p.get("center_hz", 0.0)),
+        taps=np.asarray([complex(t) for t in taps]) if taps is not None else None,
+        method=p.get("method", "auto"),
+        nfft=p.get("nfft", None),
+    )
+    return FIRFilterBlock(name=name, params=params)
+
+
+@register_block("iir_filter")
+def _build_iir_filter(cfg: dict) -> IIRFilterBlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    sos = p.get("sos", None)
+    params = IIRFilterParams(
+        cutoff_hz=_cutoff(p.get("cutoff_hz")),
+        order=int(p.get("order", 6)),
+        ftype=p.get("ftype", "butter"),
+        btype=p.get("btype", "lowpass"),
+        rp_db=p.get("rp_db", None),
+        rs_db=p.get("rs_db", None),
+        sos=np.asarray(sos, dtype=float) if sos is not None else None,
+    )
+    return IIRFilterBlock(name=name, params=params)
+
+
+@register_block("fading")
+def _build_fading(cfg: dict) -> FadingBlock:
+    name = cfg["name"]
+    seed = cfg.get("seed", None)
+    p = cfg.get("params", {})
+
+    delays = p.get("delays_s", None)
+    powers = p.get("powers_db", None)
+    k_db = p.get("k_factor_db", None)
+    params = FadingParams(
+        profile=p.get("profile", "etsi_a" if delays is None else None),
+        delays_s=tuple(float(d) for d in delays) if delays is not None else None,
+        powers_db=tuple(float(v) for v in powers) if powers is not None else None,
+        k_factor_db=float(k_db) if k_db is not None else None,
+        doppler_hz=float(p.get("doppler_hz", 0.0)),
+        n_sinusoids=int(p.get("n_sinusoids", 16)),
+        n_realizations=int(p.get("n_realizations", 1)),
+        normalize=bool(p.get("normalize", True)),
+        max_doppler_phase=float(p.get("max_doppler_phase", 0.01)),
+    )
+    return FadingBlock(name=name, params=params, seed=seed)
+
+
+@register_block("sum")
+def _build_sum(cfg: dict) -> SumBlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    gains = p.get("gains_db", None)
+    params = SumParams(
+        gains_db=tuple(float(g) for g in gains) if gains is not None else None,
+    )
+    return SumBlock(name=name, params=params)
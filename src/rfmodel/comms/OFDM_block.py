@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import Tuple
 import numpy as np
 
 from rfmodel.core.signal import Signal
@@ -13,6 +14,10 @@ class OFDMParams:
     n_data_subcarriers: int
     normalize_ifft: bool = False
     null_dc: bool = True
+    # signed subcarrier indices of the pilots (e.g. (-21, -7, 7, 21)), on top
+    # of the data subcarriers; BPSK values from a fixed-seed sequence
+    pilot_subcarriers: Tuple[int, ...] = ()
+    pilot_seed: int = 0
 
 
 class OFDMModulator(Block):
@@ -32,16 +37,26 @@ class OFDMModulator(Block):
         self.n_fft = params.n_fft
         self.cp_len = params.cp_len
         self.n_data = params.n_data_subcarriers
+        self.n_pilots = len(params.pilot_subcarriers)
 
+        # active_bins: every used subcarrier (data and pilots), in grid order
         self.active_bins = self._make_active_bins()
+        self.pilot_bins = np.asarray(params.pilot_subcarriers, dtype=int) % self.n_fft
+        missing = np.setdiff1d(self.pilot_bins, self.active_bins)
+        if missing.size or np.unique(self.pilot_bins).size != self.n_pilots:
+            raise ValueError("pilot_subcarriers must be distinct and inside the used band")
+        is_pilot = np.isin(self.active_bins, self.pilot_bins)
+        self.pilot_index = np.array([np.nonzero(self.active_bins == b)[0][0] for b in self.pilot_bins], dtype=int)
+        self.data_index = np.nonzero(~is_pilot)[0]
+        self.data_bins = self.active_bins[self.data_index]
 
     def _make_active_bins(self) -> np.ndarray:
         n_fft = self.n_fft
-        n_data = self.n_data
+        n_data = self.n_data + self.n_pilots
 
         if self.params.null_dc:
             if n_data % 2 != 0:
-                raise ValueError("n_data_subcarriers must be even when null_dc=True")
+                raise ValueError("n_data_subcarriers + pilots must be even when null_dc=True")
             if n_data > n_fft - 1:
                 raise ValueError("Too many data subcarriers for DC-null allocation")
 
@@ -54,77 +69,158 @@ class OFDMModulator(Block):
             return np.concatenate([neg_bins, pos_bins])
 
         if n_data > n_fft:
-            raise ValueError("n_data_subcarriers cannot exceed n_fft")
+            raise ValueError("n_data_subcarriers + pilots cannot exceed n_fft")
 
         return np.arange(n_data)
 
-    def process(self, s: Signal) -> Signal:
-        x = np.asarray(s.x)
-
-        if x.ndim != 1:
-            raise ValueError("OFDMModulator expects s.x to be a 1D complex symbol array")
-        if not np.iscomplexobj(x):
-            raise ValueError("OFDMModulator expects complex QAM symbols as input")
-        if len(x) % self.n_data != 0:
+    def subcarrier_grid(self, fs_hz: float) -> "SubcarrierGrid":
+        return SubcarrierGrid(
+            n_fft=self.n_fft,
+            cp_len=self.cp_len,
+            fs_hz=fs_hz,
+            active_bins=self.active_bins,
+            normalize_ifft=self.params.normalize_ifft,
+        )
+
+    def modulation_meta(self, meta: dict | None) -> dict:
+        meta = dict(meta) if meta is not None else {}
+        meta.update({
+            "modulation": "OFDM",
+            "n_fft": self.n_fft,
+            "cp_len": self.cp_len,
+            "n_data_subcarriers": self.n_data,
+            "normalize_ifft": self.params.normalize_ifft,
+            "active_bins": self.active_bins.tolist(),
+        })
+        if self.n_pilots:
+            meta["pilot_bins"] = self.pilot_bins.tolist()
+        return meta
+
+    def pilot_symbols(self, n_sym: int) -> np.ndarray:
+        """Known pilot values (n_sym, n_pilots): +-1, the same for every call."""
+        rng = np.random.default_rng(self.params.pilot_seed)
+        return 2.0 * rng.integers(0, 2, size=(n_sym, self.n_pilots)) - 1.0
+
+    def symbol_grid(self, x: np.ndarray) -> np.ndarray:
+        """
+        Map QAM symbols (..., n_sym*n_data) onto the active subcarriers
+        (..., n_sym, n_active), pilots included. Without pilots this is a
+        reshape into (..., n_sym, n_data).
+        """
+        x = np.asarray(x)
+        if x.shape[-1] % self.n_data != 0:
             raise ValueError(
-                f"Number of input QAM symbols ({len(x)}) must be a multiple of "
+                f"Number of input QAM symbols ({x.shape[-1]}) must be a multiple of "
                 f"n_data_subcarriers ({self.n_data})"
             )
+        data = x.reshape(x.shape[:-1] + (-1, self.n_data))
+        if not self.n_pilots:
+            return data
+        X = np.empty(data.shape[:-1] + (self.active_bins.size,), dtype=np.result_type(data, np.complex128))
+        X[..., self.data_index] = data
+        X[..., self.pilot_index] = self.pilot_symbols(data.shape[-2])
+        return X
 
-        qam_blocks = x.reshape(-1, self.n_data)
-        time_blocks = []
+    def data_symbols(self, X: np.ndarray) -> np.ndarray:
+        """Inverse of symbol_grid(): data subcarriers of X as (..., n_sym*n_data)."""
+        X = np.asarray(X)
+        if self.n_pilots:
+            X = X[..., self.data_index]
+        return X.reshape(X.shape[:-2] + (-1,))
 
-        for qam_block in qam_blocks:
-            Xk = np.zeros(self.n_fft, dtype=np.complex128)
-            Xk[self.active_bins] = qam_block
+    def modulate_grid(self, s: Signal, X: np.ndarray) -> Signal:
+        """Time-domain OFDM signal for active-subcarrier values X (..., n_sym, n_active)."""
+        # All OFDM symbols (and any leading batch axes) in one IFFT
+        X = np.asarray(X)
+        Xk = np.zeros(X.shape[:-1] + (self.n_fft,), dtype=np.complex128)
+        Xk[..., self.active_bins] = X
 
-            xn = np.fft.ifft(Xk)
+        xn = np.fft.ifft(Xk, axis=-1)
 
-            if self.params.normalize_ifft:
-                xn = xn * np.sqrt(self.n_fft)
+        if self.params.normalize_ifft:
+            xn = xn * np.sqrt(self.n_fft)
 
-            if self.cp_len > 0:
-                xn = np.concatenate([xn[-self.cp_len:], xn])
+        if self.cp_len > 0:
+            xn = np.concatenate([xn[..., -self.cp_len:], xn], axis=-1)
 
-            time_blocks.append(xn)
+        y = xn.reshape(xn.shape[:-2] + (-1,))
 
-        y = np.concatenate(time_blocks)
+        return s.copy_with(x=y, meta=self.modulation_meta(s.meta))
 
-        meta = dict(s.meta) if s.meta is not None else {}
-        meta.update({
-            "modulation": "OFDM",
-            "n_fft": self.n_fft,
-            "cp_len": self.cp_len,
-            "n_data_subcarriers": self.n_data,
-            "normalize_ifft": self.params.normalize_ifft,
-            "active_bins": self.active_bins.tolist(),
-        })
+    def process(self, s: Signal) -> Signal:
+        x = np.asarray(s.x)
 
-        return s.copy_with(x=y, meta=meta)
-    
-    def demodulate(self, s: Signal) -> Signal:
-        """OFDM demodulation: time-domain samples → QAM symbols"""
+        if x.ndim < 1:
+            raise ValueError("OFDMModulator expects s.x to be a complex symbol array")
+        if not np.iscomplexobj(x):
+            raise ValueError("OFDMModulator expects complex QAM symbols as input")
+
+        return self.modulate_grid(s, self.symbol_grid(x))
+
+    def demodulate_grid(self, s: Signal) -> np.ndarray:
+        """Received active-subcarrier values (..., n_sym, n_active), pilots included."""
         x = np.asarray(s.x)
 
         # 1. Calculate the total length of one OFDM symbol (FFT + CP)
         n_total = self.n_fft + self.cp_len
         
-        # 2. Reshape into individual OFDM symbols
-        symbols = x.reshape(-1, n_total)
-        qam_blocks = []
-
-        for sym in symbols:
-            # 3. Remove cyclic prefix
-            sym_no_cp = sym[self.cp_len:] if self.cp_len > 0 else sym
-            
-            # 4. FFT to move from Time Domain back to Frequency Domain
-            Xk = np.fft.fft(sym_no_cp)
-            
-            if self.params.normalize_ifft:
-                Xk = Xk / np.sqrt(self.n_fft)
-                
-            # 5. Extract only the active subcarriers (the data)
-            qam_blocks.append(Xk[self.active_bins])
-
-        y = np.concatenate(qam_blocks)
-        return s.copy_with(x=y)
\ No newline at end of file
+        # 2. Reshape into individual OFDM symbols (leading batch axes are kept)
+        symbols = x.reshape(x.shape[:-1] + (-1, n_total))
+
+        # 3. Remove cyclic prefix
+        sym_no_cp = symbols[..., self.cp_len:]
+
+        # 4. FFT to move from Time Domain back to Frequency Domain, all symbols at once
+        Xk = np.fft.fft(sym_no_cp, axis=-1)
+
+        if self.params.normalize_ifft:
+            Xk = Xk / np.sqrt(self.n_fft)
+
+        # 5. Extract only the active subcarriers
+        return Xk[..., self.active_bins]
+
+    def demodulate(self, s: Signal) -> Signal:
+        """OFDM demodulation: time-domain samples → QAM symbols"""
+        return s.copy_with(x=self.data_symbols(self.demodulate_grid(s)))
+
+
+@dataclass(frozen=True)
+class SubcarrierGrid:
+    """
+    Description of the active OFDM subcarriers, handed to blocks that can be
+    evaluated directly in the frequency domain (Block.process_freq).
+
+    Subcarrier values are in the scale the demodulator returns, i.e. the QAM
+    symbols for an ideal channel.
+    """
+    n_fft: int
+    cp_len: int
+    fs_hz: float
+    active_bins: np.ndarray
+    normalize_ifft: bool
+
+    @property
+    def freqs_hz(self) -> np.ndarray:
+        """Baseband frequency of every active subcarrier."""
+        return np.fft.fftfreq(self.n_fft, 1.0 / self.fs_hz)[self.active_bins]
+
+    @property
+    def noise_scale(self) -> float:
+        """Per-subcarrier noise variance per unit of time-domain noise variance."""
+        return 1.0 if self.normalize_ifft else float(self.n_fft)
+
+    def time_power(self, X: np.ndarray) -> float:
+        """Mean time-domain sample power of the OFDM signal with subcarriers X (CP excluded)."""
+        X = np.asarray(X)
+        per_symbol = np.sum(np.abs(X) ** 2, axis=-1) / (self.n_fft * self.noise_scale)
+        return float(np.mean(per_symbol))
+
+    def fir_response(self, h: np.ndarray) -> np.ndarray:
+        """
+        Response of FIR taps h on the active subcarriers. Exact (circular
+        convolution) while len(h) - 1 <= cp_len.
+        """
+        h = np.asarray(h)
+        n = np.arange(h.shape[-1])
+        E = np.exp(-2j * np.pi * np.outer(n, self.active_bins) / self.n_fft)
+        return h @ E
@@ -0,0 +1,158 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+from scipy.ndimage import uniform_filter1d
+
+from rfmodel.core.signal import Signal
+from rfmodel.core.block import Block
+from rfmodel.comms.OFDM_block import OFDMModulator
+
+
+@dataclass
+class OFDMReceiverParams:
+    estimator: str = "ls"                 # "ls" (linear interpolation) or "mmse"
+    cpe: bool = True                      # remove the common phase error per symbol
+    time_window: Optional[int] = None     # symbols averaged per estimate; None: whole burst
+    snr_db: float = 30.0                  # per-subcarrier SNR assumed by the MMSE estimator
+    # channel length assumed by MMSE; None: cp_len, capped at what the pilot spacing resolves
+    delay_spread_samples: Optional[int] = None
+    use_preamble: bool = True             # use meta['preamble_channel'] of OFDMSync if present
+
+
+class OFDMReceiver(Block):
+    """
+    Pilot-aided OFDM receiver: time-domain samples -> equalized QAM symbols.
+
+    All OFDM symbols (and leading batch axes) are handled at once:
+
+    1. FFT demodulation to the active subcarriers, Y (..., n_sym, n_active)
+    2. LS channel at the pilots, Hp = Y_p / P
+    3. Common phase error per symbol: the angle of Hp against the burst
+       average, removed from Y and Hp (PLL phase noise slower than a symbol)
+    4. Hp averaged over time_window symbols (moving average along the
+       symbol axis) to reduce noise on slowly varying channels
+    5. Interpolation to all active subcarriers with one precomputed
+       (n_active, n_pilots) matrix: linear ("ls") or Wiener ("mmse", for a
+       uniform power delay profile over delay_spread_samples + 1 taps)
+    6. One-tap zero-forcing equalization
+
+    With a preamble channel estimate (meta['preamble_channel'] from
+    OFDMSync, on every active subcarrier) that estimate is used instead of
+    steps 4-5, smoothed over frequency by the Wiener matrix for "mmse", and
+    the pilots only track the common phase error.
+
+    The output meta has 'cpe_rad' (..., n_sym) and 'channel_estimate'
+    (..., n_sym, n_active).
+    """
+
+    type_name = "ofdm_receiver"
+
+    def __init__(self, name: str, params: OFDMReceiverParams, ofdm: OFDMModulator):
+        super().__init__(name=name)
+        self.params = params
+        self.ofdm = ofdm
+
+        if ofdm.n_pilots == 0:
+            raise ValueError("OFDMReceiver needs an OFDMModulator with pilot_subcarriers")
+        if params.estimator not in ("ls", "mmse"):
+            raise ValueError("estimator must be 'ls' or 'mmse'")
+        if params.time_window is not None and params.time_window < 1:
+            raise ValueError("time_window must be >= 1 or None")
+
+        self.interp = self._interpolator()
+        self.smooth = self._smoother()
+
+    def _subcarrier_index(self, bins: np.ndarray) -> np.ndarray:
+        # signed subcarrier number of FFT bins
+        n = self.ofdm.n_fft
+        return np.where(bins >= (n + 1) // 2, bins - n, bins)
+
+    def _interpolator(self) -> np.ndarray:
+        ofdm, p = self.ofdm, self.params
+        k = self._subcarrier_index(ofdm.active_bins).astype(float)
+        kp = k[ofdm.pilot_index]
+
+        if p.estimator == "ls":
+            # linear between pilots, flat beyond the outer ones
+            order = np.argsort(kp)
+            W = np.zeros((k.size, kp.size))
+            for j, col in enumerate(np.eye(kp.size)[order].T):
+                W[:, j] = np.interp(k, kp[order], col)
+            return W[:, np.argsort(order)]
+
+        # Wiener: R_hp (R_pp + I / snr)^-1, R(dk) of a uniform delay profile
+        if p.delay_spread_samples is not None:
+            L = p.delay_spread_samples + 1
+        else:
+            spacing = np.max(np.diff(np.sort(kp)), initial=1)
+            L = max(1, min(ofdm.cp_len + 1, int(ofdm.n_fft // spacing)))
+        tau = np.arange(L)
+
+        def corr(a, b):
+            return np.exp(-2j * np.pi * np.subtract.outer(a, b)[..., None] * tau / ofdm.n_fft).mean(axis=-1)
+
+        R_pp = corr(kp, kp) + np.eye(kp.size) * 10 ** (-p.snr_db / 10)
+        return np.linalg.solve(R_pp.T, corr(k, kp).T).T
+
+    def _smoother(self) -> np.ndarray:
+        # Wiener smoothing of a full-band LS estimate: R (R + I / snr)^-1
+        ofdm, p = self.ofdm, self.params
+        n = ofdm.active_bins.size
+        if p.estimator == "ls":
+            return np.eye(n)
+        k = self._subcarrier_index(ofdm.active_bins).astype(float)
+        L = (p.delay_spread_samples if p.delay_spread_samples is not None else ofdm.cp_len) + 1
+        R = np.exp(-2j * np.pi * np.subtract.outer(k, k)[..., None] * np.arange(L) / ofdm.n_fft).mean(axis=-1)
+        return np.linalg.solve((R + np.eye(n) * 10 ** (-p.snr_db / 10)).T, R.T).T
+
+    def equalize_grid(
+        self, Y: np.ndarray, h_ref: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Equalize received active-subcarrier values Y (..., n_sym, n_active),
+        optionally with a channel estimate h_ref (..., n_active) from a
+        preamble.
+
+        Returns (X_hat, H, cpe_rad): equalized subcarriers with the common
+        phase error removed, the channel estimate on every active
+        subcarrier and the common phase error of every symbol.
+        """
+        ofdm, p = self.ofdm, self.params
+        Y = np.asarray(Y)
+        n_sym = Y.shape[-2]
+        Hp = Y[..., ofdm.pilot_index] * ofdm.pilot_symbols(n_sym)    # pilots are +-1
+
+        if h_ref is not None:
+            h_ref = (np.asarray(h_ref) @ self.smooth.T)[..., None, :]
+            ref = h_ref[..., ofdm.pilot_index]
+        else:
+            ref = Hp.mean(axis=-2, keepdims=True)
+
+        if p.cpe:
+            cpe = np.angle(np.sum(Hp * np.conj(ref), axis=-1))
+            rot = np.exp(-1j * cpe)[..., None]
+            Y = Y * rot
+            Hp = Hp * rot
+        else:
+            cpe = np.zeros(Y.shape[:-1])
+
+        if h_ref is not None:
+            H = np.broadcast_to(h_ref, Y.shape)
+            return Y / H, H, cpe
+
+        if p.time_window is None or p.time_window >= n_sym:
+            Hp = np.broadcast_to(Hp.mean(axis=-2, keepdims=True), Hp.shape)
+        elif p.time_window > 1:
+            Hp = (uniform_filter1d(Hp.real, p.time_window, axis=-2, mode="nearest")
+                  + 1j * uniform_filter1d(Hp.imag, p.time_window, axis=-2, mode="nearest"))
+
+        H = Hp @ self.interp.T
+        return Y / H, H, cpe
+
+    def process(self, s: Signal) -> Signal:
+        h_ref = s.meta.get("preamble_channel") if self.params.use_preamble else None
+        X_hat, H, cpe = self.equalize_grid(self.ofdm.demodulate_grid(s), h_ref)
+        meta = dict(s.meta)
+        meta.update({"cpe_rad": cpe, "channel_estimate": H})
+        return s.copy_with(x=self.ofdm.data_symbols(X_hat), meta=meta)
@@ -0,0 +1,246 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+
+from rfmodel.core.signal import Signal
+from rfmodel.core.block import Block
+from rfmodel.comms.OFDM_block import OFDMModulator
+
+
+# IEEE 802.11a short / long training sequences on subcarriers -26..26
+_S_80211A = np.sqrt(13 / 6) * np.array([
+    0, 0, 1 + 1j, 0, 0, 0, -1 - 1j, 0, 0, 0, 1 + 1j, 0, 0, 0, -1 - 1j, 0, 0, 0, -1 - 1j, 0, 0, 0, 1 + 1j, 0, 0, 0,
+    0, 0, 0, 0, -1 - 1j, 0, 0, 0, -1 - 1j, 0, 0, 0, 1 + 1j, 0, 0, 0, 1 + 1j, 0, 0, 0, 1 + 1j, 0, 0, 0, 1 + 1j, 0, 0,
+])
+_L_80211A = np.array([
+    1, 1, -1, -1, 1, 1, -1, 1, -1, 1, 1, 1, 1, 1, 1, -1, -1, 1, 1, -1, 1, -1, 1, 1, 1, 1,
+    0, 1, -1, -1, 1, 1, -1, 1, -1, 1, -1, -1, -1, -1, -1, 1, 1, -1, -1, 1, -1, 1, -1, 1, 1, 1, 1,
+], dtype=complex)
+
+N_SHORT = 10        # short training periods (n_fft / 4 samples each)
+
+
+def _signed(bins: np.ndarray, n_fft: int) -> np.ndarray:
+    return np.where(bins >= (n_fft + 1) // 2, bins - n_fft, bins)
+
+
+def training_sequences(ofdm: OFDMModulator, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Short and long training values on the active subcarriers of ofdm.
+
+    For the 802.11a allocation (n_fft 64, subcarriers -26..26 without DC)
+    these are the standard S and L sequences. Otherwise S is QPSK on every
+    active subcarrier that is a multiple of 4 and L is BPSK on all of them
+    (fixed seed), scaled to the same total power.
+    """
+    k = _signed(ofdm.active_bins, ofdm.n_fft)
+    if ofdm.n_fft == 64 and np.array_equal(np.sort(k), np.r_[-26:0, 1:27]):
+        return _S_80211A[k + 26], _L_80211A[k + 26]
+
+    rng = np.random.default_rng(seed)
+    on = k % 4 == 0
+    if not on.any():
+        raise ValueError("No active subcarrier on the short-training comb (multiples of 4)")
+    qpsk = (2 * rng.integers(0, 2, size=(k.size, 2)) - 1) @ np.array([1, 1j]) / np.sqrt(2)
+    S = np.where(on, qpsk * np.sqrt(k.size / on.sum()), 0)
+    L = 2.0 * rng.integers(0, 2, size=k.size) - 1.0
+    return S, L
+
+
+def ofdm_preamble(ofdm: OFDMModulator, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    802.11a-style preamble in the modulator's time-domain scale.
+
+    Returns (preamble, long_symbol): 10 repetitions of the n_fft / 4 sample
+    short symbol, then a n_fft / 2 guard interval and two long symbols of
+    n_fft samples (long_symbol is one of them).
+    """
+    n = ofdm.n_fft
+    if n % 4:
+        raise ValueError("n_fft must be a multiple of 4 for the short training symbol")
+    S, L = training_sequences(ofdm, seed)
+    grid = np.zeros((2, n), dtype=complex)
+    grid[:, ofdm.active_bins] = [S, L]
+    short, long_ = np.fft.ifft(grid, axis=-1)
+    if ofdm.params.normalize_ifft:
+        short, long_ = short * np.sqrt(n), long_ * np.sqrt(n)
+    pre = np.concatenate([np.tile(short[:n // 4], N_SHORT), long_[-n // 2:], long_, long_])
+    return pre, long_
+
+
+class PreambleInserter(Block):
+    """
+    TX side: prepend the ofdm_preamble() to every row of the OFDM signal.
+    When streaming, only the first chunk after reset() gets it.
+    """
+
+    type_name = "ofdm_preamble"
+
+    def __init__(self, name: str, ofdm: OFDMModulator, seed: int = 0):
+        super().__init__(name=name)
+        self.ofdm = ofdm
+        self.preamble, _ = ofdm_preamble(ofdm, seed)
+        self.reset()
+
+    def reset(self, seed: int | None = None) -> None:
+        _ = seed
+        self._sent = False
+
+    def process(self, s: Signal) -> Signal:
+        x = np.asarray(s.x)
+        if self._sent:
+            y = x
+        else:
+            pre = np.broadcast_to(self.preamble, x.shape[:-1] + self.preamble.shape)
+            y = np.concatenate([pre, x], axis=-1)
+        self._sent = not s.is_stream_end
+        return s.copy_with(x=y)
+
+
+@dataclass
+class OFDMSyncParams:
+    max_delay_samples: int = 256            # latest preamble start searched
+    n_data_symbols: Optional[int] = None    # OFDM symbols to output; None: all that arrive
+    correct_cfo: bool = True
+    backoff_samples: int = 0                # start this far into the cyclic prefix
+    seed: int = 0                           # training sequences (as PreambleInserter)
+
+
+class OFDMSync(Block):
+    """
+    RX timing and carrier frequency offset synchronization on the preamble
+    of PreambleInserter. Output: the samples from the first data symbol on,
+    CFO corrected and cut to whole OFDM symbols, ready for demodulate() or
+    OFDMReceiver. Every row of a batch is synchronized on its own.
+
+    1. Schmidl-Cox: P(d) = sum_{m<W} r*[d+m] r[d+m+Ls] over the short
+       symbols (Ls = n_fft / 4, W = 8 Ls), a difference of two cumulative
+       sums for all d at once. The peak of |P|^2 / R^2 gives coarse timing,
+       angle(P) / (2 pi Ls) the coarse CFO (range +-fs / (2 Ls)).
+    2. FFT cross-correlation with the long symbol near the expected position
+       gives the timing of the long symbols.
+    3. The angle of their lag-n_fft autocorrelation gives the fine CFO.
+
+    Streaming: input is buffered until max_delay_samples + preamble length
+    (the lookahead) has arrived, or the stream ends; after that chunks are
+    corrected as they come and whole symbols are passed on (none before).
+    The output meta has, per row, 'sync_start' (index of the first data
+    sample in the input), 'cfo_hz' and 'preamble_channel', the LS channel
+    estimate on the active subcarriers from the two long symbols (used by
+    OFDMReceiver).
+    """
+
+    type_name = "ofdm_sync"
+
+    def __init__(self, name: str, params: OFDMSyncParams, ofdm: OFDMModulator):
+        super().__init__(name=name)
+        self.params = params
+        self.ofdm = ofdm
+
+        if params.max_delay_samples < 0 or params.backoff_samples < 0:
+            raise ValueError("max_delay_samples and backoff_samples must be >= 0")
+        if params.backoff_samples > ofdm.cp_len:
+            raise ValueError("backoff_samples must not exceed cp_len")
+
+        self.preamble, self.long_symbol = ofdm_preamble(ofdm, params.seed)
+        self.long_values = training_sequences(ofdm, params.seed)[1]
+        self.n_sym_samples = ofdm.n_fft + ofdm.cp_len
+        self.lookahead = params.max_delay_samples + self.preamble.size
+        self.reset()
+
+    def reset(self, seed: int | None = None) -> None:
+        _ = seed
+        self._buf: Optional[np.ndarray] = None    # input from sample _base on
+        self._base = 0
+        self._start: Optional[np.ndarray] = None  # per row, None until acquired
+        self._cfo: Optional[np.ndarray] = None
+        self._channel: Optional[np.ndarray] = None
+        self._k = 0                                # output samples emitted
+
+    def _acquire(self, r: np.ndarray, fs_hz: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n = self.ofdm.n_fft
+        Ls, W = n // 4, 2 * n
+        M = r.shape[-1]
+        if M < self.preamble.size:
+            raise ValueError("Input is shorter than the preamble")
+
+        # Schmidl-Cox metric for every lag with cumulative sums: O(M)
+        c = np.conj(r[..., :-Ls]) * r[..., Ls:]
+        e = np.abs(r[..., Ls:]) ** 2
+        zero = np.zeros(r.shape[:-1] + (1,))
+        cs_c = np.concatenate([zero, np.cumsum(c, axis=-1)], axis=-1)
+        cs_e = np.concatenate([zero, np.cumsum(e, axis=-1)], axis=-1)
+        P = cs_c[..., W:] - cs_c[..., :-W]
+        R = cs_e[..., W:] - cs_e[..., :-W]
+        metric = np.abs(P) ** 2 / np.maximum(R, np.finfo(float).tiny) ** 2
+        d_c = np.argmax(metric, axis=-1)
+        f_c = np.angle(np.take_along_axis(P, d_c[..., None], axis=-1)[..., 0]) / (2 * np.pi * Ls)
+
+        t = np.arange(M)
+        if self.params.correct_cfo:
+            r = r * np.exp(-2j * np.pi * f_c[..., None] * t)
+
+        # cross-correlation with the long symbol, both copies, via FFT
+        nfft = 1 << (M + n - 1).bit_length()
+        C = np.fft.ifft(np.fft.fft(r, nfft, axis=-1) * np.conj(np.fft.fft(self.long_symbol, nfft)), axis=-1)
+        G = np.abs(C[..., :M - 2 * n + 1]) ** 2 + np.abs(C[..., n:M - n + 1]) ** 2
+        # the metric plateau spans about Ls samples from the preamble start
+        expect = d_c + N_SHORT * Ls + n // 2
+        d = np.arange(G.shape[-1])
+        G = np.where(np.abs(d - expect[..., None] + Ls // 2) <= 2 * Ls, G, -1.0)
+        t1 = np.argmax(G, axis=-1)
+
+        idx = t1[..., None] + np.arange(n)
+        first = np.take_along_axis(r, idx, axis=-1)
+        second = np.take_along_axis(r, idx + n, axis=-1)
+        f_f = np.angle(np.sum(np.conj(first) * second, axis=-1)) / (2 * np.pi * n)
+
+        cfo = (f_c + f_f) if self.params.correct_cfo else np.zeros_like(f_c)
+        start = t1 + 2 * n - self.params.backoff_samples
+
+        # LS channel from the two long symbols, with the timing and phase
+        # reference of the data that follows
+        idx = (start - 2 * n)[..., None] + np.arange(2 * n)
+        lt = np.take_along_axis(r, idx, axis=-1)
+        if self.params.correct_cfo:
+            lt = lt * np.exp(-2j * np.pi * f_f[..., None] * idx)
+        Y = np.fft.fft(lt.reshape(lt.shape[:-1] + (2, n)), axis=-1).mean(axis=-2)
+        if self.ofdm.params.normalize_ifft:
+            Y = Y / np.sqrt(n)
+        return start, cfo * fs_hz, Y[..., self.ofdm.active_bins] / self.long_values
+
+    def process(self, s: Signal) -> Signal:
+        x = np.asarray(s.x)
+        self._buf = x if self._buf is None else np.concatenate([self._buf, x], axis=-1)
+        end = self._base + self._buf.shape[-1]
+
+        if self._start is None:
+            if end < self.lookahead and not s.is_stream_end:
+                return s.copy_with(x=self._buf[..., :0])
+            self._start, self._cfo, self._channel = self._acquire(self._buf[..., :self.lookahead], s.fs_hz)
+
+        # whole symbols available in every row (and not beyond n_data_symbols)
+        avail = int(np.min(end - self._start)) - self._k
+        k_end = self._k + max(avail, 0) // self.n_sym_samples * self.n_sym_samples
+        if self.params.n_data_symbols is not None:
+            k_end = min(k_end, self.params.n_data_symbols * self.n_sym_samples)
+        k = np.arange(self._k, max(k_end, self._k))
+        n_abs = self._start[..., None] + k
+        y = np.take_along_axis(self._buf, n_abs - self._base, axis=-1)
+        if self.params.correct_cfo:
+            y = y * np.exp(-2j * np.pi * self._cfo[..., None] / s.fs_hz * n_abs)
+        self._k += k.size
+
+        # drop input no row needs any more
+        keep_from = int(np.min(self._start)) + self._k
+        if keep_from > self._base:
+            self._buf = self._buf[..., keep_from - self._base:]
+            self._base = keep_from
+
+        meta = dict(s.meta)
+        meta.update({"sync_start": self._start, "cfo_hz": self._cfo, "preamble_channel": self._channel})
+        out = s.copy_with(x=y, meta=meta)
+        if s.is_stream_end:
+            self.reset()
+        return out
@@ -4,6 +4,7 @@ import numpy as np
 
 from rfmodel.core.signal import Signal
 from rfmodel.core.block import Block
+from rfmodel.core.kernels import get_kernel
 
 
 @dataclass
@@ -134,30 +135,11 @@ class QAMModulator(Block):
             raise ValueError("demap expects complex QAM symbols as input")
 
         # Undo unit-average-power scaling so levels are +/-1,3,5,...
-        if self.params.unit_average_power:
-            rx = rx * np.sqrt((2.0 / 3.0) * (self.params.M - 1))
-
-        sqrt_M = self.sqrt_M
-        k_axis = self.bits_per_axis
-
-        # Slice real/imag to nearest PAM index (0..sqrt_M-1)
-        def slice_axis(a: np.ndarray) -> np.ndarray:
-            idx = np.round((a + (sqrt_M - 1)) / 2).astype(np.int64)
-            return np.clip(idx, 0, sqrt_M - 1).astype(np.uint32)
-
-        i_idx = slice_axis(rx.real)
-        q_idx = slice_axis(rx.imag)
-
-        if self.params.gray_map:
-            i_idx = self._binary_to_gray(i_idx)
-            q_idx = self._binary_to_gray(q_idx)
-
-        # Unpack each index into k_axis bits (MSB first)
-        shifts = np.arange(k_axis - 1, -1, -1)
-        i_bits = ((i_idx[:, None] >> shifts) & 1).astype(np.uint8)
-        q_bits = ((q_idx[:, None] >> shifts) & 1).astype(np.uint8)
+        scale = np.sqrt((2.0 / 3.0) * (self.params.M - 1)) if self.params.unit_average_power else 1.0
 
-        return np.concatenate([i_bits, q_bits], axis=1).ravel()
+        # Slice real/imag to nearest PAM index, Gray-code and unpack [I-bits | Q-bits]
+        demap = get_kernel("qam_demap")
+        return demap(rx, scale, self.sqrt_M, self.bits_per_axis, self.params.gray_map)
 
     @staticmethod
     def _bits_to_int(b: np.ndarray) -> np.ndarray:
@@ -1,9 +1,18 @@
-from .OFDM_block import OFDMModulator, OFDMParams
+from .OFDM_block import OFDMModulator, OFDMParams, SubcarrierGrid
+from .OFDM_receiver import OFDMReceiver, OFDMReceiverParams
+from .OFDM_sync import OFDMSync, OFDMSyncParams, PreambleInserter, ofdm_preamble
 from .QAM_modulator import QAMModulator, QAMParams
 
 __all__ = [
     "OFDMModulator",
     "OFDMParams",
+    "SubcarrierGrid",
+    "OFDMReceiver",
+    "OFDMReceiverParams",
+    "OFDMSync",
+    "OFDMSyncParams",
+    "PreambleInserter",
+    "ofdm_preamble",
     "QAMParams",
     "QAMModulator",
 ]
\ No newline at end of file
@@ -4,6 +4,7 @@ import numpy as np
 
 from rfmodel.core.signal import Signal
 from rfmodel.core.block import Block
+from rfmodel.core.kernels import get_kernel
 
 
 @dataclass
@@ -48,23 +49,9 @@ class PRBSBitSource(Block):
         self.mask = (1 << self.order) - 1
 
     def _generate_bits(self) -> np.ndarray:
-        state = self.seed
         t1, t2 = self.taps
-        y = np.empty(self.n_bits, dtype=self.output_dtype)
-
-        for i in range(self.n_bits):
-            # Output bit = MSB of current state
-            y[i] = (state >> (self.order - 1)) & 1
-
-            # Feedback from polynomial taps
-            b1 = (state >> (t1 - 1)) & 1
-            b2 = (state >> (t2 - 1)) & 1
-            feedback = b1 ^ b2
-
-            # Shift left, insert feedback into LSB
-            state = ((state << 1) & self.mask) | feedback
-
-        return y
+        lfsr = get_kernel("prbs_lfsr")
+        return lfsr(self.seed, self.order, t1, t2, self.n_bits, self.output_dtype)
 
     def process(self, s: Signal) -> Signal:
         y = self._generate_bits()
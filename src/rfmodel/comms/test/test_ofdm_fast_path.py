@@ -0,0 +1,78 @@
+import numpy as np
+
+from rfmodel.core.signal import Signal
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.comms.OFDM_block import OFDMModulator, OFDMParams
+from rfmodel.channel.path_loss import PathLossBlock, PathLossParams
+from rfmodel.channel.AWGN import AWGNBlock, AWGNParams
+from rfmodel.channel.fading import FadingBlock, FadingParams
+from rfmodel.channel.filters import FIRFilterBlock, FIRFilterParams
+from rfmodel.rf.PA import PABlock, PAParams
+
+
+FS = 20e6
+
+
+def _qpsk(n_sym: int, n_data: int, seed: int = 0) -> Signal:
+    rng = np.random.default_rng(seed)
+    b = rng.integers(0, 2, size=(2, n_sym * n_data))
+    x = ((2 * b[0] - 1) + 1j * (2 * b[1] - 1)) / np.sqrt(2)
+    return Signal(x=x, fs_hz=FS)
+
+
+def _ofdm(normalize: bool = False) -> OFDMModulator:
+    return OFDMModulator("ofdm", OFDMParams(n_fft=64, cp_len=16, n_data_subcarriers=48, normalize_ifft=normalize))
+
+
+def _linear_chain(seed: int) -> Pipeline:
+    return Pipeline([
+        PathLossBlock("pl", PathLossParams(freq_hz=2.4e9, distance_m=1.0)),
+        FadingBlock("fad", FadingParams(profile="etsi_a", n_realizations=4), seed=seed),
+        FIRFilterBlock("fir", FIRFilterParams(taps=np.array([1.0, 0.3j, -0.1]))),
+    ])
+
+
+def test_linear_chain_matches_time_domain():
+    s = _qpsk(20, 48)
+    ofdm = _ofdm()
+
+    y_fast, _ = _linear_chain(seed=1).run_ofdm(s, ofdm)
+    y_ref = ofdm.demodulate(_linear_chain(seed=1).run(ofdm.process(s))[0])
+
+    assert y_fast.x.shape == (4, 20 * 48)
+    assert np.allclose(y_fast.x, y_ref.x)
+
+
+def test_awgn_evm_matches_time_domain():
+    s = _qpsk(400, 48)
+    snr_db = 20.0
+
+    for normalize in (False, True):
+        ofdm = _ofdm(normalize)
+        chain = lambda: Pipeline([AWGNBlock("awgn", AWGNParams(snr_db=snr_db), seed=5)])
+
+        y_fast, _ = chain().run_ofdm(s, ofdm)
+        y_ref = ofdm.demodulate(chain().run(ofdm.process(s))[0])
+
+        # the CP is discarded, so the EVM equals the time-domain SNR (null bins carry no power)
+        evm_fast = 10 * np.log10(np.mean(np.abs(y_fast.x - s.x) ** 2))
+        evm_ref = 10 * np.log10(np.mean(np.abs(y_ref.x - s.x) ** 2))
+        assert abs(evm_fast - evm_ref) < 0.2
+
+
+def test_nonlinear_block_runs_in_time_domain_and_taps_are_time_signals():
+    s = _qpsk(10, 48)
+    ofdm = _ofdm(normalize=True)
+    chain = lambda: Pipeline([
+        PathLossBlock("pl", PathLossParams(freq_hz=2.4e9, distance_m=1.0)),
+        PABlock("pa", PAParams(gain_db=10.0, p1db_out_dbm=-40.0)),
+        FIRFilterBlock("fir", FIRFilterParams(taps=np.array([1.0, 0.5]))),
+    ])
+
+    y_fast, taps = chain().run_ofdm(s, ofdm, taps=["pl", "fir"])
+    ref_pipe = chain()
+    y_ref, ref_taps = ref_pipe.run(ofdm.process(s), taps=["pl"])
+
+    assert np.allclose(y_fast.x, ofdm.demodulate(y_ref).x)
+    assert np.allclose(taps["pl"].x, ref_taps["pl"].x)
+    assert taps["fir"].x.shape == y_ref.x.shape
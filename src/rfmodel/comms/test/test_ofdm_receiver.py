@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from rfmodel.core.signal import Signal
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.comms.OFDM_block import OFDMModulator, OFDMParams
+from rfmodel.comms.OFDM_receiver import OFDMReceiver, OFDMReceiverParams
+from rfmodel.channel.AWGN import AWGNBlock, AWGNParams
+from rfmodel.channel.fading import FadingBlock, FadingParams
+from rfmodel.channel.filters import FIRFilterBlock, FIRFilterParams
+from rfmodel.rf.Mixer_PLL_block import MixerBlock, MixerParams, PLLParams
+
+
+FS = 20e6
+PILOTS = (-21, -7, 7, 21)
+
+
+def _qpsk(n: int, seed: int = 0) -> Signal:
+    rng = np.random.default_rng(seed)
+    b = rng.integers(0, 2, size=(2, n))
+    return Signal(x=((2 * b[0] - 1) + 1j * (2 * b[1] - 1)) / np.sqrt(2), fs_hz=FS)
+
+
+def _ofdm() -> OFDMModulator:
+    return OFDMModulator("ofdm", OFDMParams(n_fft=64, cp_len=16, n_data_subcarriers=48,
+                                            normalize_ifft=True, pilot_subcarriers=PILOTS))
+
+
+def _evm_db(y, ref) -> float:
+    return float(10 * np.log10(np.mean(np.abs(y - ref) ** 2)))
+
+
+def test_pilot_insertion_round_trip_and_fast_path():
+    ofdm = _ofdm()
+    s = _qpsk(10 * 48)
+    assert ofdm.active_bins.size == 52 and ofdm.data_bins.size == 48
+    assert sorted(ofdm.pilot_bins % 64) == sorted(np.asarray(PILOTS) % 64)
+
+    y = ofdm.process(s)
+    np.testing.assert_allclose(ofdm.demodulate(y).x, s.x, atol=1e-12)
+    np.testing.assert_allclose(ofdm.demodulate_grid(y)[:, ofdm.pilot_index], ofdm.pilot_symbols(10), atol=1e-12)
+
+    # pilots follow the channel on the subcarrier fast path as in the time domain
+    chain = lambda: Pipeline([FadingBlock("fad", FadingParams(profile="etsi_a", n_realizations=3), seed=4)])
+    y_fast, _ = chain().run_ofdm(s, ofdm)
+    y_ref = ofdm.demodulate(chain().run(y)[0])
+    np.testing.assert_allclose(y_fast.x, y_ref.x, atol=1e-12)
+
+    with pytest.raises(ValueError):
+        OFDMModulator("bad", OFDMParams(64, 16, 48, pilot_subcarriers=(-21, 30)))
+
+
+def test_receiver_removes_cpe_and_channel():
+    ofdm = _ofdm()
+    s = _qpsk(300 * 48, seed=1)
+    pll = PLLParams(VCO_Phase_Noise_dBc=(-90, 1e6), SLF_dBc=-110, f_L=100e3, Tu=3.2e-6)
+    h = np.array([1.0, 0.3j, -0.1])
+    pipe = Pipeline([
+        MixerBlock("mix", MixerParams(gain_db=0, iip3_dbm=30, nf_db=0, pll=pll, mixer_ideal=True), seed=1),
+        FIRFilterBlock("fir", FIRFilterParams(taps=h)),
+        AWGNBlock("awgn", AWGNParams(snr_db=30), seed=2),
+    ])
+    y, _ = pipe.run(ofdm.process(s))
+
+    plain = _evm_db(ofdm.demodulate(y).x, s.x)
+    H = np.fft.fft(h, 64)[ofdm.active_bins]
+    genie = _evm_db(ofdm.data_symbols(ofdm.demodulate_grid(y) / H), s.x)
+
+    evm = {}
+    for est in ("ls", "mmse"):
+        for cpe in (False, True):
+            out = OFDMReceiver("rx", OFDMReceiverParams(estimator=est, cpe=cpe), ofdm)(y)
+            assert out.x.shape == s.x.shape and out.meta["cpe_rad"].shape == (300,)
+            evm[est, cpe] = _evm_db(out.x, s.x)
+
+    assert plain > -12
+    assert evm["ls", False] < plain - 6
+    # CPE correction gains over the static channel, even a perfectly known one
+    assert evm["ls", True] < evm["ls", False] - 1 and evm["ls", True] < genie
+    assert evm["mmse", True] < evm["ls", True] - 1
+
+
+def test_time_smoothing_and_batches():
+    ofdm = _ofdm()
+    s = _qpsk(100 * 48, seed=2)
+    y, _ = Pipeline([AWGNBlock("awgn", AWGNParams(snr_db=15), seed=3)]).run(ofdm.process(s))
+
+    rx = lambda w: OFDMReceiver("rx", OFDMReceiverParams(cpe=False, time_window=w), ofdm)
+    e1, e9, e_all = (_evm_db(rx(w)(y).x, s.x) for w in (1, 9, None))
+    assert e_all < e9 < e1
+
+    # leading batch axes are equalized independently, in one call
+    yb = y.copy_with(x=np.stack([y.x, 2j * y.x]))
+    out = rx(9)(yb)
+    np.testing.assert_allclose(out.x[0], rx(9)(y).x, atol=1e-12)
+    np.testing.assert_allclose(out.x[1], out.x[0], atol=1e-12)
+
+    with pytest.raises(ValueError):
+        OFDMReceiver("rx", OFDMReceiverParams(), OFDMModulator("o", OFDMParams(64, 16, 48)))
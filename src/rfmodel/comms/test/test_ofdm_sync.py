@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from rfmodel.core.signal import Signal
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.comms.OFDM_block import OFDMModulator, OFDMParams
+from rfmodel.comms.OFDM_receiver import OFDMReceiver, OFDMReceiverParams
+from rfmodel.comms.OFDM_sync import OFDMSync, OFDMSyncParams, PreambleInserter, ofdm_preamble, training_sequences
+from rfmodel.channel.filters import FIRFilterBlock, FIRFilterParams
+
+
+FS = 20e6
+N_SYM = 40
+
+
+def _ofdm(n_fft=64, n_data=48) -> OFDMModulator:
+    return OFDMModulator("ofdm", OFDMParams(n_fft=n_fft, cp_len=n_fft // 4, n_data_subcarriers=n_data,
+                                            normalize_ifft=True, pilot_subcarriers=(-21, -7, 7, 21)))
+
+
+def _qpsk(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    b = rng.integers(0, 2, size=(2, n))
+    return ((2 * b[0] - 1) + 1j * (2 * b[1] - 1)) / np.sqrt(2)
+
+
+def _received(tx: np.ndarray, delays, cfos, snr_db=25.0, seed=1) -> np.ndarray:
+    # one trial per row: delay, carrier frequency offset and AWGN
+    rng = np.random.default_rng(seed)
+    n = tx.size + 300
+    t = np.arange(n)
+    x = np.zeros((len(delays), n), dtype=complex)
+    for i, d in enumerate(delays):
+        x[i, d:d + tx.size] = tx
+    x *= np.exp(2j * np.pi * np.asarray(cfos)[:, None] / FS * t)
+    sigma = np.sqrt(np.mean(np.abs(tx) ** 2) * 10 ** (-snr_db / 10) / 2)
+    return x + sigma * (rng.standard_normal(x.shape) + 1j * rng.standard_normal(x.shape))
+
+
+def test_preamble_structure():
+    ofdm = _ofdm()
+    pre, long_sym = ofdm_preamble(ofdm)
+    assert pre.size == 320
+    np.testing.assert_allclose(pre[:144], pre[16:160])                  # 10 short periods
+    np.testing.assert_allclose(pre[192:256], long_sym)
+    np.testing.assert_allclose(pre[256:], long_sym)
+    S, L = training_sequences(ofdm)
+    assert np.count_nonzero(S) == 12 and np.all(np.abs(L) == 1)
+
+    # other allocations get generic sequences of the same structure
+    S2, _ = training_sequences(_ofdm(128, 96))
+    assert np.sum(np.abs(S2) ** 2) == pytest.approx(100)
+
+
+def test_timing_and_cfo_per_trial_and_streaming():
+    ofdm = _ofdm()
+    q = _qpsk(N_SYM * 48)
+    tx = PreambleInserter("pre", ofdm)(ofdm.process(Signal(x=q, fs_hz=FS))).x
+    delays, cfos = [0, 37, 150, 255], [0.0, 50e3, -200e3, 400e3]
+    x = _received(tx, delays, cfos)
+
+    sync = OFDMSync("sync", OFDMSyncParams(n_data_symbols=N_SYM), ofdm)
+    y = sync(Signal(x=x, fs_hz=FS))
+    np.testing.assert_array_equal(y.meta["sync_start"], np.asarray(delays) + 320)
+    np.testing.assert_allclose(y.meta["cfo_hz"], cfos, atol=1e3)
+    assert y.x.shape == (4, N_SYM * 80)
+
+    z = OFDMReceiver("rx", OFDMReceiverParams(), ofdm)(y)
+    evm = 10 * np.log10(np.mean(np.abs(z.x - q) ** 2, axis=-1))
+    assert np.all(evm < -22)
+
+    # streamed in small chunks: nothing until the lookahead has arrived, then whole symbols
+    sync.reset()
+    out = [c.x for c, _ in Pipeline([sync]).run_stream(Signal(x=x, fs_hz=FS).chunks(333))]
+    assert out[0].shape == (4, 0) and all(o.shape[-1] % 80 == 0 for o in out)
+    np.testing.assert_allclose(np.concatenate(out, axis=-1), y.x, atol=1e-12)
+
+
+def test_multipath_with_backoff():
+    ofdm = _ofdm()
+    q = _qpsk(N_SYM * 48, seed=3)
+    tx = PreambleInserter("pre", ofdm)(ofdm.process(Signal(x=q, fs_hz=FS)))
+    ch, _ = Pipeline([FIRFilterBlock("fir", FIRFilterParams(taps=np.array([0.4, 1.0, 0.3j, -0.1])))]).run(tx)
+    x = _received(ch.x, [60], [-120e3], snr_db=30)
+
+    y = OFDMSync("sync", OFDMSyncParams(n_data_symbols=N_SYM, backoff_samples=4), ofdm)(Signal(x=x[0], fs_hz=FS))
+    assert abs(y.meta["cfo_hz"] + 120e3) < 1e3
+    assert y.meta["preamble_channel"].shape == (52,)
+    evm = {}
+    for est in ("ls", "mmse"):
+        for use in (True, False):
+            z = OFDMReceiver("rx", OFDMReceiverParams(estimator=est, use_preamble=use), ofdm)(y)
+            evm[est, use] = 10 * np.log10(np.mean(np.abs(z.x - q) ** 2))
+    # the delay spread after backoff is beyond what 4 pilots resolve; the long symbols are not
+    assert evm["ls", False] > -10 and evm["ls", True] < -25
+    assert evm["mmse", True] < evm["ls", True] - 0.5
+
+    with pytest.raises(ValueError):
+        OFDMSync("sync", OFDMSyncParams(backoff_samples=17), ofdm)
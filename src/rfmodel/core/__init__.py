@@ -1,7 +1,10 @@
 
 from .signal import Signal
+from .signal_io import SignalFile, SignalWriter, save_signal
+from .taps import TapSink, KeepTap, SliceTap, FileTap, StatsTap
 from .block import Block
 from .pipeline import Pipeline
+from .graph import GraphPipeline, CombinerBlock
 from .random import get_rng, RNGManager
 from .pipeline_builder import pipeline_from_config
 
@@ -28,8 +31,18 @@ __all__ = [
     "kTB_dbm",
     "load_yaml",
     "Signal",
+    "SignalFile",
+    "SignalWriter",
+    "save_signal",
+    "TapSink",
+    "KeepTap",
+    "SliceTap",
+    "FileTap",
+    "StatsTap",
     "Block",
     "Pipeline",
+    "GraphPipeline",
+    "CombinerBlock",
     "get_rng",
     "RNGManager",
     "pipeline_from_config"
@@ -0,0 +1,132 @@
+"""
+Numba implementations of the kernels in rfmodel.core.kernels.
+
+Imported by kernels.py only when numba is installed. Each kernel is a single
+pass over the samples (parallel over samples where the work is independent)
+and returns the same values as the NumPy reference to rounding. The GIL is
+released, so threaded executors can run them concurrently.
+
+The parallel kernels run only when called from the main thread. Calls from
+other threads (FusedBlock chunks, PipelinedExecutor stages, GraphPipeline
+nodes) use a serial compilation of the same kernel: numba's workqueue
+threading layer aborts on concurrent parallel launches, and the other
+layers would oversubscribe the cores (pool threads x numba threads).
+"""
+from __future__ import annotations
+
+import threading
+import types
+
+import numpy as np
+from numba import njit, prange
+
+from rfmodel.core.kernels import register_kernel
+
+
+class _Kernel:
+    # parallel and serial compilations of fn; the serial one gets its own
+    # name, so the two do not share a cache entry
+    def __init__(self, fn):
+        self.parallel = njit(parallel=True, nogil=True, cache=True)(fn)
+        twin = types.FunctionType(fn.__code__, fn.__globals__, fn.__name__ + "_serial",
+                                  fn.__defaults__, fn.__closure__)
+        twin.__qualname__ = fn.__qualname__ + "_serial"
+        self.serial = njit(nogil=True, cache=True)(twin)
+
+    def __call__(self, *args):
+        if threading.current_thread() is threading.main_thread():
+            return self.parallel(*args)
+        return self.serial(*args)
+
+
+@_Kernel
+def _rapp(x, y, g, asat, p, out):
+    # gain = r_out / r = g * (1 + u^p)^(-1/2p) with u = (g r / Asat)^2: no sqrt
+    # and no division by r; p = 1 and p = 2 avoid pow() altogether.
+    c = (g / asat) ** 2
+    e = -0.5 / p
+    for i in prange(x.size):
+        v = x[i]
+        u = c * (v.real * v.real + v.imag * v.imag)
+        if p == 2.0:
+            gain = g / np.sqrt(np.sqrt(1.0 + u * u))
+        elif p == 1.0:
+            gain = g / np.sqrt(1.0 + u)
+        else:
+            gain = g * (1.0 + u ** p) ** e
+        y[i] = out * gain * v
+
+
+@_Kernel
+def _cubic(x, y, a, b):
+    for i in prange(x.size):
+        v = x[i]
+        y[i] = a * v - b * (v.real * v.real + v.imag * v.imag) * v
+
+
+@njit(nogil=True, cache=True)
+def _lfsr(y, state, order, t1, t2):
+    mask = (1 << order) - 1
+    for i in range(y.size):
+        y[i] = (state >> (order - 1)) & 1
+        feedback = ((state >> (t1 - 1)) ^ (state >> (t2 - 1))) & 1
+        state = ((state << 1) & mask) | feedback
+
+
+@_Kernel
+def _slice(rx, bits, scale, sqrt_M, k_axis, gray):
+    top = sqrt_M - 1
+    for n in prange(rx.size):
+        v = rx[n] * scale
+        for axis in range(2):
+            a = v.real if axis == 0 else v.imag
+            idx = np.rint((a + top) / 2.0)
+            if idx < 0:
+                idx = 0.0
+            elif idx > top:
+                idx = top
+            k = np.uint32(idx)
+            if gray:
+                k = k ^ (k >> 1)
+            base = n * 2 * k_axis + axis * k_axis
+            for j in range(k_axis):
+                bits[base + j] = (k >> (k_axis - 1 - j)) & 1
+
+
+def _flat(x: np.ndarray, dtype) -> np.ndarray:
+    return np.ascontiguousarray(x, dtype=dtype).reshape(-1)
+
+
+@register_kernel("rapp_amam", backend="numba")
+def rapp_amam(x, g, asat, p, out=1.0):
+    x = np.asarray(x)
+    dtype = np.result_type(x.dtype, np.asarray(out).dtype, np.float64)
+    xf = _flat(x, dtype)
+    y = np.empty_like(xf)
+    _rapp(xf, y, float(g), float(asat), float(p), dtype.type(out))
+    return y.reshape(x.shape)
+
+
+@register_kernel("cubic", backend="numba")
+def cubic(x, a, b):
+    x = np.asarray(x)
+    dtype = np.result_type(x.dtype, np.asarray(a).dtype, np.asarray(b).dtype, np.float64)
+    xf = _flat(x, dtype)
+    y = np.empty_like(xf)
+    _cubic(xf, y, dtype.type(a), dtype.type(b))
+    return y.reshape(x.shape)
+
+
+@register_kernel("prbs_lfsr", backend="numba")
+def prbs_lfsr(seed, order, t1, t2, n_bits, dtype=np.uint8):
+    y = np.empty(n_bits, dtype=np.uint8)
+    _lfsr(y, int(seed), int(order), int(t1), int(t2))
+    return y.astype(dtype, copy=False)
+
+
+@register_kernel("qam_demap", backend="numba")
+def qam_demap(rx, scale, sqrt_M, k_axis, gray):
+    rxf = _flat(rx, np.complex128)
+    bits = np.empty(rxf.size * 2 * k_axis, dtype=np.uint8)
+    _slice(rxf, bits, float(scale), int(sqrt_M), int(k_axis), bool(gray))
+    return bits
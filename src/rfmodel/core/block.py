@@ -24,6 +24,39 @@ class Block(ABC):
         _ = seed
         return
 
+    def supports_freq_domain(self, grid) -> bool:
+        """
+        Optional: True if the block is linear and time-invariant on the given
+        OFDM SubcarrierGrid, so Pipeline.run_ofdm() may evaluate it with
+        process_freq() instead of in the time domain.
+        Default: not supported.
+        """
+        _ = grid
+        return False
+
+    def process_freq(self, X: np.ndarray, grid) -> np.ndarray:
+        """
+        Optional: apply the block to active-subcarrier values X of shape
+        (..., n_ofdm_symbols, n_active) and return the new values.
+        """
+        raise NotImplementedError
+
+    def supports_fusion(self) -> bool:
+        """
+        Optional: True if the block is memoryless (sample-by-sample) and can be
+        described by fusion_stages(), so Pipeline.compile() may fuse it with
+        its neighbours into one tiled kernel.
+        Default: not supported.
+        """
+        return False
+
+    def fusion_stages(self, fs_hz: float) -> list:
+        """
+        Optional: the pointwise stages (rfmodel.core.fusion) equivalent to
+        process() at sample rate fs_hz.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def process(self, s: Signal) -> Signal:
         """
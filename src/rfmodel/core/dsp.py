@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from typing import Optional
+import numpy as np
+
+
+# Below this tap count a direct (sliding window) convolution beats FFT overlap-save
+DIRECT_MAX_TAPS = 24
+
+
+def _next_pow2(n: int) -> int:
+    return 1 << max(int(n) - 1, 0).bit_length()
+
+
+def overlap_save(x_ext: np.ndarray, h: np.ndarray, nfft: Optional[int] = None) -> np.ndarray:
+    """
+    FFT overlap-save convolution along the last axis.
+
+    x_ext must already carry the L-1 samples of history in front of the new
+    samples (L = number of taps), so the output is the 'valid' part of the
+    linear convolution:
+
+        y[..., n] = sum_m h[..., m] * x_ext[..., n + L - 1 - m],   n = 0 .. N-1
+
+    with N = x_ext.shape[-1] - L + 1. Leading axes of x_ext and h broadcast,
+    so a (K, L) tap matrix filters K branches of a (..., K, N+L-1) input in
+    one call. All segments are transformed in a single batched FFT.
+
+    Parameters
+    ----------
+    x_ext :
+        Input with history, shape (..., N + L - 1).
+    h :
+        FIR taps, shape (..., L).
+    nfft :
+        FFT block length. Default: next power of two >= 8*L, but never longer
+        than needed for the whole input.
+
+    Returns
+    -------
+    y : ndarray, shape (..., N)
+    """
+    x_ext = np.asarray(x_ext)
+    h = np.asarray(h)
+
+    L = h.shape[-1]
+    N = x_ext.shape[-1] - L + 1
+    if L < 1:
+        raise ValueError("h must have at least one tap")
+    if N < 0:
+        raise ValueError("x_ext is shorter than the filter history (L - 1)")
+
+    out_shape = np.broadcast_shapes(x_ext.shape[:-1], h.shape[:-1]) + (N,)
+    is_complex = np.iscomplexobj(x_ext) or np.iscomplexobj(h)
+    if N == 0:
+        return np.zeros(out_shape, dtype=np.complex128 if is_complex else np.float64)
+
+    if nfft is None:
+        nfft = min(_next_pow2(8 * L), _next_pow2(N + L - 1))
+    if nfft < L:
+        raise ValueError(f"nfft ({nfft}) must be >= number of taps ({L})")
+
+    step = nfft - L + 1
+    n_frames = -(-N // step)
+
+    # Pad so the last frame is complete, then view every frame without copying
+    pad = (n_frames - 1) * step + nfft - x_ext.shape[-1]
+    xp = np.concatenate(
+        [x_ext, np.zeros(x_ext.shape[:-1] + (pad,), dtype=x_ext.dtype)], axis=-1
+    )
+    frames = np.lib.stride_tricks.sliding_window_view(xp, nfft, axis=-1)[..., ::step, :]
+
+    X = np.fft.fft(frames, n=nfft, axis=-1)
+    H = np.fft.fft(h, n=nfft, axis=-1)[..., None, :]
+    y = np.fft.ifft(X * H, axis=-1)[..., L - 1:]
+
+    y = y.reshape(y.shape[:-2] + (n_frames * step,))[..., :N]
+    if not is_complex:
+        y = y.real
+    return y
+
+
+def direct_convolve(x_ext: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """
+    Same contract as overlap_save(), evaluated as a sliding-window matrix
+    product. O(N*L), but faster than FFTs for short filters.
+    """
+    x_ext = np.asarray(x_ext)
+    h = np.asarray(h)
+    L = h.shape[-1]
+    if x_ext.shape[-1] < L - 1:
+        raise ValueError("x_ext is shorter than the filter history (L - 1)")
+    if x_ext.shape[-1] == L - 1:
+        shape = np.broadcast_shapes(x_ext.shape[:-1], h.shape[:-1]) + (0,)
+        return np.zeros(shape, dtype=np.result_type(x_ext, h))
+
+    win = np.lib.stride_tricks.sliding_window_view(x_ext, L, axis=-1)   # (..., N, L)
+    return (win @ h[..., ::-1, None])[..., 0]
+
+
+def fir_filter(
+    x_ext: np.ndarray,
+    h: np.ndarray,
+    method: str = "auto",
+    nfft: Optional[int] = None,
+) -> np.ndarray:
+    """
+    FIR filtering of a history-extended input (see overlap_save()).
+
+    method is 'direct', 'fft' (overlap-save) or 'auto', which picks direct
+    convolution up to DIRECT_MAX_TAPS taps and overlap-save above.
+    """
+    if method == "auto":
+        method = "direct" if np.shape(h)[-1] <= DIRECT_MAX_TAPS else "fft"
+    if method == "direct":
+        return direct_convolve(x_ext, h)
+    if method == "fft":
+        return overlap_save(x_ext, h, nfft=nfft)
+    raise ValueError(f"Unknown FIR method '{method}' (use 'auto', 'direct' or 'fft')")
+
+
+class StreamingFIR:
+    """
+    FIR filter that keeps the last L-1 input samples between calls, so a long
+    signal processed in consecutive chunks gives the same output as a single
+    call on the whole signal.
+
+    Filtering is along the last axis; any leading (batch) axes are kept and
+    must stay the same between calls until reset().
+    """
+
+    def __init__(self, taps: np.ndarray, nfft: Optional[int] = None, method: str = "auto"):
+        taps = np.asarray(taps)
+        if taps.ndim < 1 or taps.shape[-1] < 1:
+            raise ValueError("taps must have at least one element")
+        self.taps = taps
+        self.nfft = nfft
+        self.method = method
+        self._history: Optional[np.ndarray] = None
+
+    @property
+    def n_taps(self) -> int:
+        return int(self.taps.shape[-1])
+
+    def reset(self) -> None:
+        self._history = None
+
+    def extend(self, x: np.ndarray) -> np.ndarray:
+        """
+        Prepend the stored history to x and store the new history.
+        Returns the extended array of length N + L - 1.
+        """
+        x = np.asarray(x)
+        n_hist = self.n_taps - 1
+
+        if self._history is None:
+            self._history = np.zeros(x.shape[:-1] + (n_hist,), dtype=x.dtype)
+        elif self._history.shape[:-1] != x.shape[:-1]:
+            raise ValueError(
+                f"Batch shape changed between chunks ({self._history.shape[:-1]} -> "
+                f"{x.shape[:-1]}); call reset() before starting a new stream"
+            )
+
+        x_ext = np.concatenate([self._history, x], axis=-1)
+        self._history = x_ext[..., x_ext.shape[-1] - n_hist:].copy()
+        return x_ext
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        return fir_filter(self.extend(x), self.taps, method=self.method, nfft=self.nfft)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from rfmodel.core.block import Block
+from rfmodel.core.signal import Signal
+from rfmodel.core.taps import Taps, TapSet
+
+
+@dataclass
+class StageStats:
+    """Timing of one pipeline stage over a run_stream()-style run."""
+    name: str
+    n_chunks: int = 0
+    busy_s: float = 0.0        # time spent inside the blocks
+    wait_in_s: float = 0.0     # starved: waiting for the upstream stage
+    wait_out_s: float = 0.0    # backpressure: waiting for room downstream
+    wall_s: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        return self.busy_s / self.wall_s if self.wall_s > 0 else 0.0
+
+
+class _Failure:
+    # travels down the queues in place of a chunk when a stage raises
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+_END = object()
+
+
+class PipelinedExecutor:
+    """
+    Streaming executor in which every stage runs in its own worker thread.
+
+    Stages are connected by bounded FIFO queues, so while stage k processes
+    chunk i, stage k+1 can already work on chunk i-1. With NumPy releasing
+    the GIL inside its kernels, throughput approaches that of the slowest
+    stage rather than the sum of all stages.
+
+      - Backpressure: a full queue blocks the upstream stage, so at most
+        about (n_stages + 1) * (queue_size + 1) chunks are in flight
+        regardless of how fast the source is.
+      - Ordered delivery: one thread per stage and FIFO queues keep chunk
+        order; outputs are identical to Pipeline.run_stream().
+      - Stats: stats[k] holds busy / starved / blocked time per stage.
+      - Errors in a stage are re-raised in the consuming thread, and closing
+        the output iterator early stops all workers.
+
+    Parameters
+    ----------
+    blocks :
+        Blocks in chain order (disabled blocks are bypassed as usual).
+    stages :
+        Optional grouping of block names into stages, e.g.
+        [["MIX_TX"], ["PA_TX"], ["PL", "AWGN"], ["LNA_RX", "MIX_RX"]].
+        Default: one stage per block.
+    queue_size :
+        Capacity (in chunks) of each inter-stage queue.
+    """
+
+    def __init__(
+        self,
+        blocks: List[Block],
+        *,
+        stages: Optional[Sequence[Sequence[str]]] = None,
+        queue_size: int = 2,
+    ):
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+
+        if stages is None:
+            groups = [[b] for b in blocks]
+        else:
+            by_name = {b.name: b for b in blocks}
+            names = [n for g in stages for n in g]
+            if names != [b.name for b in blocks]:
+                raise ValueError("stages must list every block name exactly once, in chain order")
+            groups = [[by_name[n] for n in g] for g in stages if len(g)]
+
+        self.groups = groups
+        self.queue_size = queue_size
+        self.stats: List[StageStats] = []
+
+    def run(
+        self,
+        chunks: Iterable[Signal],
+        *,
+        taps: Taps = None,
+    ) -> Iterator[tuple[Signal, Dict[str, Signal]]]:
+        """
+        Same contract as Pipeline.run_stream(): yields (output_chunk,
+        tapped_chunks) for every input chunk, in order. TapSinks are updated
+        from the thread of the stage that owns the tapped block.
+        """
+        taps_set = TapSet(taps)
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.groups) + 1)]
+        self.stats = [StageStats("+".join(b.name for b in g)) for g in self.groups]
+
+        def put(q: queue.Queue, item) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def get(q: queue.Queue):
+            while not stop.is_set():
+                try:
+                    return q.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+            return _END
+
+        def feed():
+            try:
+                it = iter(chunks)
+                nxt = next(it, None)
+                while nxt is not None:
+                    cur, nxt = nxt, next(it, None)
+                    meta = dict(cur.meta) if cur.meta is not None else {}
+                    meta["stream_end"] = nxt is None
+                    if not put(queues[0], (cur.copy_with(meta=meta), {})):
+                        return
+            except BaseException as exc:        # noqa: BLE001 - forwarded to the consumer
+                put(queues[0], _Failure(exc))
+                return
+            put(queues[0], _END)
+
+        def work(k: int):
+            group, st = self.groups[k], self.stats[k]
+            q_in, q_out = queues[k], queues[k + 1]
+            t_start = time.perf_counter()
+            while True:
+                t0 = time.perf_counter()
+                item = get(q_in)
+                t1 = time.perf_counter()
+                st.wait_in_s += t1 - t0
+
+                if item is _END or isinstance(item, _Failure):
+                    put(q_out, item)
+                    break
+
+                cur, captured = item
+                try:
+                    for b in group:
+                        cur = b(cur)
+                        if b.name in taps_set:
+                            taps_set.capture(b.name, cur, captured)
+                except BaseException as exc:    # noqa: BLE001 - forwarded to the consumer
+                    put(q_out, _Failure(exc))
+                    break
+                t2 = time.perf_counter()
+                st.busy_s += t2 - t1
+                st.n_chunks += 1
+
+                ok = put(q_out, (cur, captured))
+                st.wait_out_s += time.perf_counter() - t2
+                if not ok:
+                    break
+            st.wall_s = time.perf_counter() - t_start
+
+        threads = [threading.Thread(target=feed, daemon=True)]
+        threads += [threading.Thread(target=work, args=(k,), daemon=True) for k in range(len(self.groups))]
+        for t in threads:
+            t.start()
+
+        try:
+            while True:
+                item = get(queues[-1])
+                if item is _END:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.exc
+                yield item
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
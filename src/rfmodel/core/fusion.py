@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+import numpy as np
+
+from rfmodel.core.block import Block
+from rfmodel.core.kernels import get_kernel
+from rfmodel.core.signal import Signal
+
+
+# Samples per tile of a fused kernel: 64K complex samples = 1 MiB, so the
+# intermediates of one tile stay in L2 cache.
+DEFAULT_TILE_SIZE = 65536
+
+# Suggested samples per work item in chunked mode. Fixed (not derived from
+# the thread count) so the per-chunk RNG substreams do not depend on it.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+# Pointwise stages
+# ----------------
+# Memoryless blocks describe themselves as a short list of the stages below
+# (Block.fusion_stages). A FusedBlock strings the stages of consecutive blocks
+# together, folds constant gains into their neighbours and runs them tile by
+# tile. Each stage keeps the arithmetic (and RNG draw order) of its block.
+
+
+@dataclass
+class Gain:
+    """y = a * x"""
+    a: complex
+
+
+@dataclass
+class Cubic:
+    """y = a * x - b * |x|^2 * x   (LNA / mixer / cubic PA AM-AM)"""
+    a: complex
+    b: complex
+
+
+@dataclass
+class RappAMAM:
+    """
+    Rapp soft limiter with small-signal amplitude gain g and output scale:
+
+        y = out * r_out(|x|) / |x| * x,   r_out = g r / (1 + (g r / Asat)^(2p))^(1/2p)
+    """
+    g: float
+    asat: float
+    p: float
+    out: complex = 1.0
+
+
+@dataclass
+class Noise:
+    """
+    y = x + n, n proper complex Gaussian with E|n|^2 = 2 sigma^2, drawn from
+    rng as normal(size=N) real parts followed by normal(size=N) imaginary parts.
+    """
+    rng: np.random.Generator
+    sigma: float
+
+
+@dataclass
+class SNRNoise:
+    """
+    y = x + n with E|n|^2 = mean(|x|^2) / snr_linear (AWGN). Needs the power
+    of the whole input, so a fused kernel starts a new sweep here.
+    """
+    rng: np.random.Generator
+    snr_linear: float
+
+
+def _fold(stages: list) -> list:
+    """
+    Fold constant gains into neighbouring stages:
+      Gain . Gain     -> Gain
+      Gain -> Cubic   -> Cubic with scaled coefficients (and Cubic -> Gain)
+      Gain -> Rapp    -> Rapp with scaled g (real positive gain only)
+      Rapp -> Gain    -> Rapp with scaled output
+    Gains next to noise stages are kept: moving them would rescale the noise.
+    """
+    out: list = []
+    for st in stages:
+        prev = out[-1] if out else None
+        if isinstance(st, Gain):
+            if isinstance(prev, Gain):
+                out[-1] = Gain(prev.a * st.a)
+                continue
+            if isinstance(prev, Cubic):
+                out[-1] = Cubic(prev.a * st.a, prev.b * st.a)
+                continue
+            if isinstance(prev, RappAMAM):
+                out[-1] = RappAMAM(prev.g, prev.asat, prev.p, prev.out * st.a)
+                continue
+        elif isinstance(prev, Gain):
+            g = prev.a
+            if isinstance(st, Cubic):
+                out[-1] = Cubic(st.a * g, st.b * abs(g) ** 2 * g)
+                continue
+            if isinstance(st, RappAMAM) and np.isreal(g) and np.real(g) > 0:
+                out[-1] = RappAMAM(st.g * float(np.real(g)), st.asat, st.p, st.out)
+                continue
+        out.append(st)
+
+    return [st for st in out if not (isinstance(st, Gain) and st.a == 1.0)]
+
+
+class _NoiseDraw:
+    # Reproduces normal(0, sigma, N) + 1j*normal(0, sigma, N) tile by tile:
+    # the real parts are drawn up front, the imaginary parts per tile.
+    # `offset` is the global index of the first of the n samples.
+    def __init__(self, rng: np.random.Generator, sigma: float, n: int, offset: int = 0):
+        self.rng = rng
+        self.sigma = sigma
+        self.offset = offset
+        self.re = rng.normal(0.0, sigma, size=n)
+
+    def __call__(self, lo: int, hi: int) -> np.ndarray:
+        lo, hi = lo - self.offset, hi - self.offset
+        return self.re[lo:hi] + 1j * self.rng.normal(0.0, self.sigma, size=hi - lo)
+
+
+def _apply(st, x: np.ndarray, noise: Optional[_NoiseDraw], lo: int, hi: int) -> np.ndarray:
+    if isinstance(st, Gain):
+        return st.a * x
+    if isinstance(st, Cubic):
+        return get_kernel("cubic")(x, st.a, st.b)
+    if isinstance(st, RappAMAM):
+        return get_kernel("rapp_amam")(x, st.g, st.asat, st.p, st.out)
+    return x + noise(lo, hi)
+
+
+def _out_dtype(stages: list, dtype: np.dtype) -> np.dtype:
+    t = np.zeros(1, dtype=dtype)
+    for st in stages:
+        t = t + 0j if isinstance(st, (Noise, SNRNoise)) else _apply(st, t, None, 0, 1)
+    return t.dtype
+
+
+class FusedBlock(Block):
+    """
+    Consecutive memoryless blocks run as one cache-blocked kernel.
+
+    The blocks' pointwise stages (Block.fusion_stages) are concatenated,
+    constant gains are folded into neighbouring stages, and the whole chain
+    is applied to tiles of tile_size samples, so every intermediate lives in
+    cache instead of being a full-length array. An AWGN stage needs the power
+    of its complete input; the kernel then makes one extra sweep over the
+    output buffer.
+
+    Serial mode (chunk_size None) draws noise from the original blocks'
+    generators in the same order as the unfused blocks, so outputs match the
+    unfused pipeline to rounding.
+
+    Chunked mode (chunk_size set) splits the signal into contiguous chunks
+    of chunk_size samples, processed concurrently by n_threads threads
+    (NumPy and the Numba kernels release the GIL). Each noise stage draws
+    one key from its block's generator per call and every chunk gets its own
+    substream SeedSequence(key, spawn_key=(chunk,)), so results depend on
+    the seed and chunk_size but not on n_threads (1 included). The noise
+    realization differs from serial mode; its statistics do not.
+
+    Built by Pipeline.compile(); not available from YAML.
+    """
+
+    type_name = "fused"
+
+    def __init__(
+        self,
+        name: str,
+        blocks: List[Block],
+        tile_size: int = DEFAULT_TILE_SIZE,
+        n_threads: int = 1,
+        chunk_size: Optional[int] = None,
+    ):
+        super().__init__(name=name)
+        _check_threading(tile_size, n_threads, chunk_size)
+        self.blocks = blocks
+        self.tile_size = tile_size
+        self.n_threads = n_threads
+        self.chunk_size = chunk_size
+
+    def reset(self, seed: int | None = None) -> None:
+        for blk in self.blocks:
+            blk.reset(seed=seed)
+
+    def stages(self, fs_hz: float) -> list:
+        st: list = []
+        for blk in self.blocks:
+            st.extend(blk.fusion_stages(fs_hz))
+        return _fold(st)
+
+    def process(self, s: Signal) -> Signal:
+        x = np.asarray(s.x)
+        buf = x.reshape(-1)
+        n = buf.size
+
+        stages = self.stages(s.fs_hz)
+        if not stages:
+            return s.copy_with(x=x.copy())
+
+        # split into sweeps at every stage that needs the power of its whole input
+        sweeps: list[list] = [[]]
+        for st in stages:
+            if isinstance(st, SNRNoise) and sweeps[-1]:
+                sweeps.append([])
+            sweeps[-1].append(st)
+
+        chunked = self.chunk_size is not None
+        owned = False           # buf is our own output array (may be overwritten)
+        power = None
+        for i, sweep in enumerate(sweeps):
+            if isinstance(sweep[0], SNRNoise) and power is None:
+                power = self._power(buf, chunked)
+
+            sigmas = [
+                np.sqrt(power / st.snr_linear / 2.0) if isinstance(st, SNRNoise)
+                else st.sigma if isinstance(st, Noise) else None
+                for st in sweep
+            ]
+            dtype = _out_dtype(sweep, buf.dtype)
+            out = buf if (owned and buf.dtype == dtype) else np.empty(n, dtype=dtype)
+            need_power = i + 1 < len(sweeps)
+
+            if chunked:
+                # one key per noise stage and call, one substream per chunk
+                keys = [st.rng.integers(2 ** 63) if sg is not None else None for st, sg in zip(sweep, sigmas)]
+                bounds = [(lo, min(lo + self.chunk_size, n)) for lo in range(0, n, self.chunk_size)]
+
+                def run_chunk(c: int) -> float:
+                    lo, hi = bounds[c]
+                    noises = [
+                        None if k is None else _NoiseDraw(
+                            np.random.Generator(np.random.PCG64(np.random.SeedSequence(k, spawn_key=(c,)))),
+                            sg, hi - lo, offset=lo,
+                        )
+                        for k, sg in zip(keys, sigmas)
+                    ]
+                    return self._sweep(buf, out, sweep, noises, lo, hi, need_power)
+
+                acc = sum(self._map(run_chunk, range(len(bounds))))
+            else:
+                noises = [None if sg is None else _NoiseDraw(st.rng, sg, n) for st, sg in zip(sweep, sigmas)]
+                acc = self._sweep(buf, out, sweep, noises, 0, n, need_power)
+
+            buf, owned = out, True
+            power = acc / n if (need_power and n) else None
+
+        return s.copy_with(x=buf.reshape(x.shape))
+
+    def _sweep(self, buf, out, sweep, noises, lo0: int, hi0: int, need_power: bool) -> float:
+        # apply all stages of one sweep to buf[lo0:hi0] tile by tile
+        acc = 0.0
+        for lo in range(lo0, hi0, self.tile_size):
+            hi = min(lo + self.tile_size, hi0)
+            t = buf[lo:hi]
+            for st, nz in zip(sweep, noises):
+                t = _apply(st, t, nz, lo, hi)
+            out[lo:hi] = t
+            if need_power:
+                acc += float(np.vdot(t, t).real)
+        return acc
+
+    def _map(self, fn, items) -> list:
+        # results in item order, so sums do not depend on the thread count
+        if self.n_threads == 1:
+            return [fn(i) for i in items]
+        with ThreadPoolExecutor(max_workers=self.n_threads) as pool:
+            return list(pool.map(fn, items))
+
+    def _power(self, buf: np.ndarray, chunked: bool) -> float:
+        n = buf.size
+        if n == 0:
+            return 0.0
+        if not chunked:
+            return float(np.mean(np.abs(buf) ** 2))
+
+        def part(lo: int) -> float:
+            t = buf[lo:lo + self.chunk_size]
+            return float(np.vdot(t, t).real)
+
+        return sum(self._map(part, range(0, n, self.chunk_size))) / n
+
+
+def _check_threading(tile_size: int, n_threads: int, chunk_size: Optional[int]) -> None:
+    if tile_size < 1 or (chunk_size is not None and chunk_size < 1):
+        raise ValueError("tile_size and chunk_size must be >= 1")
+    if n_threads < 1:
+        raise ValueError("n_threads must be >= 1")
+    if n_threads > 1 and chunk_size is None:
+        raise ValueError(
+            "n_threads > 1 needs a chunk_size (e.g. DEFAULT_CHUNK_SIZE): the chunks "
+            "fix the RNG substreams, so results do not depend on the thread count"
+        )
+
+
+def fuse_blocks(
+    blocks: List[Block],
+    *,
+    keep: Optional[set] = None,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    n_threads: int = 1,
+    chunk_size: Optional[int] = None,
+) -> List[Block]:
+    """
+    Replace every run of two or more consecutive enabled, fusable blocks
+    (Block.supports_fusion()) by a FusedBlock named 'a+b+c'.
+    With a chunk_size single fusable blocks are wrapped as well (keeping
+    their name) so they run chunked, on n_threads threads.
+    Blocks named in `keep` (e.g. tap points) are left standalone.
+    """
+    _check_threading(tile_size, n_threads, chunk_size)
+    keep = keep or set()
+    out: List[Block] = []
+    run: List[Block] = []
+    min_run = 1 if chunk_size is not None else 2
+
+    def flush():
+        if len(run) >= min_run:
+            out.append(FusedBlock("+".join(b.name for b in run), list(run), tile_size, n_threads, chunk_size))
+        else:
+            out.extend(run)
+        run.clear()
+
+    for b in blocks:
+        if b.enabled and b.name not in keep and b.supports_fusion():
+            run.append(b)
+        else:
+            flush()
+            out.append(b)
+    flush()
+    return out
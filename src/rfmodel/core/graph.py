@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from rfmodel.core.block import Block
+from rfmodel.core.signal import Signal
+from rfmodel.core.taps import Taps, TapSet
+
+
+class CombinerBlock(Block):
+    """
+    Block with several inputs (fan-in node of a GraphPipeline).
+
+    combine() receives the input Signals in edge order. process() on a
+    single Signal is combine([s]).
+    """
+
+    def combine(self, inputs: Sequence[Signal]) -> Signal:
+        raise NotImplementedError
+
+    def process(self, s: Signal) -> Signal:
+        return self.combine([s])
+
+
+@dataclass
+class GraphPipeline:
+    """
+    Directed acyclic graph of blocks.
+
+    Nodes are blocks (names are unique); an edge (a, b) feeds the output of a
+    into b. A node without inputs is a source and receives the run() input;
+    nodes with several inputs must be CombinerBlocks, which get their inputs
+    in the order the edges were added. Nodes without outputs are sinks.
+
+    Fan-out hands the same Signal object to every consumer, so upstream
+    results are shared, not copied (blocks never modify their input in
+    place). Intermediate results are dropped as soon as all consumers have
+    run, unless they are tapped.
+    """
+    nodes: Dict[str, Block] = field(default_factory=dict)
+    edges: List[tuple[str, str]] = field(default_factory=list)
+
+    def add(self, block: Block, *, inputs: Sequence[str] = ()) -> None:
+        if block.name in self.nodes:
+            raise ValueError(f"Node '{block.name}' already exists.")
+        self.nodes[block.name] = block
+        for src in inputs:
+            self.connect(src, block.name)
+
+    def connect(self, src: str, dst: str) -> None:
+        for n in (src, dst):
+            if n not in self.nodes:
+                raise KeyError(f"Node '{n}' not found in graph.")
+        self.edges.append((src, dst))
+        try:
+            self.topological_order()
+        except ValueError:
+            self.edges.pop()
+            raise
+
+    def get(self, name: str) -> Block:
+        return self.nodes[name]
+
+    def enable(self, name: str, enabled: bool = True) -> None:
+        self.nodes[name].enabled = enabled
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        for b in self.nodes.values():
+            b.reset(seed=seed)
+
+    def inputs_of(self, name: str) -> List[str]:
+        return [a for a, b in self.edges if b == name]
+
+    def outputs_of(self, name: str) -> List[str]:
+        return [b for a, b in self.edges if a == name]
+
+    @property
+    def sources(self) -> List[str]:
+        return [n for n in self.nodes if not self.inputs_of(n)]
+
+    @property
+    def sinks(self) -> List[str]:
+        return [n for n in self.nodes if not self.outputs_of(n)]
+
+    def topological_order(self) -> List[str]:
+        indeg = {n: len(self.inputs_of(n)) for n in self.nodes}
+        ready = [n for n in self.nodes if indeg[n] == 0]
+        order: List[str] = []
+        while ready:
+            n = ready.pop(0)
+            order.append(n)
+            for m in self.outputs_of(n):
+                indeg[m] -= 1
+                if indeg[m] == 0:
+                    ready.append(m)
+        if len(order) != len(self.nodes):
+            raise ValueError("Graph contains a cycle.")
+        return order
+
+    def _evaluate(self, name: str, inputs: List[Signal]) -> Signal:
+        b = self.nodes[name]
+        if len(inputs) > 1:
+            if not isinstance(b, CombinerBlock):
+                raise TypeError(f"Node '{name}' has {len(inputs)} inputs but is not a CombinerBlock.")
+            return b.combine(inputs) if b.enabled else inputs[0]
+        return b(inputs[0])
+
+    def run(
+        self,
+        s: Signal | Mapping[str, Signal],
+        *,
+        taps: Taps = None,
+        n_threads: Optional[int] = None,
+    ) -> tuple[Dict[str, Signal], Dict[str, Signal]]:
+        """
+        Run the graph once.
+
+        s is either one Signal fed to every source node, or a mapping
+        source name -> Signal. Nodes whose inputs are ready run concurrently
+        on a thread pool of n_threads workers (None: one per node,
+        1: serial in topological order); results do not depend on it.
+
+        Returns:
+          (sink_outputs, tapped_signals), both keyed by node name
+        """
+        taps_set = TapSet(taps)
+        unknown = taps_set.unknown(self.nodes)
+        if unknown:
+            raise KeyError(f"Tap(s) {sorted(unknown)} not found in graph.")
+
+        order = self.topological_order()
+        if isinstance(s, Signal):
+            feeds = {n: s for n in self.sources}
+        else:
+            feeds = dict(s)
+            missing = set(self.sources) - set(feeds)
+            if missing:
+                raise KeyError(f"No input signal for source node(s) {sorted(missing)}.")
+
+        sinks = set(self.sinks)
+        results: Dict[str, Signal] = {}
+        pending = {n: len(self.inputs_of(n)) for n in self.nodes}
+        consumers_left = {n: len(self.outputs_of(n)) for n in self.nodes}
+        captured: Dict[str, Signal] = {}
+
+        def node_inputs(n: str) -> List[Signal]:
+            ins = self.inputs_of(n)
+            return [feeds[n]] if not ins else [results[a] for a in ins]
+
+        def finish(n: str, out: Signal) -> List[str]:
+            results[n] = out
+            if n in taps_set:
+                taps_set.capture(n, out, captured)
+            ready = []
+            for a in self.inputs_of(n):
+                consumers_left[a] -= 1
+                if consumers_left[a] == 0 and a not in sinks:
+                    del results[a]         # no one needs it any more
+            for m in self.outputs_of(n):
+                pending[m] -= 1
+                if pending[m] == 0:
+                    ready.append(m)
+            return ready
+
+        if n_threads == 1:
+            for n in order:
+                finish(n, self._evaluate(n, node_inputs(n)))
+        else:
+            workers = n_threads or max(1, len(self.nodes))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                running = {pool.submit(self._evaluate, n, node_inputs(n)): n for n in order if pending[n] == 0}
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        n = running.pop(fut)
+                        for m in finish(n, fut.result()):
+                            running[pool.submit(self._evaluate, m, node_inputs(m))] = m
+
+        return {n: results[n] for n in self.sinks}, captured
+
+
+"""
+========================
+GraphPipeline usage
+========================
+
+    g = GraphPipeline()
+    g.add(pa)                                   # source: gets the run() input
+    g.add(pl_a, inputs=["PA"])                  # fan-out: two receive chains
+    g.add(pl_b, inputs=["PA"])
+    g.add(lna_a, inputs=["PL_A"])
+    g.add(lna_b, inputs=["PL_B"])
+
+    outs, taps = g.run(sig, taps=["PA"])        # outs["LNA_A"], outs["LNA_B"]
+
+Fan-in (several transmitters into one receiver):
+
+    g.add(SumBlock("SUM"), inputs=["CH_1", "CH_2"])
+
+From YAML (pipeline_from_config):
+
+    graph:
+      nodes:
+        - {type: pa, name: PA, params: {...}}
+        - {type: pathloss, name: PL_A, params: {...}}
+        - {type: pathloss, name: PL_B, params: {...}}
+      edges:
+        - [PA, PL_A]
+        - [PA, PL_B]
+"""
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+from typing import Callable, Dict, Iterable, Optional
+import numpy as np
+
+
+# name -> backend -> implementation
+KERNELS: Dict[str, Dict[str, Callable]] = {}
+
+BACKENDS = ("auto", "numpy", "numba")
+
+# Backend used when a kernel has no explicit choice: 'auto' prefers numba when
+# it is installed. RFMODEL_KERNELS=numpy forces the reference implementations.
+_default_backend = os.environ.get("RFMODEL_KERNELS", "auto")
+_backend_for: Dict[str, str] = {}
+
+
+def register_kernel(name: str, backend: str = "numpy"):
+    """
+    Decorator that registers an implementation of kernel `name`.
+
+    Every kernel must have a 'numpy' implementation; the others are optional
+    accelerated versions with the same signature and results.
+    """
+    if backend not in BACKENDS[1:]:
+        raise ValueError(f"Unknown backend '{backend}'. Available: {list(BACKENDS[1:])}")
+
+    def deco(fn: Callable) -> Callable:
+        KERNELS.setdefault(name, {})[backend] = fn
+        return fn
+    return deco
+
+
+def set_kernel_backend(backend: str, names: Optional[Iterable[str]] = None) -> None:
+    """
+    Choose the backend ('auto', 'numpy' or 'numba') for the given kernels,
+    or the default for all kernels when names is None.
+    """
+    global _default_backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Available: {list(BACKENDS)}")
+    if names is None:
+        _default_backend = backend
+        _backend_for.clear()
+        return
+    for n in names:
+        if n not in KERNELS:
+            raise KeyError(f"Unknown kernel '{n}'. Available: {sorted(KERNELS)}")
+        _backend_for[n] = backend
+
+
+def available_backends(name: str) -> list[str]:
+    return sorted(KERNELS[name])
+
+
+def get_kernel(name: str, backend: Optional[str] = None) -> Callable:
+    """
+    Implementation of kernel `name` for the requested (or configured) backend.
+    A backend that is not available falls back to the NumPy implementation.
+    """
+    impls = KERNELS[name]
+    b = backend or _backend_for.get(name, _default_backend)
+    if b == "auto":
+        b = "numba" if "numba" in impls else "numpy"
+    return impls.get(b, impls["numpy"])
+
+
+# ---------------------------------------------------------------------------
+# NumPy reference implementations
+# ---------------------------------------------------------------------------
+
+@register_kernel("rapp_amam")
+def rapp_amam(x: np.ndarray, g: float, asat: float, p: float, out: complex = 1.0) -> np.ndarray:
+    """
+    Rapp AM-AM soft limiter:
+
+        y = out * r_out(|x|) / |x| * x,   r_out = g r / (1 + (g r / Asat)^(2p))^(1/2p)
+    """
+    r = np.abs(x)
+    r_lin = g * r
+    r_out = r_lin / (1.0 + (r_lin / asat) ** (2.0 * p)) ** (1.0 / (2.0 * p))
+
+    gain_amp = np.zeros_like(r_out)
+    nz = r > 0
+    gain_amp[nz] = r_out[nz] / r[nz]
+    if out != 1.0:
+        gain_amp = out * gain_amp
+    return gain_amp * x
+
+
+@register_kernel("cubic")
+def cubic(x: np.ndarray, a: complex, b: complex) -> np.ndarray:
+    """Memoryless third-order nonlinearity y = a*x - b*|x|^2*x."""
+    return a * x - b * (np.abs(x) ** 2) * x
+
+
+@register_kernel("prbs_lfsr")
+def prbs_lfsr(seed: int, order: int, t1: int, t2: int, n_bits: int, dtype=np.uint8) -> np.ndarray:
+    """Fibonacci LFSR with feedback taps t1, t2; output bit = MSB of the state."""
+    state = seed
+    mask = (1 << order) - 1
+    y = np.empty(n_bits, dtype=dtype)
+
+    for i in range(n_bits):
+        # Output bit = MSB of current state
+        y[i] = (state >> (order - 1)) & 1
+
+        # Feedback from polynomial taps
+        b1 = (state >> (t1 - 1)) & 1
+        b2 = (state >> (t2 - 1)) & 1
+        feedback = b1 ^ b2
+
+        # Shift left, insert feedback into LSB
+        state = ((state << 1) & mask) | feedback
+
+    return y
+
+
+@register_kernel("qam_demap")
+def qam_demap(rx: np.ndarray, scale: float, sqrt_M: int, k_axis: int, gray: bool) -> np.ndarray:
+    """
+    Hard-decision square-QAM slicer: scale rx to odd PAM levels, slice each
+    axis to the nearest index, optionally Gray-code it and unpack
+    [I-bits | Q-bits] (MSB first) per symbol.
+    """
+    rx = rx * scale
+
+    def slice_axis(a: np.ndarray) -> np.ndarray:
+        idx = np.round((a + (sqrt_M - 1)) / 2).astype(np.int64)
+        return np.clip(idx, 0, sqrt_M - 1).astype(np.uint32)
+
+    i_idx = slice_axis(rx.real)
+    q_idx = slice_axis(rx.imag)
+
+    if gray:
+        i_idx = i_idx ^ (i_idx >> 1)
+        q_idx = q_idx ^ (q_idx >> 1)
+
+    # Unpack each index into k_axis bits (MSB first)
+    shifts = np.arange(k_axis - 1, -1, -1)
+    i_bits = ((i_idx[:, None] >> shifts) & 1).astype(np.uint8)
+    q_bits = ((q_idx[:, None] >> shifts) & 1).astype(np.uint8)
+
+    return np.concatenate([i_bits, q_bits], axis=1).ravel()
+
+
+try:
+    from rfmodel.core import _numba_kernels  # noqa: F401  (registers the 'numba' backend)
+except ImportError:
+    pass
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
 from rfmodel.core.block import Block
+from rfmodel.core.executor import PipelinedExecutor
+from rfmodel.core.fusion import DEFAULT_TILE_SIZE, fuse_blocks
 from rfmodel.core.signal import Signal
+from rfmodel.core.taps import Taps, TapSet
 
 
 @dataclass
@@ -48,23 +51,163 @@ class Pipeline:
         for b in self.blocks:
             b.reset(seed=seed)
 
-    def run(self, s: Signal, *, taps: Optional[Sequence[str]] = None) -> tuple[Signal, Dict[str, Signal]]:
+    def run(self, s: Signal, *, taps: Taps = None) -> tuple[Signal, Dict[str, Signal]]:
         """
         Run the pipeline. Optionally capture intermediate signals at named blocks.
 
+        taps is a list of block names, or a mapping block name -> TapSink to
+        spill / decimate / reduce the tapped signal instead of keeping it
+        (see rfmodel.core.taps). Sink taps are not in the returned dict.
+
         Returns:
           (final_signal, tapped_signals)
         """
-        taps_set = set(taps) if taps else set()
+        taps_set = TapSet(taps)
         captured: Dict[str, Signal] = {}
 
         cur = s
         for b in self.blocks:
             cur = b(cur)
             if b.name in taps_set:
-                captured[b.name] = cur
+                taps_set.capture(b.name, cur, captured)
         return cur, captured
 
+    def compile(
+        self,
+        *,
+        keep: Taps = None,
+        tile_size: int = DEFAULT_TILE_SIZE,
+        n_threads: int = 1,
+        chunk_size: Optional[int] = None,
+    ) -> "Pipeline":
+        """
+        Return a new Pipeline in which every run of consecutive memoryless
+        blocks (PA, path loss, AWGN, LNA, mixer without PLL) is fused into one
+        FusedBlock that processes tile_size-sample tiles with constant gains
+        folded into neighbouring stages. Outputs match the unfused pipeline
+        (same RNG streams) up to floating-point rounding.
+
+        The compiled pipeline shares the block objects (and their RNG state)
+        with this one. Enabled flags are read at compile time, so recompile
+        after toggling blocks. Blocks named in `keep` stay standalone, e.g. to
+        tap them.
+
+        chunk_size runs the fused kernels (and single memoryless blocks) in
+        chunks of chunk_size samples, e.g. DEFAULT_CHUNK_SIZE, on a pool of
+        n_threads threads, with one RNG substream per chunk: results do not
+        depend on n_threads (1 included) but the noise realization differs
+        from the serial pipeline. n_threads > 1 requires a chunk_size.
+        """
+        return Pipeline(fuse_blocks(
+            self.blocks, keep=set(keep or ()), tile_size=tile_size,
+            n_threads=n_threads, chunk_size=chunk_size,
+        ))
+
+    def run_ofdm(
+        self,
+        s: Signal,
+        ofdm,
+        *,
+        taps: Taps = None,
+    ) -> tuple[Signal, Dict[str, Signal]]:
+        """
+        Run QAM symbols through ofdm.process -> blocks -> ofdm.demodulate,
+        skipping the IFFT/FFT round trip wherever possible.
+
+        Blocks that report supports_freq_domain() (path loss, AWGN, short
+        static FIR / fading channels) are evaluated directly on the active
+        subcarriers. The first block that is not (nonlinear, phase noise)
+        forces modulation to the time domain; once every remaining block is
+        frequency-domain capable again, the signal is demodulated early and
+        the rest of the chain runs on subcarriers as well.
+
+        AWGN is drawn per subcarrier at the variance the time-domain noise
+        would have after demodulation, so results agree statistically (not
+        sample by sample) with run() + demodulate().
+
+        Tapped blocks evaluated on subcarriers are modulated to the time
+        domain for the tap, so taps keep their usual meaning.
+
+        Returns:
+          (demodulated_symbols, tapped_signals)
+        """
+        taps_set = TapSet(taps)
+        captured: Dict[str, Signal] = {}
+        grid = ofdm.subcarrier_grid(s.fs_hz)
+        active = [b for b in self.blocks if b.enabled]
+
+        def to_time(X):
+            return ofdm.modulate_grid(s, X)
+
+        X = ofdm.symbol_grid(s.x)
+        cur: Optional[Signal] = None          # time-domain signal, None while on subcarriers
+        for i, b in enumerate(active):
+            if cur is not None and all(r.supports_freq_domain(grid) for r in active[i:]):
+                X = ofdm.demodulate_grid(cur)
+                cur = None
+
+            if cur is None and b.supports_freq_domain(grid):
+                X = b.process_freq(X, grid)
+            else:
+                if cur is None:
+                    cur = to_time(X)
+                cur = b(cur)
+
+            if b.name in taps_set:
+                taps_set.capture(b.name, cur if cur is not None else to_time(X), captured)
+
+        if cur is not None:
+            return ofdm.demodulate(cur), captured
+
+        return s.copy_with(x=ofdm.data_symbols(X), meta=ofdm.modulation_meta(s.meta)), captured
+
+    def run_stream(
+        self,
+        chunks: Iterable[Signal],
+        *,
+        taps: Taps = None,
+    ) -> Iterator[tuple[Signal, Dict[str, Signal]]]:
+        """
+        Run consecutive chunks of one long signal through the pipeline.
+
+        Blocks with memory (filters, memory PA models) keep their state between
+        chunks, so the concatenated outputs match a single run() on the whole
+        signal. Call reset() before starting a new, unrelated stream.
+
+        Every chunk but the last is marked with meta["stream_end"] = False so
+        blocks with lookahead (resamplers) hold back their tail until the end.
+        Output chunks may therefore differ in length from the input chunks.
+
+        Yields:
+          (output_chunk, tapped_chunks) for every input chunk
+        """
+        it = iter(chunks)
+        nxt = next(it, None)
+        while nxt is not None:
+            cur, nxt = nxt, next(it, None)
+            meta = dict(cur.meta) if cur.meta is not None else {}
+            meta["stream_end"] = nxt is None
+            yield self.run(cur.copy_with(meta=meta), taps=taps)
+
+    def run_pipelined(
+        self,
+        chunks: Iterable[Signal],
+        *,
+        taps: Taps = None,
+        stages: Optional[Sequence[Sequence[str]]] = None,
+        queue_size: int = 2,
+    ) -> Iterator[tuple[Signal, Dict[str, Signal]]]:
+        """
+        run_stream() with every stage in its own worker thread, connected by
+        bounded queues, so different blocks work on different chunks at the
+        same time. Outputs and their order are identical to run_stream().
+
+        stages optionally groups block names into stages (default: one stage
+        per block). Use PipelinedExecutor directly to read per-stage stats.
+        """
+        ex = PipelinedExecutor(self.blocks, stages=stages, queue_size=queue_size)
+        return ex.run(chunks, taps=taps)
+
     def _index_of(self, name: str) -> int:
         for i, b in enumerate(self.blocks):
             if b.name == name:
@@ -210,6 +353,16 @@ Notes:
     taps may be affected by later processing.
 
 
+Streaming
+---------
+Long signals can be processed in chunks. Blocks with memory carry their state
+from one chunk to the next:
+
+    pipe.reset(seed=0)
+    outputs = [out.x for out, _ in pipe.run_stream(s_in.chunks(65536))]
+    y = np.concatenate(outputs)
+
+
 Common patterns
 ---------------
 A) Debugging: capture signals to inspect power/spectrum between blocks:
@@ -2,13 +2,32 @@ from __future__ import annotations
 
 from rfmodel.core.factory import build_block
 from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.graph import GraphPipeline
 
-def pipeline_from_config(cfg: dict) -> Pipeline:
+def pipeline_from_config(cfg: dict) -> Pipeline | GraphPipeline:
+    """
+    Build a linear Pipeline from a top-level 'pipeline' list, or a
+    GraphPipeline from a top-level 'graph' section with 'nodes' (block
+    configs) and 'edges' ([src, dst] pairs, in combiner input order).
+    """
+    if "graph" in cfg:
+        return graph_from_config(cfg["graph"])
     if "pipeline" not in cfg:
-        raise KeyError("Config missing top-level key: 'pipeline'")
+        raise KeyError("Config missing top-level key: 'pipeline' (or 'graph')")
     pipe = Pipeline()
     for block_cfg in cfg["pipeline"]:
         pipe.add(build_block(block_cfg))
     return pipe
 
 
+def graph_from_config(gcfg: dict) -> GraphPipeline:
+    if "nodes" not in gcfg:
+        raise KeyError("Graph config missing key: 'nodes'")
+    g = GraphPipeline()
+    for block_cfg in gcfg["nodes"]:
+        g.add(build_block(block_cfg))
+    for edge in gcfg.get("edges", []):
+        if len(edge) != 2:
+            raise ValueError(f"Edge must be [src, dst], got {edge}")
+        g.connect(str(edge[0]), str(edge[1]))
+    return g
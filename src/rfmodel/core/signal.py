@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field, replace
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 import numpy as np
 
 @dataclass(frozen=True)
 class Signal:
     """
     Container for a complex baseband discrete-time signal plus metadata
+
+    x is normally 1D. Batched runs (e.g. many trials at once) use a 2D array
+    of shape (n_trials, n_samples): time is always the last axis.
     """
 
     x: np.ndarray       # Stores complex samples
@@ -26,8 +29,39 @@ class Signal:
     
     @property
     def n_samples(self) -> int:
-        return int(self.x.shape[0])
+        return int(self.x.shape[-1])
     
+    @property
+    def is_stream_end(self) -> bool:
+        """
+        False for every chunk of a stream except the last one (set by
+        Pipeline.run_stream). A plain signal is a complete stream of its own,
+        so blocks that need lookahead (e.g. delay-compensated resamplers)
+        flush their tail when this is True.
+        """
+        return bool(self.meta.get("stream_end", True))
+
+    def chunks(self, size: int) -> Iterator["Signal"]:
+        """
+        Split into consecutive chunks of `size` samples (last one may be shorter),
+        e.g. as input to Pipeline.run_stream.
+        """
+        if size <= 0:
+            raise ValueError("size must be > 0")
+        for i in range(0, self.x.shape[-1], size):
+            yield self.copy_with(x=self.x[..., i:i + size])
+
+    @classmethod
+    def from_file(cls, path: str, start: int = 0, stop: Optional[int] = None) -> "Signal":
+        """
+        Samples [start, stop) of a SigMF recording ('<path>.sigmf-meta' /
+        '<path>.sigmf-data'). cf32 data is memory-mapped, not read: x is a
+        view of the file. See rfmodel.core.signal_io.
+        """
+        from rfmodel.core.signal_io import SignalFile
+
+        return SignalFile.open(path).read(start, stop)
+
     def ensure_complex(self) -> "Signal":
         if not np.iscomplexobj(self.x):
             return self.copy_with(x=self.x.astype(np.complex128))
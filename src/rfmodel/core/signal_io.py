@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+import numpy as np
+
+from rfmodel.core.signal import Signal
+
+
+# SigMF datatypes supported for raw IQ files (little endian)
+DATATYPES = {
+    "cf32_le": np.dtype("<c8"),
+    "cf64_le": np.dtype("<c16"),
+    "ci16_le": np.dtype("<i2"),      # interleaved I/Q int16, scaled by 'rfmodel:scale'
+}
+
+SIGMF_VERSION = "1.0.0"
+
+
+def _paths(path: str | Path) -> tuple[Path, Path]:
+    # 'cap', 'cap.sigmf-data' and 'cap.sigmf-meta' all name the same recording
+    p = Path(path)
+    if p.suffix in (".sigmf-data", ".sigmf-meta"):
+        p = p.with_suffix("")
+    return p.with_name(p.name + ".sigmf-data"), p.with_name(p.name + ".sigmf-meta")
+
+
+def _json_default(v: Any) -> Any:
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, np.ndarray):
+        return v.tolist()
+    return str(v)
+
+
+class SignalFile:
+    """
+    Recorded IQ samples in a raw file, memory-mapped.
+
+    Nothing is read until samples are requested: read() / chunks() return
+    Signals over ranges of the file. For cf32 / cf64 files Signal.x is a
+    view of the memmap (zero copy; slicing it is zero copy too), so a
+    multi-gigabyte capture can be streamed through Pipeline.run_stream()
+    one chunk at a time. ci16 files are converted chunk by chunk.
+
+    Use open() for SigMF recordings ('<base>.sigmf-meta' + '<base>.sigmf-data')
+    or raw() for headerless files.
+    """
+
+    def __init__(
+        self,
+        data_path: str | Path,
+        *,
+        fs_hz: float,
+        fc_hz: Optional[float] = None,
+        datatype: str = "cf32_le",
+        meta: Optional[Dict[str, Any]] = None,
+        scale: float = 1.0,
+    ):
+        if datatype not in DATATYPES:
+            raise ValueError(f"Unsupported datatype '{datatype}'. Available: {list(DATATYPES)}")
+        self.data_path = Path(data_path)
+        self.fs_hz = float(fs_hz)
+        self.fc_hz = fc_hz
+        self.datatype = datatype
+        self.meta = dict(meta or {})
+        self.scale = float(scale)
+
+        dt = DATATYPES[datatype]
+        if os.path.getsize(self.data_path) == 0:
+            self._raw = np.zeros(0, dtype=dt)
+        else:
+            self._raw = np.memmap(self.data_path, dtype=dt, mode="r")
+        if datatype == "ci16_le":
+            self._raw = self._raw[: self._raw.size // 2 * 2].reshape(-1, 2)
+
+    @classmethod
+    def open(cls, path: str | Path) -> "SignalFile":
+        """Open a SigMF recording written by SignalWriter (or another SigMF tool)."""
+        data_path, meta_path = _paths(path)
+        with open(meta_path) as f:
+            doc = json.load(f)
+        g = doc.get("global", {})
+        captures = doc.get("captures") or [{}]
+        return cls(
+            data_path,
+            fs_hz=g["core:sample_rate"],
+            fc_hz=captures[0].get("core:frequency"),
+            datatype=g["core:datatype"],
+            meta=g.get("rfmodel:meta", {}),
+            scale=g.get("rfmodel:scale", 1.0),
+        )
+
+    @classmethod
+    def raw(cls, path: str | Path, *, fs_hz: float, datatype: str = "cf32_le",
+            fc_hz: Optional[float] = None, scale: float = 1.0) -> "SignalFile":
+        """Headerless IQ file; sample rate and format must be given."""
+        return cls(path, fs_hz=fs_hz, fc_hz=fc_hz, datatype=datatype, scale=scale)
+
+    @property
+    def n_samples(self) -> int:
+        return int(self._raw.shape[0])
+
+    def __len__(self) -> int:
+        return self.n_samples
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> Signal:
+        """Samples [start, stop) as a Signal (zero copy for cf32 / cf64)."""
+        raw = self._raw[start:stop]
+        if self.datatype == "ci16_le":
+            x = np.empty(raw.shape[0], dtype=np.complex64)
+            x.real = raw[:, 0]
+            x.imag = raw[:, 1]
+            x *= np.float32(self.scale / 32767.0)
+        elif self.scale != 1.0:
+            x = raw * raw.dtype.type(self.scale)
+        else:
+            x = raw
+        return Signal(x=x, fs_hz=self.fs_hz, fc_hz=self.fc_hz, meta=dict(self.meta))
+
+    def signal(self) -> Signal:
+        return self.read()
+
+    def chunks(self, size: int) -> Iterator[Signal]:
+        """Consecutive chunks of size samples, e.g. as input to Pipeline.run_stream."""
+        if size <= 0:
+            raise ValueError("size must be > 0")
+        for i in range(0, self.n_samples, size):
+            yield self.read(i, i + size)
+
+
+class SignalWriter:
+    """
+    Append Signal chunks to a SigMF recording without holding them in RAM.
+
+    Samples go straight to '<base>.sigmf-data'; '<base>.sigmf-meta' is
+    written on close() with fs_hz, fc_hz and meta of the first chunk unless
+    given. Use as a context manager:
+
+        with SignalWriter("out/rx") as w:
+            w.write_stream(pipe.run_stream(SignalFile.open("cap").chunks(1 << 20)))
+
+    Parameters
+    ----------
+    datatype :
+        'cf32_le' (default), 'cf64_le' or 'ci16_le'. For ci16, samples are
+        divided by scale (full-scale amplitude) and clipped; the reader
+        multiplies it back.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        fs_hz: Optional[float] = None,
+        fc_hz: Optional[float] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        datatype: str = "cf32_le",
+        scale: float = 1.0,
+    ):
+        if datatype not in DATATYPES:
+            raise ValueError(f"Unsupported datatype '{datatype}'. Available: {list(DATATYPES)}")
+        self.data_path, self.meta_path = _paths(path)
+        self.data_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fs_hz = fs_hz
+        self.fc_hz = fc_hz
+        self.meta = meta
+        self.datatype = datatype
+        self.scale = float(scale)
+        self.n_samples = 0
+        self._f = open(self.data_path, "wb")
+
+    def __enter__(self) -> "SignalWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._f.closed
+
+    def write(self, s: Signal) -> None:
+        x = np.asarray(s.x)
+        if x.ndim != 1:
+            raise ValueError("SignalWriter only stores 1-D signals")
+        if self.fs_hz is None:
+            self.fs_hz = s.fs_hz
+        elif s.fs_hz != self.fs_hz:
+            raise ValueError(f"Chunk sample rate {s.fs_hz} differs from the recording's {self.fs_hz}")
+        if self.fc_hz is None:
+            self.fc_hz = s.fc_hz
+        if self.meta is None:
+            self.meta = {k: v for k, v in s.meta.items() if k != "stream_end"}
+
+        if self.datatype == "ci16_le":
+            iq = np.empty((x.size, 2), dtype=np.float32)
+            iq[:, 0] = x.real
+            iq[:, 1] = x.imag
+            iq *= 32767.0 / self.scale
+            out = np.clip(np.rint(iq), -32768, 32767).astype(DATATYPES["ci16_le"])
+        else:
+            out = x / self.scale if self.scale != 1.0 else x
+            out = out.astype(DATATYPES[self.datatype], copy=False)
+        self._f.write(np.ascontiguousarray(out).tobytes())
+        self.n_samples += x.size
+
+    def write_stream(
+        self,
+        stream: Iterable[Signal | tuple[Signal, Mapping[str, Signal]]],
+        *,
+        taps: Optional[Mapping[str, "SignalWriter"]] = None,
+    ) -> int:
+        """
+        Write every chunk of stream: Signals, or the (output, tapped) pairs
+        yielded by Pipeline.run_stream() / run_pipelined(). Tapped chunks go
+        to the writer of the same name in taps. Returns the samples written.
+        """
+        for item in stream:
+            if isinstance(item, Signal):
+                self.write(item)
+                continue
+            out, captured = item
+            self.write(out)
+            for name, w in (taps or {}).items():
+                if name in captured:
+                    w.write(captured[name])
+        return self.n_samples
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        self._f.close()
+        g = {
+            "core:datatype": self.datatype,
+            "core:sample_rate": self.fs_hz,
+            "core:version": SIGMF_VERSION,
+            "core:num_channels": 1,
+            "rfmodel:meta": self.meta or {},
+        }
+        if self.scale != 1.0:
+            g["rfmodel:scale"] = self.scale
+        capture = {"core:sample_start": 0}
+        if self.fc_hz is not None:
+            capture["core:frequency"] = self.fc_hz
+        doc = {"global": g, "captures": [capture], "annotations": []}
+        with open(self.meta_path, "w") as f:
+            json.dump(doc, f, indent=2, default=_json_default)
+
+
+def save_signal(path: str | Path, s: Signal, **kwargs: Any) -> None:
+    """Write one Signal as a SigMF recording (kwargs as for SignalWriter)."""
+    with SignalWriter(path, fs_hz=s.fs_hz, fc_hz=s.fc_hz, meta=dict(s.meta), **kwargs) as w:
+        w.write(s)
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Sequence
+import numpy as np
+
+from rfmodel.core.signal import Signal
+
+
+class TapSink:
+    """
+    Destination for the output of a tapped block.
+
+    Pass {block_name: sink} as taps= to Pipeline.run() / run_stream() /
+    run_pipelined() / run_ofdm() or GraphPipeline.run(): update() is called
+    with the block output of every run (every chunk when streaming) instead
+    of the Signal being kept in the returned dict. result() gives what the
+    sink has accumulated so far.
+    """
+
+    def update(self, s: Signal) -> None:
+        raise NotImplementedError
+
+    def result(self):
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        pass
+
+
+def _pack(x: np.ndarray, dtype: Optional[str]):
+    if dtype is None:
+        return np.array(x)
+    if dtype == "complex64":
+        return np.asarray(x, dtype=np.complex64).copy()
+    if dtype == "float16":
+        # half precision has no complex type (I and Q on a trailing axis) and
+        # little range: store x / max|x| with the scale kept in float64
+        x = np.asarray(x)
+        scale = float(np.max(np.abs(x))) if x.size else 0.0
+        y = x / scale if scale > 0 else x
+        if np.iscomplexobj(x):
+            y = np.stack([y.real, y.imag], axis=-1)
+        return scale, y.astype(np.float16)
+    raise ValueError(f"Unsupported tap dtype '{dtype}' (use None, 'complex64' or 'float16')")
+
+
+def _unpack(parts: list, dtype: Optional[str], is_complex: bool) -> np.ndarray:
+    if dtype == "float16":
+        out = []
+        for scale, p in parts:
+            p = p.astype(np.float32)
+            if is_complex:
+                p = p[..., 0] + 1j * p[..., 1]
+            out.append(p * np.float32(scale or 1.0))
+        parts = out
+    if not parts:
+        return np.zeros(0, dtype=np.complex64)
+    return np.concatenate(parts, axis=-1)
+
+
+class KeepTap(TapSink):
+    """
+    Keep the full tapped signal (chunks concatenated), optionally stored as
+    'complex64' (half the memory of complex128) or 'float16' (a quarter;
+    about 3 significant digits relative to the chunk peak, for plots and
+    rough checks).
+    """
+
+    def __init__(self, dtype: Optional[str] = None):
+        _pack(np.zeros(0), dtype)           # validate
+        self.dtype = dtype
+        self.reset()
+
+    def reset(self) -> None:
+        self._parts: list = []
+        self._first: Optional[Signal] = None
+        self._complex = True
+
+    def _remember(self, s: Signal) -> None:
+        # fs / fc / meta of the first chunk, to rebuild the Signal in result()
+        if self._first is None:
+            self._first = s.copy_with(x=np.zeros(0), meta={k: v for k, v in s.meta.items() if k != "stream_end"})
+            self._complex = np.iscomplexobj(s.x)
+
+    def update(self, s: Signal) -> None:
+        self._remember(s)
+        self._parts.append(_pack(s.x, self.dtype))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(p[1].nbytes if isinstance(p, tuple) else p.nbytes for p in self._parts)
+
+    def result(self) -> Optional[Signal]:
+        if self._first is None:
+            return None
+        return self._first.copy_with(x=_unpack(self._parts, self.dtype, self._complex))
+
+
+class SliceTap(KeepTap):
+    """
+    Keep only samples start, start + step, ... < stop of the whole stream
+    (sample indices count across chunks): a time window and/or a plain
+    decimation (no anti-alias filter; for inspection, not processing).
+    result() has fs_hz / step and meta['tap_slice'] = (start, stop, step).
+    """
+
+    def __init__(self, start: int = 0, stop: Optional[int] = None, step: int = 1, dtype: Optional[str] = None):
+        if step < 1 or start < 0:
+            raise ValueError("SliceTap needs start >= 0 and step >= 1")
+        self.start, self.stop, self.step = int(start), stop, int(step)
+        super().__init__(dtype)
+
+    def reset(self) -> None:
+        super().reset()
+        self._offset = 0
+
+    def update(self, s: Signal) -> None:
+        self._remember(s)
+        n = s.n_samples
+        lo, hi = self._offset, self._offset + n
+        self._offset = hi
+        stop = hi if self.stop is None else min(self.stop, hi)
+        if stop <= self.start:
+            return
+        # first index >= max(lo, start) on the start + k * step grid
+        first = max(lo, self.start)
+        first += (self.start - first) % self.step
+        if first < stop:
+            self._parts.append(_pack(s.x[..., first - lo:stop - lo:self.step], self.dtype))
+
+    def result(self) -> Optional[Signal]:
+        s = super().result()
+        if s is None:
+            return None
+        meta = dict(s.meta)
+        meta["tap_slice"] = (self.start, self.stop, self.step)
+        return s.copy_with(fs_hz=s.fs_hz / self.step, meta=meta)
+
+
+class FileTap(TapSink):
+    """
+    Spill the tapped signal to a SigMF recording as it is produced (see
+    rfmodel.core.signal_io). result() closes the file and returns the
+    recording as a memory-mapped Signal.
+    """
+
+    def __init__(self, path: str | Path, *, datatype: str = "cf32_le", scale: float = 1.0):
+        self.path = Path(path)
+        self.datatype = datatype
+        self.scale = scale
+        self._writer = None
+
+    def reset(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = None
+
+    def update(self, s: Signal) -> None:
+        from rfmodel.core.signal_io import SignalWriter
+
+        if self._writer is None:
+            self._writer = SignalWriter(self.path, datatype=self.datatype, scale=self.scale)
+        self._writer.write(s)
+
+    def result(self) -> Optional[Signal]:
+        if self._writer is None:
+            return None
+        self._writer.close()
+        return Signal.from_file(self.path)
+
+
+@dataclass(frozen=True)
+class TapStats:
+    n_samples: int
+    mean_power_w: float
+    peak_power_w: float
+    psd_w_hz: Optional[np.ndarray] = None      # Welch PSD, fftshifted
+    freqs_hz: Optional[np.ndarray] = None
+    n_segments: int = 0
+
+    @property
+    def papr_db(self) -> float:
+        return float(10 * np.log10(self.peak_power_w / self.mean_power_w)) if self.mean_power_w > 0 else float("nan")
+
+    @property
+    def mean_power_dbm(self) -> float:
+        return float(10 * np.log10(self.mean_power_w / 1e-3)) if self.mean_power_w > 0 else float("-inf")
+
+
+class StatsTap(TapSink):
+    """
+    Keep only online reductions of the tapped signal: sample count, mean
+    and peak power (hence PAPR) and, with nfft set, a Welch PSD averaged
+    over non-overlapping windowed segments (samples carried across chunk
+    boundaries; see rfmodel.meas.AveragedSpectrum for overlap, ACLR and
+    masks). Memory is O(nfft) whatever the run length. Batched signals are
+    reduced over all rows.
+    """
+
+    def __init__(self, nfft: Optional[int] = None, window: str = "hann"):
+        self.nfft = nfft
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        self._n = 0
+        self._energy = 0.0
+        self._peak = 0.0
+        self._spectrum = None
+
+    def update(self, s: Signal) -> None:
+        x = np.asarray(s.x)
+        p = np.abs(x) ** 2
+        self._n += x.size
+        self._energy += float(p.sum())
+        if p.size:
+            self._peak = max(self._peak, float(p.max()))
+        if self.nfft:
+            if self._spectrum is None:
+                from rfmodel.meas.spectrum_analyser import AveragedSpectrum
+
+                self._spectrum = AveragedSpectrum(self.nfft, self.window, overlap=0.0)
+            self._spectrum.update(s)
+
+    def result(self) -> TapStats:
+        mean = self._energy / self._n if self._n else 0.0
+        spec = self._spectrum.result() if self._spectrum is not None else None
+        if spec is None:
+            return TapStats(self._n, mean, self._peak)
+        return TapStats(self._n, mean, self._peak, spec.psd_w_hz, spec.freqs_hz, spec.n_segments)
+
+
+# taps= argument: block names to capture, or {name: TapSink or None}
+Taps = Optional[Sequence[str] | Mapping[str, Optional[TapSink]]]
+
+
+class TapSet:
+    """
+    Normalized taps= argument: a sequence of block names (keep the full
+    Signal in the returned dict) or a mapping name -> TapSink (None keeps
+    the Signal as well).
+    """
+
+    def __init__(self, taps: Taps):
+        self.sinks: Dict[str, TapSink] = {}
+        if isinstance(taps, Mapping):
+            self.names = set(taps)
+            self.sinks = {k: v for k, v in taps.items() if v is not None}
+        else:
+            self.names = set(taps) if taps else set()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+    def __bool__(self) -> bool:
+        return bool(self.names)
+
+    def unknown(self, names) -> set:
+        return self.names - set(names)
+
+    def capture(self, name: str, s: Signal, captured: Dict[str, Signal]) -> None:
+        sink = self.sinks.get(name)
+        if sink is None:
+            captured[name] = s
+        else:
+            sink.update(s)
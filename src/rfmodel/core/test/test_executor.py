@@ -0,0 +1,66 @@
+import time
+
+import numpy as np
+import pytest
+
+from rfmodel.core.block import Block
+from rfmodel.core.executor import PipelinedExecutor
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.signal import Signal
+from rfmodel.channel.AWGN import AWGNBlock, AWGNParams
+from rfmodel.channel.filters import FIRFilterBlock, FIRFilterParams
+from rfmodel.rf.PA import PABlock, PAParams
+
+
+class _Fail(Block):
+    def process(self, s: Signal) -> Signal:
+        raise RuntimeError("boom")
+
+
+def _chain() -> Pipeline:
+    return Pipeline([
+        PABlock("PA", PAParams(gain_db=10.0, p1db_out_dbm=0.0)),
+        FIRFilterBlock("FIR", FIRFilterParams(cutoff_hz=3e6, n_taps=33)),
+        AWGNBlock("AWGN", AWGNParams(snr_db=20.0), seed=3),
+    ])
+
+
+def _signal(n: int) -> Signal:
+    rng = np.random.default_rng(0)
+    return Signal(x=0.01 * (rng.standard_normal(n) + 1j * rng.standard_normal(n)), fs_hz=20e6)
+
+
+def test_pipelined_matches_run_stream():
+    s = _signal(40_000)
+    ref = [(o.x, t["FIR"].x) for o, t in _chain().run_stream(s.chunks(3000), taps=["FIR"])]
+
+    ex = PipelinedExecutor(_chain().blocks, stages=[["PA"], ["FIR", "AWGN"]], queue_size=1)
+    out = [(o.x, t["FIR"].x) for o, t in ex.run(s.chunks(3000), taps=["FIR"])]
+
+    assert len(out) == len(ref)
+    for (y, f), (y_ref, f_ref) in zip(out, ref):
+        assert np.array_equal(y, y_ref) and np.array_equal(f, f_ref)
+    assert [st.n_chunks for st in ex.stats] == [len(ref)] * 2
+    assert all(0.0 <= st.utilization <= 1.0 for st in ex.stats)
+
+
+def test_backpressure_bounds_chunks_in_flight():
+    pulled = []
+
+    def source():
+        for i in range(1000):
+            pulled.append(i)
+            yield Signal(x=np.zeros(16, dtype=complex), fs_hz=20e6)
+
+    pipe = _chain()
+    it = pipe.run_pipelined(source(), queue_size=1)
+    next(it)
+    time.sleep(0.2)
+    assert len(pulled) <= (len(pipe.blocks) + 1) * 2 + 2
+    it.close()                     # stops the workers
+
+
+def test_stage_errors_propagate():
+    pipe = Pipeline([PABlock("PA", PAParams(gain_db=10.0, p1db_out_dbm=0.0)), _Fail("bad")])
+    with pytest.raises(RuntimeError, match="boom"):
+        list(pipe.run_pipelined(_signal(1000).chunks(100)))
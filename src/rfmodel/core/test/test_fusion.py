@@ -0,0 +1,118 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from rfmodel.core.signal import Signal
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.fusion import FusedBlock
+from rfmodel.rf.PA import PABlock, PAParams
+from rfmodel.rf.LNA import LNABlock, LNAParams
+from rfmodel.rf.Mixer_PLL_block import MixerBlock, MixerParams
+from rfmodel.channel.path_loss import PathLossBlock, PathLossParams
+from rfmodel.channel.AWGN import AWGNBlock, AWGNParams
+from rfmodel.channel.filters import FIRFilterBlock, FIRFilterParams
+
+
+def _chain(cubic: bool = False) -> Pipeline:
+    return Pipeline([
+        PABlock("PA", PAParams(gain_db=20.0, p1db_out_dbm=10.0, enable_cubic=cubic)),
+        PathLossBlock("PL", PathLossParams(freq_hz=2.4e9, distance_m=3.0)),
+        AWGNBlock("AWGN", AWGNParams(snr_db=25.0), seed=1),
+        LNABlock("LNA", LNAParams(gain_db=15.0, nf_db=3.0, IP3_dbm=-10.0), seed=2),
+    ])
+
+
+def _signal(shape) -> Signal:
+    rng = np.random.default_rng(0)
+    x = 0.05 * (rng.standard_normal(shape) + 1j * rng.standard_normal(shape))
+    return Signal(x=x, fs_hz=20e6)
+
+
+def test_compiled_chain_matches_unfused():
+    s = _signal(200_001)
+    for cubic in (False, True):
+        ref, _ = _chain(cubic).run(s)
+        for tile in (65536, 1000):
+            pipe = _chain(cubic).compile(tile_size=tile)
+            assert len(pipe.blocks) == 1 and isinstance(pipe.blocks[0], FusedBlock)
+            y, _ = pipe.run(s)
+            assert np.allclose(y.x, ref.x, rtol=1e-10, atol=1e-15)
+
+
+
+def test_compiled_mixer_matches_unfused():
+    s = _signal(30_000)
+
+    def chain():
+        return Pipeline([
+            LNABlock("LNA", LNAParams(gain_db=15.0, nf_db=3.0, IP3_dbm=-10.0), seed=2),
+            MixerBlock("MIX", MixerParams(gain_db=6.0, iip3_dbm=5.0, nf_db=9.0), seed=3),
+        ])
+
+    ref, _ = chain().run(s)
+    pipe = chain().compile(tile_size=7000)
+    assert [b.name for b in pipe.blocks] == ["LNA+MIX"]
+    assert np.allclose(pipe.run(s)[0].x, ref.x, rtol=1e-10, atol=1e-15)
+
+def test_compiled_batched_and_repeated_calls_match():
+    s = _signal((4, 5000))
+    ref_pipe, pipe = _chain(), _chain().compile(tile_size=3000)
+    for _ in range(2):            # RNG streams advance identically
+        ref, _ = ref_pipe.run(s)
+        y, _ = pipe.run(s)
+        assert y.x.shape == (4, 5000)
+        assert np.allclose(y.x, ref.x, rtol=1e-10, atol=1e-15)
+
+
+def test_stateful_and_kept_blocks_split_runs():
+    pipe = _chain()
+    pipe.add(FIRFilterBlock("FIR", FIRFilterParams(taps=np.array([1.0, 0.5]))), after="PL")
+    names = [b.name for b in pipe.compile(keep=["LNA"]).blocks]
+    assert names == ["PA+PL", "FIR", "AWGN", "LNA"]
+
+    pipe.enable("PL", False)
+    names = [b.name for b in pipe.compile().blocks]
+    assert names == ["PA", "PL", "FIR", "AWGN+LNA"]
+
+
+def test_threaded_results_do_not_depend_on_thread_count():
+    s = _signal(50_000)
+    outs = []
+    for n_threads in (1, 2, 3, 8):
+        pipe = _chain().compile(n_threads=n_threads, chunk_size=4096, tile_size=1000)
+        outs.append(pipe.run(s)[0].x)
+    assert all(np.array_equal(o, outs[0]) for o in outs[1:])
+
+    with pytest.raises(ValueError):
+        _chain().compile(n_threads=2)
+
+
+def test_threaded_single_block_keeps_name_and_snr():
+    x = np.exp(2j * np.pi * 0.01 * np.arange(400_000))
+    pipe = Pipeline([AWGNBlock("AWGN", AWGNParams(snr_db=10.0), seed=4)]).compile(n_threads=4, chunk_size=50_000)
+    assert [b.name for b in pipe.blocks] == ["AWGN"]
+
+    y, _ = pipe.run(Signal(x=x, fs_hz=1e6))
+    snr_db = 10 * np.log10(1.0 / np.mean(np.abs(y.x - x) ** 2))
+    assert abs(snr_db - 10.0) < 0.05
+
+
+def test_threaded_numba_kernels_under_workqueue_layer():
+    # parallel numba kernels launched from several threads abort this layer
+    pytest.importorskip("numba")
+    code = (
+        "import numpy as np\n"
+        "from rfmodel.core.signal import Signal\n"
+        "from rfmodel.core.pipeline import Pipeline\n"
+        "from rfmodel.rf.PA import PABlock, PAParams\n"
+        "from rfmodel.channel.AWGN import AWGNBlock, AWGNParams\n"
+        "pipe = Pipeline([PABlock('PA', PAParams(gain_db=20.0, p1db_out_dbm=10.0)),\n"
+        "                 AWGNBlock('AWGN', AWGNParams(snr_db=25.0), seed=1)]).compile(n_threads=4, chunk_size=20_000)\n"
+        "pipe.run(Signal(x=0.05 * np.exp(0.01j * np.arange(400_000)), fs_hz=1e6))\n"
+    )
+    env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue")
+    proc = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from rfmodel.core.graph import GraphPipeline
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.pipeline_builder import pipeline_from_config
+from rfmodel.core.signal import Signal
+from rfmodel.channel.AWGN import AWGNBlock, AWGNParams
+from rfmodel.channel.combiner import SumBlock
+from rfmodel.channel.path_loss import PathLossBlock, PathLossParams
+from rfmodel.rf.PA import PABlock, PAParams
+import rfmodel.channel.registry  # noqa: F401
+import rfmodel.rf.registry  # noqa: F401
+
+
+def _signal(n: int = 4000) -> Signal:
+    rng = np.random.default_rng(0)
+    return Signal(x=0.01 * (rng.standard_normal(n) + 1j * rng.standard_normal(n)), fs_hz=20e6)
+
+
+def _pa():
+    return PABlock("PA", PAParams(gain_db=10.0, p1db_out_dbm=0.0))
+
+
+def _pl(name, d):
+    return PathLossBlock(name, PathLossParams(freq_hz=2.4e9, distance_m=d))
+
+
+def _two_receivers() -> GraphPipeline:
+    g = GraphPipeline()
+    g.add(_pa())
+    g.add(_pl("PL_A", 2.0), inputs=["PA"])
+    g.add(_pl("PL_B", 5.0), inputs=["PA"])
+    g.add(AWGNBlock("N_A", AWGNParams(snr_db=20.0), seed=1), inputs=["PL_A"])
+    g.add(AWGNBlock("N_B", AWGNParams(snr_db=20.0), seed=2), inputs=["PL_B"])
+    return g
+
+
+def test_fan_out_branches_match_linear_pipelines():
+    s = _signal()
+    ref_a, _ = Pipeline([_pa(), _pl("PL_A", 2.0), AWGNBlock("N_A", AWGNParams(snr_db=20.0), seed=1)]).run(s)
+    ref_b, _ = Pipeline([_pa(), _pl("PL_B", 5.0), AWGNBlock("N_B", AWGNParams(snr_db=20.0), seed=2)]).run(s)
+
+    for n_threads in (1, None):
+        outs, taps = _two_receivers().run(s, taps=["PA"], n_threads=n_threads)
+        assert set(outs) == {"N_A", "N_B"}
+        assert np.array_equal(outs["N_A"].x, ref_a.x)
+        assert np.array_equal(outs["N_B"].x, ref_b.x)
+        assert np.array_equal(taps["PA"].x, _pa().process(s).x)
+
+
+def test_fan_in_sum_from_yaml_dict():
+    cfg = {"graph": {
+        "nodes": [
+            {"type": "pathloss", "name": "CH_1", "params": {"freq_hz": 2.4e9, "distance_m": 1.0}},
+            {"type": "pathloss", "name": "CH_2", "params": {"freq_hz": 2.4e9, "distance_m": 4.0}},
+            {"type": "sum", "name": "RX", "params": {"gains_db": [0.0, -6.0]}},
+        ],
+        "edges": [["CH_1", "RX"], ["CH_2", "RX"]],
+    }}
+    g = pipeline_from_config(cfg)
+    assert isinstance(g, GraphPipeline) and g.sources == ["CH_1", "CH_2"]
+
+    s1, s2 = _signal(), _signal().copy_with(x=np.ones(4000, dtype=complex))
+    outs, _ = g.run({"CH_1": s1, "CH_2": s2})
+    expected = g.get("CH_1").process(s1).x + 10 ** (-6 / 20) * g.get("CH_2").process(s2).x
+    assert np.allclose(outs["RX"].x, expected)
+
+
+def test_invalid_graphs_are_rejected():
+    g = GraphPipeline()
+    g.add(_pl("A", 1.0))
+    g.add(_pl("B", 1.0), inputs=["A"])
+    with pytest.raises(ValueError):
+        g.connect("B", "A")                       # cycle
+    assert g.edges == [("A", "B")]
+
+    g.add(_pl("C", 1.0))
+    g.connect("C", "B")                           # B is not a combiner
+    with pytest.raises(TypeError):
+        g.run(_signal())
+
+    g2 = GraphPipeline()
+    g2.add(_pl("A", 1.0))
+    g2.add(SumBlock("S"), inputs=["A"])
+    with pytest.raises(KeyError):
+        g2.run(_signal(), taps=["nope"])
@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from rfmodel.core.kernels import KERNELS, available_backends, get_kernel, set_kernel_backend
+from rfmodel.comms.pseudorandom_NGR import PRBSBitSource, PRBSParams
+from rfmodel.comms.QAM_modulator import QAMModulator, QAMParams
+from rfmodel.core.signal import Signal
+from rfmodel.rf.PA import PABlock, PAParams
+
+
+ACCEL = [(name, b) for name in sorted(KERNELS) for b in available_backends(name) if b != "numpy"]
+
+
+def _cx(n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.standard_normal(n) + 1j * rng.standard_normal(n)
+    x[::97] = 0.0                            # exercise the r = 0 branch
+    return x
+
+
+def _cases(name):
+    if name == "rapp_amam":
+        x = _cx(10_001)
+        return [((x, 3.0, 1.2, 2.0), {}), ((x.real, 3.0, 1.2, 1.5), {}), ((x, 3.0, 1.2, 2.0, 0.5 - 0.2j), {})]
+    if name == "cubic":
+        x = _cx((3, 4001))
+        return [((x, 2.0, 0.3), {}), ((x.real, 2.0, 0.3), {}), ((x, 1 + 1j, 0.1 - 0.5j), {})]
+    if name == "prbs_lfsr":
+        return [((1, 7, 7, 6, 1000), {}), ((0x1234, 15, 15, 14, 70_000), {"dtype": np.int8})]
+    if name == "qam_demap":
+        lv = np.arange(-9, 10) * 0.5               # includes exact decision boundaries
+        rx = (lv[:, None] + 1j * lv[None, :]).ravel()
+        return [((rx, 1.0, 4, 2, True), {}), ((_cx(5000) * 3, 1.0, 8, 3, False), {}), ((rx, 2.0, 16, 4, True), {})]
+    raise AssertionError(f"no test cases for kernel '{name}'")
+
+
+def test_every_kernel_has_numpy_reference():
+    for name, impls in KERNELS.items():
+        assert "numpy" in impls, name
+
+
+@pytest.mark.parametrize("name,backend", ACCEL)
+def test_accelerated_kernel_matches_numpy(name, backend):
+    kernel = get_kernel(name, backend)
+    for args, kwargs in _cases(name):
+        ref = get_kernel(name, "numpy")(*args, **kwargs)
+        # main thread, and a pool thread (serial variant of parallel kernels)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            ys = [kernel(*args, **kwargs), pool.submit(kernel, *args, **kwargs).result()]
+        for y in ys:
+            assert y.shape == ref.shape and y.dtype == ref.dtype
+            if np.issubdtype(ref.dtype, np.integer):
+                assert np.array_equal(y, ref)
+            else:
+                assert np.allclose(y, ref, rtol=1e-13, atol=1e-13 * np.max(np.abs(ref)))
+
+
+def test_blocks_follow_backend_selection():
+    s = Signal(x=0.1 * _cx(2000), fs_hz=1e6)
+    pa = PABlock("pa", PAParams(gain_db=10.0, p1db_out_dbm=-5.0))
+    qam = QAMModulator("qam", QAMParams(M=64))
+    bits = PRBSBitSource("src", PRBSParams(order=15, n_bits=6000))
+
+    try:
+        set_kernel_backend("numpy")
+        ref = (pa.process(s).x, bits.process(s).x)
+        set_kernel_backend("auto")
+        y = (pa.process(s).x, bits.process(s).x)
+    finally:
+        set_kernel_backend("auto")
+
+    assert np.allclose(y[0], ref[0], rtol=1e-13)
+    assert np.array_equal(y[1], ref[1])
+    assert np.array_equal(qam.demap(qam.process(Signal(x=y[1], fs_hz=1.0)).x), y[1])
+
+    with pytest.raises(KeyError):
+        set_kernel_backend("numpy", ["no_such_kernel"])
@@ -0,0 +1,78 @@
+import json
+
+import numpy as np
+import pytest
+
+from rfmodel.channel.filters import FIRFilterBlock, FIRFilterParams
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.signal import Signal
+from rfmodel.core.signal_io import SignalFile, SignalWriter, save_signal
+
+
+def _sig(n=10_000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = (rng.standard_normal(n) + 1j * rng.standard_normal(n)) / 4
+    return Signal(x=x, fs_hz=20e6, fc_hz=5.2e9, meta={"name": "capture", "gain_db": np.float64(12.0)})
+
+
+def test_round_trip_cf32_is_memmapped(tmp_path):
+    s = _sig()
+    save_signal(tmp_path / "cap", s)
+
+    doc = json.loads((tmp_path / "cap.sigmf-meta").read_text())
+    assert doc["global"]["core:datatype"] == "cf32_le"
+    assert doc["global"]["core:sample_rate"] == 20e6
+    assert doc["captures"][0]["core:frequency"] == 5.2e9
+
+    r = Signal.from_file(tmp_path / "cap")
+    assert isinstance(r.x, np.memmap) and r.x.dtype == np.complex64
+    assert r.fs_hz == 20e6 and r.fc_hz == 5.2e9 and r.meta == {"name": "capture", "gain_db": 12.0}
+    np.testing.assert_allclose(r.x, s.x.astype(np.complex64))
+
+    # slicing and chunking never copy
+    f = SignalFile.open(tmp_path / "cap.sigmf-data")
+    part = f.read(100, 200)
+    assert np.shares_memory(part.x, f.read().x) and part.n_samples == 100
+    assert all(np.shares_memory(c.x, f.read().x) for c in f.chunks(4096))
+
+
+def test_ci16_scaled_and_raw(tmp_path):
+    s = _sig()
+    save_signal(tmp_path / "cap16", s, datatype="ci16_le", scale=2.0)
+    assert (tmp_path / "cap16.sigmf-data").stat().st_size == 4 * s.n_samples
+    r = Signal.from_file(tmp_path / "cap16", 10, 20)
+    np.testing.assert_allclose(r.x, s.x[10:20], atol=2.0 / 32767)
+
+    (s.x.astype(np.complex64)).tofile(tmp_path / "plain.cf32")
+    raw = SignalFile.raw(tmp_path / "plain.cf32", fs_hz=20e6)
+    assert len(raw) == s.n_samples
+    np.testing.assert_allclose(raw.read().x, s.x.astype(np.complex64))
+
+
+def test_run_stream_from_file_to_file(tmp_path):
+    s = _sig(50_000)
+    save_signal(tmp_path / "in", s)
+    taps = np.hanning(31)
+    fir = FIRFilterBlock(name="FIR", params=FIRFilterParams(taps=taps / taps.sum()))
+    pipe = Pipeline([fir])
+    ref = pipe.run(Signal.from_file(tmp_path / "in"), taps=["FIR"])[0]
+
+    pipe.reset()
+    with SignalWriter(tmp_path / "out") as w, SignalWriter(tmp_path / "tap", datatype="cf64_le") as wt:
+        n = w.write_stream(pipe.run_stream(SignalFile.open(tmp_path / "in").chunks(4096), taps=["FIR"]),
+                           taps={"FIR": wt})
+    assert n == s.n_samples
+
+    out = Signal.from_file(tmp_path / "out")
+    assert "stream_end" not in out.meta and out.fc_hz == 5.2e9
+    np.testing.assert_allclose(out.x, ref.x, atol=1e-6)
+    np.testing.assert_allclose(Signal.from_file(tmp_path / "tap").x, ref.x, atol=1e-6)
+
+
+def test_writer_rejects_mismatched_chunks(tmp_path):
+    with SignalWriter(tmp_path / "w") as w:
+        w.write(Signal(x=np.zeros(4, complex), fs_hz=1e6))
+        with pytest.raises(ValueError):
+            w.write(Signal(x=np.zeros(4, complex), fs_hz=2e6))
+        with pytest.raises(ValueError):
+            w.write(Signal(x=np.zeros((2, 4), complex), fs_hz=1e6))
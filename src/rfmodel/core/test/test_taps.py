@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from scipy.signal import welch
+
+from rfmodel.channel.filters import FIRFilterBlock, FIRFilterParams
+from rfmodel.core.graph import GraphPipeline
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.signal import Signal
+from rfmodel.core.taps import FileTap, KeepTap, SliceTap, StatsTap
+from rfmodel.rf.PA import PABlock, PAParams
+
+
+def _sig(n=40_000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = 1e-3 * (rng.standard_normal(n) + 1j * rng.standard_normal(n))
+    return Signal(x=x, fs_hz=20e6, fc_hz=5.2e9)
+
+
+def _pipe():
+    return Pipeline([
+        FIRFilterBlock(name="FIR", params=FIRFilterParams(cutoff_hz=5e6, n_taps=63)),
+        PABlock(name="PA", params=PAParams(gain_db=20.0, p1db_out_dbm=10.0)),
+    ])
+
+
+def test_sinks_match_full_taps_in_run_and_stream():
+    s = _sig()
+    pipe = _pipe()
+    ref = pipe.run(s, taps=["FIR", "PA"])[1]
+
+    sinks = {"FIR": SliceTap(start=1000, stop=30_000, step=7), "PA": StatsTap(nfft=256)}
+    pipe.reset()
+    _, captured = pipe.run(s, taps=sinks)
+    assert captured == {}
+
+    win = sinks["FIR"].result()
+    np.testing.assert_array_equal(win.x, ref["FIR"].x[1000:30_000:7])
+    assert win.fs_hz == s.fs_hz / 7 and win.fc_hz == s.fc_hz
+
+    st = sinks["PA"].result()
+    y = ref["PA"].x
+    assert st.n_samples == y.size
+    assert st.mean_power_w == pytest.approx(np.mean(np.abs(y) ** 2))
+    assert st.papr_db == pytest.approx(10 * np.log10(np.max(np.abs(y) ** 2) / np.mean(np.abs(y) ** 2)))
+    f, p = welch(y, fs=s.fs_hz, window="hann", nperseg=256, noverlap=0, return_onesided=False,
+                 detrend=False, scaling="density")
+    np.testing.assert_allclose(st.psd_w_hz, np.fft.fftshift(p), rtol=1e-9)
+
+    # streaming in odd-sized chunks gives the same results
+    stream_sinks = {"FIR": SliceTap(start=1000, stop=30_000, step=7), "PA": StatsTap(nfft=256)}
+    pipe.reset()
+    for _ in pipe.run_stream(s.chunks(3001), taps=stream_sinks):
+        pass
+    np.testing.assert_allclose(stream_sinks["FIR"].result().x, win.x, atol=1e-15)
+    assert stream_sinks["PA"].result().mean_power_w == pytest.approx(st.mean_power_w)
+    np.testing.assert_allclose(stream_sinks["PA"].result().psd_w_hz, st.psd_w_hz, rtol=1e-9)
+
+
+def test_reduced_precision_and_file_spill(tmp_path):
+    s = _sig()
+    pipe = _pipe()
+    taps = pipe.run(s, taps=["FIR", "PA"])[1]
+    fir, ref = taps["FIR"].x, taps["PA"].x
+
+    k64, k16, ft = KeepTap("complex64"), KeepTap("float16"), FileTap(tmp_path / "pa")
+    pipe.reset()
+    for _ in pipe.run_pipelined(s.chunks(8192), taps={"PA": k64, "FIR": k16}):
+        pass
+    pipe.reset()
+    pipe.run(s, taps={"PA": ft})
+
+    assert k64.nbytes == ref.size * 8 and k16.nbytes == ref.size * 4
+    np.testing.assert_allclose(k64.result().x, ref, rtol=1e-6, atol=1e-9)
+    assert np.max(np.abs(k16.result().x - fir)) < 2e-3 * np.max(np.abs(fir))
+
+    spilled = ft.result()
+    assert isinstance(spilled.x, np.memmap)
+    np.testing.assert_allclose(spilled.x, ref, rtol=1e-6, atol=1e-9)
+
+
+def test_graph_and_invalid_dtype():
+    g = GraphPipeline()
+    g.add(FIRFilterBlock(name="FIR", params=FIRFilterParams(cutoff_hz=5e6, n_taps=63)))
+    st = StatsTap()
+    _, captured = g.run(_sig(), taps={"FIR": st})
+    assert captured == {} and st.result().n_samples == 40_000 and st.result().psd_w_hz is None
+
+    pipe = _pipe()
+    _, captured = pipe.run(_sig(), taps={"FIR": None, "PA": StatsTap()})    # None keeps the Signal
+    assert list(captured) == ["FIR"]
+    with pytest.raises(ValueError):
+        KeepTap("int8")
@@ -1,5 +1,25 @@
-from .spectrum_analyser import spectrum_analyser
-from .phase_noise_analyser import calculate_phase_noise_curve
+from .spectrum_analyser import spectrum_analyser, AveragedSpectrum, Spectrum, ACLRResult, MaskResult
+from .amplitude_stats import AmplitudeStats, AMAMDensity, CCDF, AMAMResult, merge_stats
+from .characterize import characterize, compression_sweep, two_tone_sweep, noise_figure, dft_bins, DeviceReport
+from .phase_noise_analyser import calculate_phase_noise_curve, calculate_phase_noise_multires, MultiResPhaseNoise, PhaseNoiseCurve
 __all__ = ["spectrum_analyser",
-           "calculate_phase_noise_curve"]
+           "AveragedSpectrum",
+           "Spectrum",
+           "ACLRResult",
+           "MaskResult",
+           "AmplitudeStats",
+           "AMAMDensity",
+           "CCDF",
+           "AMAMResult",
+           "merge_stats",
+           "characterize",
+           "compression_sweep",
+           "two_tone_sweep",
+           "noise_figure",
+           "dft_bins",
+           "DeviceReport",
+           "calculate_phase_noise_curve",
+           "calculate_phase_noise_multires",
+           "MultiResPhaseNoise",
+           "PhaseNoiseCurve"]
 
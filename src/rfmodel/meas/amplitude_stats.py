@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Optional, Sequence
+import numpy as np
+
+from rfmodel.core.signal import Signal
+from rfmodel.core.taps import TapSink
+
+
+def _power_db_bins(x: np.ndarray, lo_dbm: float, bin_db: float, n_bins: int) -> np.ndarray:
+    # bin index of every sample's instantaneous power; 0 / n_bins + 1 collect
+    # under- and overflow (zero power counts as underflow)
+    p = np.abs(x) ** 2
+    with np.errstate(divide="ignore"):
+        db = 10 * np.log10(p / 1e-3)
+    idx = np.floor((db - lo_dbm) / bin_db)
+    return (np.clip(np.nan_to_num(idx, nan=-1, neginf=-1, posinf=n_bins), -1, n_bins) + 1).astype(np.intp)
+
+
+def _centres(lo: float, n: int, width: float) -> np.ndarray:
+    return lo + width * (np.arange(n) + 0.5)
+
+
+@dataclass(frozen=True)
+class CCDF:
+    """
+    Complementary CDF of instantaneous power relative to the mean power.
+
+    ccdf[i] = P(|x|^2 / mean > level_db[i]), at the lower edge of each
+    histogram bin; levels are quantized to the bin width.
+    """
+
+    level_db: np.ndarray
+    ccdf: np.ndarray
+    n_samples: int
+    mean_power_w: float
+    peak_power_w: float
+
+    @property
+    def papr_db(self) -> float:
+        """Peak-to-average power ratio of all samples seen (exact, not binned)."""
+        return float(10 * np.log10(self.peak_power_w / self.mean_power_w))
+
+    def papr_at(self, prob):
+        """Level [dB above mean] exceeded with probability prob (e.g. 1e-4), interpolated in log(prob)."""
+        prob = np.asarray(prob, dtype=float)
+        valid = self.ccdf > 0
+        # ccdf decreases with level: interpolate on increasing -log10(ccdf)
+        y = -np.log10(self.ccdf[valid])
+        return np.interp(-np.log10(prob), y, self.level_db[valid], right=np.nan)
+
+    def at(self, level_db):
+        """P(power > mean + level_db)."""
+        return np.interp(level_db, self.level_db, self.ccdf)
+
+
+class AmplitudeStats(TapSink):
+    """
+    Online amplitude statistics of a signal: a fixed-bin histogram of the
+    instantaneous power in dBm plus exact sample count, energy and peak.
+
+    Memory is O(bins) whatever the number of samples; chunks, trials
+    (leading axes) and runs are all accumulated. Two instances with the
+    same binning can be merge()d, e.g. the results of sweep workers, so
+    CCDFs over 1e9 samples cost one histogram per worker. result() gives
+    the CCDF relative to the mean power, from which PAPR at a given
+    probability follows:
+
+        st = AmplitudeStats()
+        for _ in pipe.run_stream(chunks, taps={"PA": st}):
+            pass
+        st.result().papr_at([1e-3, 1e-4])
+
+    Parameters
+    ----------
+    range_dbm :
+        Power range of the histogram; samples outside fall into the
+        under-/overflow bins (still counted in mean and peak).
+    bin_db :
+        Bin width, i.e. the resolution of the CCDF levels.
+    """
+
+    def __init__(self, range_dbm: tuple[float, float] = (-120.0, 60.0), bin_db: float = 0.02):
+        lo, hi = float(range_dbm[0]), float(range_dbm[1])
+        if not hi > lo or bin_db <= 0:
+            raise ValueError("AmplitudeStats needs range_dbm[1] > range_dbm[0] and bin_db > 0")
+        self.range_dbm = (lo, hi)
+        self.bin_db = float(bin_db)
+        self.n_bins = int(np.ceil((hi - lo) / self.bin_db))
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = np.zeros(self.n_bins + 2, dtype=np.int64)
+        self.n_samples = 0
+        self.energy_w = 0.0
+        self.peak_w = 0.0
+
+    def update(self, s: Signal | np.ndarray) -> None:
+        x = np.asarray(getattr(s, "x", s)).ravel()
+        if not x.size:
+            return
+        self.counts += np.bincount(_power_db_bins(x, self.range_dbm[0], self.bin_db, self.n_bins),
+                                   minlength=self.n_bins + 2)
+        p = np.abs(x) ** 2
+        self.n_samples += x.size
+        self.energy_w += float(p.sum())
+        self.peak_w = max(self.peak_w, float(p.max()))
+
+    def merge(self, other: "AmplitudeStats") -> "AmplitudeStats":
+        """Add the statistics of other (same range and bin width) into this one."""
+        if other.range_dbm != self.range_dbm or other.bin_db != self.bin_db:
+            raise ValueError("Cannot merge AmplitudeStats with different binning")
+        self.counts += other.counts
+        self.n_samples += other.n_samples
+        self.energy_w += other.energy_w
+        self.peak_w = max(self.peak_w, other.peak_w)
+        return self
+
+    def result(self) -> Optional[CCDF]:
+        if not self.n_samples:
+            return None
+        mean = self.energy_w / self.n_samples
+        edges_dbm = self.range_dbm[0] + self.bin_db * np.arange(self.n_bins + 1)
+        # samples above the lower edge of bin i: bins i.. plus overflow
+        above = np.cumsum(self.counts[::-1])[::-1][1:]
+        level = edges_dbm - 10 * np.log10(mean / 1e-3)
+        keep = level >= 0
+        return CCDF(level[keep], above[keep] / self.n_samples, self.n_samples, mean, self.peak_w)
+
+
+@dataclass(frozen=True)
+class AMAMResult:
+    """
+    AM-AM / AM-PM scatter densities against input power.
+
+    density_am[i, j]: samples with input power in bin i and output power in
+    bin j; density_pm[i, k]: same for phase change bin k. am_am_dbm /
+    am_pm_deg are the mean output power and mean phase change per input
+    bin (NaN for empty bins).
+    """
+
+    in_dbm: np.ndarray
+    out_dbm: np.ndarray
+    phase_deg: np.ndarray
+    density_am: np.ndarray
+    density_pm: np.ndarray
+    am_am_dbm: np.ndarray
+    am_pm_deg: np.ndarray
+    n_samples: int
+
+    @property
+    def gain_db(self) -> np.ndarray:
+        """Mean power gain per input bin [dB]."""
+        return self.am_am_dbm - self.in_dbm
+
+
+class _Endpoint(TapSink):
+    def __init__(self, owner: "AMAMDensity", side: int):
+        self._owner = owner
+        self._side = side
+
+    def update(self, s: Signal) -> None:
+        self._owner._push(self._side, np.asarray(s.x))
+
+    def result(self) -> Optional[AMAMResult]:
+        return self._owner.result()
+
+    def reset(self) -> None:
+        self._owner.reset()
+
+
+class AMAMDensity:
+    """
+    AM-AM / AM-PM scatter density between two taps of the same run, e.g.
+    the input and output of a PA, accumulated online in 2-D histograms.
+
+    Use the two endpoints as tap sinks:
+
+        d = AMAMDensity()
+        for _ in pipe.run_stream(chunks, taps={"DPD": d.input, "PA": d.output}):
+            pass
+        res = d.result()      # res.gain_db, res.am_pm_deg, res.density_am ...
+
+    Chunks from the two taps are paired in order (the taps must have the
+    same sample rate and no relative delay), so the taps can be fed from
+    run(), run_stream() or run_pipelined(). Samples of the tap that is
+    ahead are buffered until the other tap catches up: in run() and
+    run_stream() that is at most one chunk; in run_pipelined() the earlier
+    stage can run up to about (stages between the taps) * (queue_size + 1)
+    chunks ahead. Memory is O(in_bins * out_bins) plus that backlog;
+    instances with the same binning can be merge()d.
+
+    Parameters
+    ----------
+    in_range_dbm, out_range_dbm :
+        Power ranges of the input and output axes.
+    bin_db :
+        Power bin width of both axes.
+    phase_bin_deg :
+        Phase change bin width over [-180, 180).
+    """
+
+    def __init__(
+        self,
+        in_range_dbm: tuple[float, float] = (-60.0, 30.0),
+        out_range_dbm: tuple[float, float] = (-40.0, 50.0),
+        *,
+        bin_db: float = 0.5,
+        phase_bin_deg: float = 0.5,
+    ):
+        self.in_range_dbm = tuple(map(float, in_range_dbm))
+        self.out_range_dbm = tuple(map(float, out_range_dbm))
+        self.bin_db = float(bin_db)
+        self.phase_bin_deg = float(phase_bin_deg)
+        self.n_in = int(np.ceil((self.in_range_dbm[1] - self.in_range_dbm[0]) / self.bin_db))
+        self.n_out = int(np.ceil((self.out_range_dbm[1] - self.out_range_dbm[0]) / self.bin_db))
+        self.n_phase = int(np.ceil(360.0 / self.phase_bin_deg))
+        self.input = _Endpoint(self, 0)
+        self.output = _Endpoint(self, 1)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts_am = np.zeros((self.n_in, self.n_out), dtype=np.int64)
+        self.counts_pm = np.zeros((self.n_in, self.n_phase), dtype=np.int64)
+        self._sum_out_w = np.zeros(self.n_in)
+        self._sum_rot = np.zeros(self.n_in, dtype=complex)
+        self._count_in = np.zeros(self.n_in, dtype=np.int64)
+        self.n_samples = 0
+        self._pending: list[list[np.ndarray]] = [[], []]
+
+    def _push(self, side: int, x: np.ndarray) -> None:
+        with self._lock:
+            self._pending[side].append(x.ravel())
+            while self._pending[0] and self._pending[1]:
+                a, b = self._pending[0][0], self._pending[1][0]
+                n = min(a.size, b.size)
+                self.update(a[:n], b[:n])
+                for q, v in ((self._pending[0], a), (self._pending[1], b)):
+                    if v.size > n:
+                        q[0] = v[n:]
+                    else:
+                        q.pop(0)
+
+    def update(self, x_in: np.ndarray, x_out: np.ndarray) -> None:
+        """Accumulate time-aligned input / output samples."""
+        x_in, x_out = np.asarray(x_in).ravel(), np.asarray(x_out).ravel()
+        if x_in.shape != x_out.shape:
+            raise ValueError(f"Input and output sample counts differ ({x_in.size} vs {x_out.size})")
+        i = _power_db_bins(x_in, self.in_range_dbm[0], self.bin_db, self.n_in) - 1
+        j = _power_db_bins(x_out, self.out_range_dbm[0], self.bin_db, self.n_out) - 1
+        rot = x_out * np.conj(x_in)
+        k = np.floor((np.degrees(np.angle(rot)) + 180.0) / self.phase_bin_deg).astype(np.intp) % self.n_phase
+
+        ok = (i >= 0) & (i < self.n_in)
+        i, j, k, rot = i[ok], j[ok], k[ok], rot[ok]
+        in_out = (j >= 0) & (j < self.n_out)
+        self.counts_am += np.bincount(i[in_out] * self.n_out + j[in_out],
+                                      minlength=self.n_in * self.n_out).reshape(self.n_in, self.n_out)
+        self.counts_pm += np.bincount(i * self.n_phase + k, minlength=self.n_in * self.n_phase).reshape(
+            self.n_in, self.n_phase)
+        self._sum_out_w += np.bincount(i, weights=np.abs(x_out[ok]) ** 2, minlength=self.n_in)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            unit = np.where(rot != 0, rot / np.abs(rot), 0)
+        self._sum_rot += np.bincount(i, weights=unit.real, minlength=self.n_in) + 1j * np.bincount(
+            i, weights=unit.imag, minlength=self.n_in)
+        self._count_in += np.bincount(i, minlength=self.n_in)
+        self.n_samples += x_in.size
+
+    def merge(self, other: "AMAMDensity") -> "AMAMDensity":
+        """Add the histograms of other (same binning) into this one."""
+        same = (other.in_range_dbm, other.out_range_dbm, other.bin_db, other.phase_bin_deg) == (
+            self.in_range_dbm, self.out_range_dbm, self.bin_db, self.phase_bin_deg)
+        if not same:
+            raise ValueError("Cannot merge AMAMDensity with different binning")
+        self.counts_am += other.counts_am
+        self.counts_pm += other.counts_pm
+        self._sum_out_w += other._sum_out_w
+        self._sum_rot += other._sum_rot
+        self._count_in += other._count_in
+        self.n_samples += other.n_samples
+        return self
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def result(self) -> Optional[AMAMResult]:
+        if not self.n_samples:
+            return None
+        n = self._count_in
+        with np.errstate(invalid="ignore", divide="ignore"):
+            am = np.where(n > 0, 10 * np.log10(self._sum_out_w / np.maximum(n, 1) / 1e-3), np.nan)
+            pm = np.where(n > 0, np.degrees(np.angle(self._sum_rot)), np.nan)
+        return AMAMResult(
+            in_dbm=_centres(self.in_range_dbm[0], self.n_in, self.bin_db),
+            out_dbm=_centres(self.out_range_dbm[0], self.n_out, self.bin_db),
+            phase_deg=_centres(-180.0, self.n_phase, self.phase_bin_deg),
+            density_am=self.counts_am.copy(),
+            density_pm=self.counts_pm.copy(),
+            am_am_dbm=am,
+            am_pm_deg=pm,
+            n_samples=self.n_samples,
+        )
+
+
+def merge_stats(stats: Sequence[AmplitudeStats | AMAMDensity]):
+    """Merge results of several workers into a new accumulator."""
+    import copy
+
+    if not stats:
+        raise ValueError("Nothing to merge")
+    out = copy.deepcopy(stats[0])
+    for s in stats[1:]:
+        out.merge(s)
+    return out
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+import numpy as np
+
+from rfmodel.core.block import Block
+from rfmodel.core.signal import Signal
+
+K_BOLTZMANN = 1.380649e-23
+T0_K = 290.0
+
+
+def dft_bins(x: np.ndarray, bins: Sequence[int]) -> np.ndarray:
+    """
+    Complex amplitudes of DFT bins of x along the last axis, normalized so
+    a tone A*exp(2j*pi*k*n/N) gives A at bin k.
+
+    Only the requested bins are evaluated (one matrix product, the
+    vectorized equivalent of one Goertzel recursion per bin): O(N * n_bins)
+    per row instead of a full FFT.
+    """
+    x = np.asarray(x)
+    n = x.shape[-1]
+    k = np.asarray(bins).reshape(-1, 1) % n
+    # exact phase: (k * m) mod N keeps the argument small for long records
+    phase = (k * np.arange(n)) % n
+    return (x @ np.exp(-2j * np.pi * phase / n).T) / n
+
+
+def _dbm_to_w(p_dbm: np.ndarray) -> np.ndarray:
+    return 1e-3 * 10 ** (np.asarray(p_dbm, dtype=float) / 10)
+
+
+def _to_dbm(p_w: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore"):
+        return 10 * np.log10(np.asarray(p_w) / 1e-3)
+
+
+def _first_crossing(x: np.ndarray, y: np.ndarray, level: float) -> float:
+    # x where y first drops to level, interpolated linearly; NaN if never
+    below = np.nonzero(y <= level)[0]
+    if not below.size:
+        return float("nan")
+    i = below[0]
+    if i == 0:
+        return float(x[0])
+    return float(np.interp(level, [y[i], y[i - 1]], [x[i], x[i - 1]]))
+
+
+@dataclass(frozen=True)
+class CompressionResult:
+    """
+    Single-tone power sweep. Powers are |x|^2 of the complex envelope (the
+    convention of PABlock's p1db_out_dbm); p_out_dbm is the power of the
+    fundamental only (harmonics and noise excluded).
+    """
+
+    p_in_dbm: np.ndarray
+    p_out_dbm: np.ndarray
+    gain_db: np.ndarray
+    small_signal_gain_db: float
+    ip1db_dbm: float
+    op1db_dbm: float
+
+
+@dataclass(frozen=True)
+class TwoToneResult:
+    """
+    Two-tone power sweep. p_in_dbm is the power per tone as real RF power
+    (|A|^2 / 2, the convention of the IP3_dbm / iip3_dbm block parameters);
+    fund_dbm / im3_dbm are per tone, averaged over the lower and upper
+    products. iip3_dbm is the intercept of the slope-1 and slope-3 lines
+    fitted to the points in fit_mask; slope_fund / slope_im3 are the
+    slopes of free fits there, as a check of the fit region. When the IM3
+    slope is not close to 3 (not a third-order law, e.g. a Rapp PA) the
+    intercept is meaningless and iip3_dbm / oip3_dbm are NaN.
+    """
+
+    p_in_dbm: np.ndarray
+    fund_dbm: np.ndarray
+    im3_dbm: np.ndarray
+    noise_dbm: np.ndarray
+    fit_mask: np.ndarray
+    iip3_dbm: float
+    oip3_dbm: float
+    slope_fund: float
+    slope_im3: float
+
+
+@dataclass(frozen=True)
+class NoiseFigureResult:
+    """Y-factor noise figure from hot and cold input noise."""
+
+    nf_db: float
+    gain_db: float
+    y_db: float
+    t_hot_k: float
+    t_cold_k: float
+
+
+@dataclass(frozen=True)
+class DeviceReport:
+    """
+    Summary of characterize(): small-signal gain, input / output 1 dB
+    compression, IIP3 / OIP3 and noise figure, with the underlying sweep
+    results. Measurements that were not run, not reached by the sweep or
+    not valid (IM3 slope far from 3) are NaN.
+    """
+
+    gain_db: float
+    ip1db_dbm: float
+    op1db_dbm: float
+    iip3_dbm: float
+    oip3_dbm: float
+    nf_db: float
+    compression: Optional[CompressionResult] = None
+    two_tone: Optional[TwoToneResult] = None
+    noise: Optional[NoiseFigureResult] = None
+
+
+def _run(block: Block, x: np.ndarray, fs_hz: float) -> np.ndarray:
+    block.reset()
+    return np.asarray(block(Signal(x=x, fs_hz=fs_hz)).x)
+
+
+def compression_sweep(
+    block: Block,
+    p_in_dbm: Sequence[float],
+    *,
+    fs_hz: float = 5e6,
+    n: int = 1024,
+    tone_bin: int = 37,
+    n_small: int = 3,
+) -> CompressionResult:
+    """
+    Gain and 1 dB compression from one batched single-tone run.
+
+    Every input power is a row of one (n_points, n) stimulus matrix; the
+    tone sits exactly on DFT bin tone_bin, so its output power is read
+    from that bin alone. The small-signal gain is the mean gain of the
+    n_small lowest powers.
+    """
+    p_in = np.asarray(p_in_dbm, dtype=float)
+    amp = np.sqrt(_dbm_to_w(p_in))[:, None]
+    x = amp * np.exp(2j * np.pi * tone_bin * np.arange(n) / n)
+    y = _run(block, x, fs_hz)
+
+    p_out = _to_dbm(np.abs(dft_bins(y, [tone_bin])[:, 0]) ** 2)
+    gain = p_out - p_in
+    order = np.argsort(p_in)
+    g0 = float(np.mean(gain[order[:n_small]]))
+    ip1 = _first_crossing(p_in[order], gain[order], g0 - 1.0)
+    return CompressionResult(p_in, p_out, gain, g0, ip1, ip1 + g0 - 1.0)
+
+
+def two_tone_sweep(
+    block: Block,
+    p_in_dbm: Sequence[float],
+    *,
+    fs_hz: float = 5e6,
+    n: int = 1024,
+    tone_bins: tuple[int, int] = (40, 47),
+    max_compression_db: float = 0.1,
+    min_snr_db: float = 20.0,
+    max_slope_error: float = 0.5,
+) -> TwoToneResult:
+    """
+    IIP3 / OIP3 from one batched two-tone run.
+
+    Tones on DFT bins k1 < k2; fundamentals and the IM3 products at 2k1-k2
+    and 2k2-k1 are evaluated with dft_bins() only. The noise floor per bin
+    is the mean of a few empty bins between the tones. Points below the
+    first one whose fundamental is compressed by max_compression_db, and
+    whose IM3 is min_snr_db above the noise floor, are used for the fit.
+    If the fitted IM3 slope differs from 3 by more than max_slope_error
+    (dB/dB), the device is not third-order limited there and the
+    intercepts are returned as NaN; the sweep data and slopes still are.
+    """
+    k1, k2 = tone_bins
+    if not 0 < k2 - k1 or 2 * k1 - k2 < -n // 2 or 2 * k2 - k1 >= n // 2:
+        raise ValueError("tone_bins must satisfy k1 < k2 with both IM3 products inside the band")
+    p_in = np.asarray(p_in_dbm, dtype=float)
+    amp = np.sqrt(2 * _dbm_to_w(p_in))[:, None]
+    m = np.arange(n)
+    x = amp * (np.exp(2j * np.pi * k1 * m / n) + np.exp(2j * np.pi * k2 * m / n))
+    y = _run(block, x, fs_hz)
+
+    empty = [k1 + 1 + i for i in range(k2 - k1 - 1)] or [k2 + 2 * (k2 - k1) + 1]
+    X = np.abs(dft_bins(y, [k1, k2, 2 * k1 - k2, 2 * k2 - k1] + empty)) ** 2
+    # per tone, in the |A|^2 / 2 convention of the input
+    fund = _to_dbm(X[:, :2].mean(axis=1) / 2)
+    im3 = _to_dbm(X[:, 2:4].mean(axis=1) / 2)
+    noise = _to_dbm(X[:, 4:].mean(axis=1) / 2)
+
+    # below the first compressed point (a cubic law expands again past its null)
+    order = np.argsort(p_in)
+    g_lin = fund - p_in
+    g0 = float(np.mean(g_lin[order[:3]]))
+    compressed = np.nonzero(g_lin[order] <= g0 - max_compression_db)[0]
+    linear = np.zeros(p_in.size, dtype=bool)
+    linear[order[:compressed[0] if compressed.size else p_in.size]] = True
+    fit = linear & (im3 > noise + min_snr_db)
+    if fit.sum() < 2:
+        raise ValueError("Fewer than two points in the IM3 fit region; extend the power sweep")
+
+    # fixed slopes 1 and 3: intercept of each point, averaged
+    iip3 = float(np.mean(p_in[fit] + (fund[fit] - im3[fit]) / 2))
+    slope_f = float(np.polyfit(p_in[fit], fund[fit], 1)[0])
+    slope_i = float(np.polyfit(p_in[fit], im3[fit], 1)[0])
+    oip3 = iip3 + float(np.mean(fund[fit] - p_in[fit]))
+    if abs(slope_i - 3.0) > max_slope_error:
+        iip3 = oip3 = float("nan")
+    return TwoToneResult(p_in, fund, im3, noise, fit, iip3, oip3, slope_f, slope_i)
+
+
+def noise_figure(
+    block: Block,
+    *,
+    fs_hz: float = 5e6,
+    n: int = 65536,
+    n_trials: int = 4,
+    t_hot_k: float = T0_K * (1 + 10 ** 1.5),
+    t_cold_k: float = T0_K,
+    seed: int = 0,
+) -> NoiseFigureResult:
+    """
+    Y-factor noise figure: thermal noise at t_hot_k (default ENR 15 dB) and
+    t_cold_k in one batch of 2 * n_trials rows.
+
+    Input noise power is k*T*fs/2 per sample, the bandwidth the blocks use
+    for their own added noise. F = (T_hot/T0 - 1 - Y*(T_cold/T0 - 1)) / (Y - 1)
+    with Y = N_hot / N_cold; the gain follows from the output noise slope.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.repeat([t_hot_k, t_cold_k], n_trials)[:, None]
+    sigma = np.sqrt(K_BOLTZMANN * t * fs_hz / 2 / 2)
+    x = sigma * (rng.standard_normal((2 * n_trials, n)) + 1j * rng.standard_normal((2 * n_trials, n)))
+    y = _run(block, x, fs_hz)
+
+    p = np.mean(np.abs(y) ** 2, axis=-1)
+    n_hot, n_cold = p[:n_trials].mean(), p[n_trials:].mean()
+    y_fac = n_hot / n_cold
+    f = (t_hot_k / T0_K - 1 - y_fac * (t_cold_k / T0_K - 1)) / (y_fac - 1)
+    g = (n_hot - n_cold) / (K_BOLTZMANN * (t_hot_k - t_cold_k) * fs_hz / 2)
+    return NoiseFigureResult(float(10 * np.log10(f)), float(10 * np.log10(g)),
+                             float(10 * np.log10(y_fac)), t_hot_k, t_cold_k)
+
+
+def characterize(
+    block: Block,
+    p_in_dbm: Optional[Sequence[float]] = None,
+    *,
+    fs_hz: float = 5e6,
+    two_tone: bool = True,
+    nf: bool = True,
+) -> DeviceReport:
+    """
+    Gain, P1dB, IIP3 / OIP3 and noise figure of a block (LNABlock, PABlock,
+    MixerBlock, ...) from three batched runs: a single-tone and a two-tone
+    power sweep and a hot / cold noise pair. See compression_sweep(),
+    two_tone_sweep() and noise_figure() for the conventions; measurements
+    that are not run, not reached by the sweep or not valid (IIP3 of a
+    device whose IM3 slope is far from 3) are NaN.
+
+        rep = characterize(LNABlock("lna", LNAParams(gain_db=20, nf_db=2, IP3_dbm=-5)))
+        rep.iip3_dbm, rep.ip1db_dbm, rep.nf_db
+    """
+    p_in = np.arange(-80.0, 30.5, 0.5) if p_in_dbm is None else np.asarray(p_in_dbm, dtype=float)
+    comp = compression_sweep(block, p_in, fs_hz=fs_hz)
+    tt = two_tone_sweep(block, p_in, fs_hz=fs_hz) if two_tone else None
+    noise = noise_figure(block, fs_hz=fs_hz) if nf else None
+    nan = float("nan")
+    return DeviceReport(
+        gain_db=comp.small_signal_gain_db,
+        ip1db_dbm=comp.ip1db_dbm,
+        op1db_dbm=comp.op1db_dbm,
+        iip3_dbm=tt.iip3_dbm if tt else nan,
+        oip3_dbm=tt.oip3_dbm if tt else nan,
+        nf_db=noise.nf_db if noise else nan,
+        compression=comp,
+        two_tone=tt,
+        noise=noise,
+    )
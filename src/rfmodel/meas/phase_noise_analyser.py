@@ -1,4 +1,9 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
 import scipy.signal as signal
+from scipy.integrate import trapezoid
 import numpy as np
 
 def calculate_phase_noise_curve(
@@ -45,3 +50,167 @@ def calculate_phase_noise_curve(
     print(f"Phase noise at {target_offset/1e6:.3f} MHz offset: {pn_at_offset:.2f} dBc/Hz")
 
     return offsets_pe, L_f, pn_at_offset
+
+
+@dataclass(frozen=True)
+class PhaseNoiseCurve:
+    """
+    Phase noise on log-spaced offsets, in the same units as
+    calculate_phase_noise_curve (10*log10 of the one-sided phase PSD).
+
+    offsets_hz / L_f: averaged curve; n_bins: Welch bins averaged into
+    each point. freqs_hz / S_phi: the stitched per-bin phase PSD [rad^2/Hz].
+    """
+
+    offsets_hz: np.ndarray
+    L_f: np.ndarray
+    n_bins: np.ndarray
+    freqs_hz: np.ndarray
+    S_phi: np.ndarray
+
+    def at(self, offset_hz):
+        """L_f interpolated (log frequency) at offset_hz [dBc/Hz]."""
+        return np.interp(np.log10(offset_hz), np.log10(self.offsets_hz), self.L_f)
+
+    def integrated_phase_rad(self, f_lo_hz: float, f_hi_hz: float) -> float:
+        """RMS phase error [rad] from the phase PSD integrated over [f_lo_hz, f_hi_hz]."""
+        sel = (self.freqs_hz >= f_lo_hz) & (self.freqs_hz <= f_hi_hz)
+        return float(np.sqrt(trapezoid(self.S_phi[sel], self.freqs_hz[sel])))
+
+
+class MultiResPhaseNoise:
+    """
+    Multi-resolution phase noise analyser.
+
+    The unwrapped phase is decimated by `decimation` in cascaded stages
+    (streaming polyphase decimators, see rfmodel.multirate) and a Welch
+    spectrum of nperseg bins is accumulated at every rate. Stage k has bin
+    spacing fs / (nperseg * decimation**k) and is used from min_bins bins
+    up to where the next faster stage takes over, so close-in and far-out
+    offsets come from one pass with nperseg-point FFTs only. Stages are
+    added until min_bins bins of the slowest one reach f_min_hz.
+
+    Input can be given in chunks (update()); phase is unwrapped across
+    them. result() stitches the stages and averages the per-bin PSD into
+    points_per_decade log-spaced offsets.
+    """
+
+    def __init__(
+        self,
+        fs_hz: float,
+        f_min_hz: float = 10.0,
+        *,
+        nperseg: int = 2**12,
+        decimation: int = 8,
+        min_bins: int = 8,
+        window: str = "hann",
+        detrend_type: str = "linear",
+        overlap: float = 0.5,
+        points_per_decade: int = 20,
+        half_len: int = 10,
+    ):
+        from rfmodel.meas.spectrum_analyser import AveragedSpectrum
+        from rfmodel.multirate.resample import PolyphaseResampler, design_resample_taps
+
+        if decimation < 2:
+            raise ValueError("decimation must be >= 2")
+        if min_bins * decimation / nperseg > 0.4:
+            # the hand-over offset must stay inside the decimation filter passband
+            raise ValueError("nperseg must be > 2.5 * min_bins * decimation")
+        self.fs_hz = float(fs_hz)
+        self.f_min_hz = float(f_min_hz)
+        self.nperseg = int(nperseg)
+        self.decimation = int(decimation)
+        self.min_bins = int(min_bins)
+        self.points_per_decade = int(points_per_decade)
+
+        n_stages = 1
+        while self.min_bins * self.fs_hz / (self.nperseg * self.decimation ** (n_stages - 1)) > self.f_min_hz:
+            n_stages += 1
+        self.n_stages = n_stages
+
+        taps = design_resample_taps(1, self.decimation, half_len=half_len)
+        self._decimators = [PolyphaseResampler(1, self.decimation, taps) for _ in range(n_stages - 1)]
+        self._spectra = [
+            AveragedSpectrum(self.nperseg, window, overlap=overlap, fs_hz=self.fs_hz / self.decimation ** k,
+                             detrend=detrend_type or None)
+            for k in range(n_stages)
+        ]
+        self._last_phase: Optional[np.ndarray] = None
+
+    def reset(self) -> None:
+        for d in self._decimators:
+            d.reset()
+        for sa in self._spectra:
+            sa.reset()
+        self._last_phase = None
+
+    def update(self, y) -> None:
+        """Add a chunk of the complex signal (array or Signal; time on the last axis)."""
+        x = np.asarray(getattr(y, "x", y))
+        phi = np.angle(x)
+        if self._last_phase is not None:
+            phi = np.unwrap(np.concatenate([self._last_phase, phi], axis=-1), axis=-1)[..., 1:]
+        else:
+            phi = np.unwrap(phi, axis=-1)
+        if phi.shape[-1]:
+            self._last_phase = phi[..., -1:]
+
+        self._spectra[0].update(phi)
+        for dec, sa in zip(self._decimators, self._spectra[1:]):
+            phi = dec(phi, flush=False)
+            sa.update(phi)
+
+    def result(self) -> PhaseNoiseCurve:
+        freqs, psd = [], []
+        f_hi = np.inf
+        for sa in self._spectra:
+            spec = sa.result()
+            if spec is None:
+                break
+            f_lo = self.min_bins * spec.bin_hz
+            sel = (spec.freqs_hz >= max(f_lo, self.f_min_hz)) & (spec.freqs_hz < f_hi)
+            freqs.append(spec.freqs_hz[sel])
+            psd.append(spec.psd_w_hz[sel])
+            f_hi = f_lo
+        if not freqs:
+            raise ValueError(f"Not enough samples for one segment of {self.nperseg}")
+        order = np.argsort(np.concatenate(freqs))
+        f = np.concatenate(freqs)[order]
+        S_phi = np.concatenate(psd)[order]
+
+        # average bins into log-spaced offsets
+        edges = 10.0 ** (np.floor(np.log10(f[0]) * self.points_per_decade) / self.points_per_decade
+                         + np.arange(0, 1 + self.points_per_decade * np.log10(f[-1] / f[0]) + 2)
+                         / self.points_per_decade)
+        idx = np.digitize(f, edges) - 1
+        n_bins = np.bincount(idx, minlength=len(edges))
+        keep = n_bins > 0
+        mean_psd = np.bincount(idx, weights=S_phi, minlength=len(edges))[keep] / n_bins[keep]
+        mean_f = np.bincount(idx, weights=f, minlength=len(edges))[keep] / n_bins[keep]
+        return PhaseNoiseCurve(mean_f, 10 * np.log10(mean_psd), n_bins[keep], f, S_phi)
+
+
+def calculate_phase_noise_multires(y, fs, f_min_hz=10.0, chunk_size=None, **kwargs):
+    """
+    Phase noise curve from offset f_min_hz to fs/2 with MultiResPhaseNoise.
+
+    Args:
+        y: Complex input signal, or an iterable of chunks (arrays or Signals)
+        fs: Sampling frequency
+        f_min_hz: Lowest offset to resolve
+        chunk_size: Feed y in chunks of this size (bounds the working memory)
+        **kwargs: Passed to MultiResPhaseNoise (nperseg, decimation, ...)
+
+    Returns:
+        PhaseNoiseCurve with log-spaced offsets_hz and L_f [dBc/Hz]
+    """
+    pn = MultiResPhaseNoise(fs, f_min_hz, **kwargs)
+    if isinstance(y, np.ndarray):
+        step = chunk_size or y.shape[-1]
+        chunks = (y[..., i:i + step] for i in range(0, y.shape[-1], step))
+    else:
+        chunks = y
+    for c in chunks:
+        pn.update(c)
+    return pn.result()
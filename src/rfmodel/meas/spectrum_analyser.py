@@ -1,14 +1,23 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
 import numpy as np
 
-def spectrum_analyser(x, fs, tol=1e-12):
+from rfmodel.core.signal import Signal
+from rfmodel.core.taps import TapSink
+
+def spectrum_analyser(x, fs, tol=1e-12, return_leakage=False):
     """
     Compute one-sided power spectrum (W per FFT bin) of a real signal.
 
     - Uses rFFT.
     - Returns power per bin (not PSD).
     - Applies one-sided correction (doubles non-DC/Nyquist bins).
-    - Prints a warning if dominant tone appears non-coherently sampled
-      (energy present in adjacent bins).
+    - Checks whether the dominant tone appears non-coherently sampled
+      (energy present in adjacent bins): returned as a flag with
+      return_leakage=True, otherwise a RuntimeWarning.
 
     Parameters
     ----------
@@ -20,6 +29,8 @@ def spectrum_analyser(x, fs, tol=1e-12):
         Reference resistance [Ohm].
     tol : float
         Neighbor/peak power ratio threshold for leakage warning.
+    return_leakage : bool
+        Return the coherence check instead of warning.
 
     Returns
     -------
@@ -27,8 +38,12 @@ def spectrum_analyser(x, fs, tol=1e-12):
         Power per FFT bin [W].
     freq : ndarray
         Corresponding frequency vector [Hz].
+    leakage : bool
+        Only with return_leakage=True: the dominant tone of a real signal
+        is not coherently sampled.
     """
     N = len(x)
+    leakage = False
 
     if np.iscomplexobj(x):
         # Complex signal → full FFT, no symmetry
@@ -54,7 +69,262 @@ def spectrum_analyser(x, fs, tol=1e-12):
         if 0 < k_peak < len(X)-1:
             neighbor_power = np.abs(X[k_peak-1])**2 + np.abs(X[k_peak+1])**2
             peak_power = np.abs(X[k_peak])**2
-            if neighbor_power / peak_power > tol:
-                print("Signal is not coherently sampled — expect spectral leakage.")
+            leakage = bool(neighbor_power / peak_power > tol)
+
+    if return_leakage:
+        return P_bin_W, freq, leakage
+    if leakage:
+        warnings.warn("Signal is not coherently sampled — expect spectral leakage.", RuntimeWarning, stacklevel=2)
+    return P_bin_W, freq
+
+
+@dataclass(frozen=True)
+class ACLRResult:
+    """Adjacent channel leakage ratios, one per offset (positive dB: channel / adjacent)."""
+
+    channel_power_w: float
+    offsets_hz: np.ndarray
+    adjacent_power_w: np.ndarray
+    aclr_db: np.ndarray
+
+    @property
+    def worst_db(self) -> float:
+        return float(np.min(self.aclr_db))
+
+
+@dataclass(frozen=True)
+class MaskResult:
+    """
+    Spectral mask check. level_db / limit_db per frequency bin (NaN where
+    the mask does not apply); margin_db = min(limit - level) and passed is
+    margin_db >= 0.
+    """
+
+    passed: bool
+    margin_db: float
+    worst_freq_hz: float
+    freqs_hz: np.ndarray
+    level_db: np.ndarray
+    limit_db: np.ndarray
+
+
+@dataclass(frozen=True)
+class Spectrum:
+    """
+    Averaged power spectral density [W/Hz].
+
+    Two-sided (fftshifted, negative frequencies first) for complex input,
+    one-sided for real input. Integrating psd_w_hz over all bins gives the
+    mean signal power.
+    """
+
+    freqs_hz: np.ndarray
+    psd_w_hz: np.ndarray
+    rbw_hz: float              # equivalent noise bandwidth of one bin
+    n_segments: int
+
+    @property
+    def bin_hz(self) -> float:
+        return float(self.freqs_hz[1] - self.freqs_hz[0])
+
+    def band_power(self, f_lo_hz: float, f_hi_hz: float) -> float:
+        """Power [W] in bins whose centre lies in [f_lo_hz, f_hi_hz]."""
+        sel = (self.freqs_hz >= f_lo_hz) & (self.freqs_hz <= f_hi_hz)
+        return float(np.sum(self.psd_w_hz[sel]) * self.bin_hz)
+
+    def aclr(
+        self,
+        channel_bw_hz: float,
+        offsets_hz: Optional[Sequence[float]] = None,
+        *,
+        adjacent_bw_hz: Optional[float] = None,
+        center_hz: float = 0.0,
+    ) -> ACLRResult:
+        """
+        Channel power in channel_bw_hz around center_hz relative to the
+        power in adjacent_bw_hz (default channel_bw_hz) around each
+        center_hz + offset. Default offsets are the lower and upper
+        adjacent channels, -/+ channel_bw_hz.
+        """
+        if offsets_hz is None:
+            offsets_hz = (-channel_bw_hz, channel_bw_hz)
+        offsets = np.asarray(offsets_hz, dtype=float)
+        adj_bw = channel_bw_hz if adjacent_bw_hz is None else adjacent_bw_hz
+        p_ch = self.band_power(center_hz - channel_bw_hz / 2, center_hz + channel_bw_hz / 2)
+        p_adj = np.array([
+            self.band_power(center_hz + o - adj_bw / 2, center_hz + o + adj_bw / 2) for o in offsets
+        ])
+        with np.errstate(divide="ignore"):
+            aclr_db = 10 * np.log10(p_ch / p_adj)
+        return ACLRResult(p_ch, offsets, p_adj, aclr_db)
+
+    def check_mask(
+        self,
+        mask: Sequence[Tuple[float, float]],
+        *,
+        reference: str = "peak",
+        rbw_hz: Optional[float] = None,
+        center_hz: float = 0.0,
+    ) -> MaskResult:
+        """
+        Compare the spectrum with a mask given as (offset_hz, limit_db)
+        points, interpolated linearly in |f - center_hz| and applied from
+        the first offset outwards (the last limit holds beyond the last).
 
-    return P_bin_W, freq
\ No newline at end of file
+        reference='peak' gives levels in dBr relative to the maximum of the
+        (rbw-averaged) PSD, as in 802.11 transmit masks; 'absolute' gives
+        dBm in rbw_hz. rbw_hz (default: one bin) averages the PSD over that
+        bandwidth first, like a spectrum analyser's resolution filter.
+        """
+        if reference not in ("peak", "absolute"):
+            raise ValueError(f"Unknown mask reference '{reference}' (use 'peak' or 'absolute')")
+        pts = np.asarray(sorted(mask), dtype=float)
+        if pts.ndim != 2 or pts.shape[1] != 2:
+            raise ValueError("mask must be a sequence of (offset_hz, limit_db) points")
+
+        rbw = self.bin_hz if rbw_hz is None else float(rbw_hz)
+        n_avg = max(1, int(round(rbw / self.bin_hz)))
+        psd = self.psd_w_hz
+        if n_avg > 1:
+            psd = np.convolve(psd, np.ones(n_avg) / n_avg, mode="same")
+        with np.errstate(divide="ignore"):
+            if reference == "peak":
+                level = 10 * np.log10(psd / np.max(psd))
+            else:
+                level = 10 * np.log10(psd * rbw / 1e-3)
+
+        offset = np.abs(self.freqs_hz - center_hz)
+        applies = offset >= pts[0, 0]
+        limit = np.where(applies, np.interp(offset, pts[:, 0], pts[:, 1]), np.nan)
+        level = np.where(applies, level, np.nan)
+        if not np.any(applies):
+            return MaskResult(True, float("inf"), float("nan"), self.freqs_hz, level, limit)
+        margin = limit - level
+        k = int(np.nanargmin(margin))
+        return MaskResult(bool(margin[k] >= 0), float(margin[k]), float(self.freqs_hz[k]),
+                          self.freqs_hz, level, limit)
+
+
+class AveragedSpectrum(TapSink):
+    """
+    Welch / averaged-periodogram spectrum analyser that accumulates
+    window-weighted FFT segments incrementally.
+
+    update() takes chunks of a signal (Signal or array, time on the last
+    axis). Segments continue across chunks; leading axes are independent
+    trials (e.g. a batched run) whose periodograms are averaged together.
+    Memory is O(nfft) per trial however long the capture is, so it can be
+    fed from Pipeline.run_stream() or used directly as a tap sink:
+
+        sa = AveragedSpectrum(nfft=2048)
+        for _ in pipe.run_stream(SignalFile.open("cap").chunks(1 << 20), taps={"PA": sa}):
+            pass
+        spec = sa.result()
+        spec.aclr(18e6, [-20e6, 20e6]).aclr_db
+
+    With overlap=0 and a periodic window the result equals scipy.signal.welch
+    (detrend=False, return_onesided=False for complex input) over the whole
+    capture.
+
+    Parameters
+    ----------
+    nfft :
+        Segment length (bin spacing fs / nfft).
+    window :
+        Any window accepted by scipy.signal.get_window.
+    overlap :
+        Fraction of a segment shared with the previous one, 0 <= overlap < 1.
+    fs_hz :
+        Sample rate for array input; taken from Signals otherwise.
+    detrend :
+        None, 'constant' or 'linear': trend removed from each segment before
+        windowing, as in scipy.signal.welch.
+    """
+
+    def __init__(self, nfft: int = 4096, window: str = "hann", overlap: float = 0.5,
+                 fs_hz: Optional[float] = None, max_block: int = 256, detrend: Optional[str] = None):
+        from scipy.signal import get_window
+
+        if nfft < 2 or not 0 <= overlap < 1:
+            raise ValueError("AveragedSpectrum needs nfft >= 2 and 0 <= overlap < 1")
+        self.nfft = int(nfft)
+        self.window = window
+        self.overlap = float(overlap)
+        self.hop = max(1, int(round(self.nfft * (1 - self.overlap))))
+        self.fs_hz = fs_hz
+        if detrend not in (None, "constant", "linear"):
+            raise ValueError(f"Unknown detrend '{detrend}' (use None, 'constant' or 'linear')")
+        self.detrend = detrend
+        self.max_block = int(max_block)       # segments per FFT call, bounds temporary memory
+        self._w = get_window(window, self.nfft)
+        self.reset()
+
+    def reset(self) -> None:
+        self._acc: Optional[np.ndarray] = None
+        self._real: Optional[bool] = None
+        self._segments = 0
+        self.n_samples = 0
+        self._carry: Optional[np.ndarray] = None
+
+    def flush(self) -> None:
+        """Drop samples not yet in a full segment: the next update() starts a new record."""
+        self._carry = None
+
+    @property
+    def n_segments(self) -> int:
+        return self._segments
+
+    def update(self, s: Signal | np.ndarray) -> None:
+        if isinstance(s, Signal):
+            if self.fs_hz is None:
+                self.fs_hz = s.fs_hz
+            elif s.fs_hz != self.fs_hz:
+                raise ValueError(f"Chunk sample rate {s.fs_hz} differs from the analyser's {self.fs_hz}")
+            s = s.x
+        x = np.asarray(s)
+        real = not np.iscomplexobj(x)
+        if self._real is None:
+            self._real = real
+        elif real != self._real:
+            raise ValueError("Cannot mix real and complex chunks in one spectrum")
+        rows = x.reshape(-1, x.shape[-1])
+        self.n_samples += rows.shape[-1]
+
+        if self._carry is not None and self._carry.shape[0] == rows.shape[0]:
+            rows = np.concatenate([self._carry, rows], axis=-1)
+        n = rows.shape[-1]
+        n_seg = (n - self.nfft) // self.hop + 1 if n >= self.nfft else 0
+        for k0 in range(0, n_seg, self.max_block):
+            k1 = min(n_seg, k0 + self.max_block)
+            seg = np.lib.stride_tricks.sliding_window_view(
+                rows[:, k0 * self.hop:(k1 - 1) * self.hop + self.nfft], self.nfft, axis=-1
+            )[:, ::self.hop]
+            if self.detrend is not None:
+                from scipy.signal import detrend
+
+                seg = detrend(seg, axis=-1, type=self.detrend)
+            seg = seg * self._w
+            X = np.fft.rfft(seg, axis=-1) if real else np.fft.fft(seg, axis=-1)
+            spec = np.sum(X.real ** 2 + X.imag ** 2, axis=(0, 1))
+            self._acc = spec if self._acc is None else self._acc + spec
+        self._segments += n_seg * rows.shape[0]
+        self._carry = rows[:, n_seg * self.hop:].copy()
+
+    def result(self) -> Optional[Spectrum]:
+        """Spectrum averaged over all segments so far (None before the first full segment)."""
+        if not self._segments:
+            return None
+        fs = self.fs_hz if self.fs_hz is not None else 1.0
+        s2 = float(np.sum(self._w ** 2))
+        psd = self._acc / (self._segments * fs * s2)
+        if self._real:
+            freqs = np.fft.rfftfreq(self.nfft, d=1.0 / fs)
+            psd = psd.copy()
+            psd[1:] *= 2.0
+            if self.nfft % 2 == 0:
+                psd[-1] /= 2.0
+        else:
+            freqs = np.fft.fftshift(np.fft.fftfreq(self.nfft, d=1.0 / fs))
+            psd = np.fft.fftshift(psd)
+        rbw = fs * s2 / float(np.sum(self._w)) ** 2
+        return Spectrum(freqs, psd, rbw, self._segments)
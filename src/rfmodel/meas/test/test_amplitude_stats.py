@@ -0,0 +1,65 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.signal import Signal
+from rfmodel.meas.amplitude_stats import AMAMDensity, AmplitudeStats, merge_stats
+from rfmodel.multirate.resample import UpsampleBlock
+from rfmodel.rf.PA import PABlock, PAParams
+
+
+def _gauss(n, seed, p_w=1e-3):
+    rng = np.random.default_rng(seed)
+    return np.sqrt(p_w / 2) * (rng.standard_normal(n) + 1j * rng.standard_normal(n))
+
+
+def test_ccdf_of_complex_gaussian_chunked_and_merged():
+    x = _gauss(1_000_000, 0)
+    st = AmplitudeStats()
+    for c in Signal(x=x.reshape(4, -1), fs_hz=1e6).chunks(30_001):      # batched trials, chunked
+        st.update(c)
+    ccdf = st.result()
+
+    # |x|^2 / mean is exponential: P(> t) = exp(-t)
+    assert ccdf.n_samples == x.size and ccdf.mean_power_w == pytest.approx(np.mean(np.abs(x) ** 2))
+    assert ccdf.papr_db == pytest.approx(10 * np.log10(np.max(np.abs(x) ** 2) / ccdf.mean_power_w))
+    assert ccdf.at(3.0) == pytest.approx(np.exp(-10 ** 0.3), rel=0.02)
+    np.testing.assert_allclose(ccdf.papr_at([1e-2, 1e-4]), 10 * np.log10(np.log([1e2, 1e4])), atol=0.15)
+
+    # per-worker accumulators (pickled back from workers) merge into the same histogram
+    parts = [AmplitudeStats() for _ in range(3)]
+    for p, c in zip(parts, np.array_split(x, 3)):
+        p.update(c)
+    merged = merge_stats([pickle.loads(pickle.dumps(p)) for p in parts])
+    np.testing.assert_array_equal(merged.counts, st.counts)
+    with pytest.raises(ValueError):
+        st.merge(AmplitudeStats(bin_db=0.1))
+
+
+def test_am_am_am_pm_between_taps():
+    x = _gauss(200_000, 1, p_w=1e-4)
+    pa = PABlock(name="PA", params=PAParams(gain_db=20.0, p1db_out_dbm=10.0))
+    pipe = Pipeline([UpsampleBlock(name="UP", factor=1), pa])
+
+    d = AMAMDensity(in_range_dbm=(-50, 0), out_range_dbm=(-30, 20))
+    for _ in pipe.run_pipelined(Signal(x=x, fs_hz=1e6).chunks(7000), taps={"UP": d.input, "PA": d.output}):
+        pass
+    res = d.result()
+    assert res.n_samples == x.size and 0.999 * x.size < res.density_am.sum() <= x.size
+
+    ok = ~np.isnan(res.gain_db) & (res.density_am.sum(axis=1) > 50)
+    small = ok & (res.in_dbm < -30)
+    assert np.all(np.abs(res.gain_db[small] - 20.0) < 0.05)
+    # 1 dB compression where the output reaches p1dB (about -9 dBm in)
+    k = np.argmin(np.abs(res.am_am_dbm[ok] - 10.0))
+    assert res.gain_db[ok][k] == pytest.approx(19.0, abs=0.2)
+    assert np.nanmax(np.abs(res.am_pm_deg)) < 1e-6      # Rapp model: no AM-PM
+
+    rot = AMAMDensity()
+    rot.update(x, x * 10 * np.exp(0.3j))
+    r = rot.result()
+    assert np.nanmax(np.abs(r.am_pm_deg - np.degrees(0.3))) < 1e-9
+    assert r.phase_deg[np.argmax(r.density_pm.sum(axis=0))] == pytest.approx(np.degrees(0.3), abs=0.5)
+    assert merge_stats([rot, rot]).n_samples == 2 * x.size
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from rfmodel.meas.characterize import characterize, compression_sweep, dft_bins, two_tone_sweep
+from rfmodel.rf.LNA import LNABlock, LNAParams
+from rfmodel.rf.Mixer_PLL_block import MixerBlock, MixerParams
+from rfmodel.rf.PA import PABlock, PAParams
+
+
+def test_dft_bins_match_fft():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((3, 1000)) + 1j * rng.standard_normal((3, 1000))
+    bins = [0, 7, 499, -3]
+    np.testing.assert_allclose(dft_bins(x, bins), np.fft.fft(x)[:, bins] / 1000, atol=1e-12)
+
+
+@pytest.mark.parametrize("block, iip3, nf", [
+    (LNABlock("lna", LNAParams(gain_db=20.0, nf_db=2.0, IP3_dbm=-5.0), seed=1), -5.0, 2.0),
+    (MixerBlock("mix", MixerParams(gain_db=8.0, iip3_dbm=10.0, nf_db=9.0), seed=2), 10.0, 9.0),
+])
+def test_recovers_configured_cubic_device(block, iip3, nf):
+    gain = block.params.gain_db
+    rep = characterize(block)
+    assert rep.gain_db == pytest.approx(gain, abs=0.01)
+    assert rep.iip3_dbm == pytest.approx(iip3, abs=0.1)
+    assert rep.oip3_dbm == pytest.approx(iip3 + gain, abs=0.1)
+    assert rep.two_tone.slope_fund == pytest.approx(1.0, abs=0.02)
+    assert rep.two_tone.slope_im3 == pytest.approx(3.0, abs=0.05)
+    # cubic law: P1dB (|x|^2) sits 9.6 dB below IIP3 (|A|^2 / 2 per tone)
+    assert rep.ip1db_dbm == pytest.approx(iip3 + 10 * np.log10(2 * (1 - 10 ** -0.05)), abs=0.1)
+    assert rep.nf_db == pytest.approx(nf, abs=0.1)
+    assert rep.noise.gain_db == pytest.approx(gain, abs=0.1)
+
+
+def test_pa_compression_and_rapp_im3_order():
+    pa = PABlock("pa", PAParams(gain_db=30.0, p1db_out_dbm=25.0))
+    comp = compression_sweep(pa, np.arange(-40.0, 10.5, 0.25))
+    assert comp.small_signal_gain_db == pytest.approx(30.0, abs=1e-3)
+    assert comp.op1db_dbm == pytest.approx(25.0, abs=0.02)
+    assert comp.ip1db_dbm == pytest.approx(-4.0, abs=0.02)
+
+    # smoothness 2: no cubic term, the 2f1 - f2 product grows as Pin^5
+    tt = two_tone_sweep(pa, np.arange(-40.0, 10.5, 0.25))
+    assert tt.slope_im3 == pytest.approx(5.0, abs=0.05)
+    # ... so a slope-3 intercept would be meaningless
+    assert np.isnan(tt.iip3_dbm) and np.isnan(tt.oip3_dbm)
+    assert np.isnan(characterize(pa, nf=False).iip3_dbm)
+    with pytest.raises(ValueError):
+        two_tone_sweep(pa, [-30.0, -20.0], tone_bins=(40, 30))
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from scipy.integrate import trapezoid
+
+from rfmodel.core.signal import Signal
+from rfmodel.meas.phase_noise_analyser import MultiResPhaseNoise, calculate_phase_noise_multires
+from rfmodel.rf.Mixer_PLL_block import PLL, PLLParams
+
+
+def _lo(fs=1e6, n=2**20, seed=1):
+    pll = PLL(PLLParams(VCO_Phase_Noise_dBc=(-100, 1e5), SLF_dBc=-90, f_L=10e3, Tu=3.2e-6),
+              np.random.default_rng(seed))
+    return pll, pll.generate_lo_impairment(n, fs)
+
+
+def test_multires_matches_pll_profile_down_to_close_in():
+    fs = 1e6
+    pll, y = _lo(fs)
+    # a frequency offset only adds a linear phase ramp, removed per segment
+    y = y * np.exp(2j * np.pi * 1234.5 * np.arange(y.size) / fs)
+    curve = calculate_phase_noise_multires(y, fs, f_min_hz=100, nperseg=2048)
+
+    assert curve.offsets_hz[0] >= 100 and curve.offsets_hz[-1] <= fs / 2
+    err = curve.L_f - 10 * np.log10(pll.get_psd(curve.offsets_hz))
+    far = curve.offsets_hz > 2e3
+    assert np.max(np.abs(err[far])) < 1.0
+    assert np.median(np.abs(err[~far])) < 2.0
+    assert curve.at(1e5) == pytest.approx(10 * np.log10(pll.get_psd(np.array([1e5])))[0], abs=0.5)
+
+    f = np.linspace(1e3, 2e5, 20_000)
+    expected = np.sqrt(trapezoid(pll.get_psd(f), f))
+    assert curve.integrated_phase_rad(1e3, 2e5) == pytest.approx(expected, rel=0.05)
+
+
+def test_chunked_input_is_identical():
+    fs = 1e6
+    _, y = _lo(fs, n=2**18)
+    pn = MultiResPhaseNoise(fs, f_min_hz=500, nperseg=1024)
+    assert pn.n_stages == 3
+    pn.update(y)
+    whole = pn.result()
+
+    pn.reset()
+    for c in Signal(x=y, fs_hz=fs).chunks(10_007):
+        pn.update(c)
+    chunked = pn.result()
+    np.testing.assert_allclose(chunked.L_f, whole.L_f, atol=1e-9)
+
+    with pytest.raises(ValueError):
+        MultiResPhaseNoise(fs, nperseg=64, decimation=8, min_bins=8)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from scipy.signal import welch
+
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.signal import Signal
+from rfmodel.meas.spectrum_analyser import AveragedSpectrum, spectrum_analyser
+from rfmodel.rf.PA import PABlock, PAParams
+
+
+def _ofdm_like(n=200_000, fs=40e6, bw=12e6, seed=0):
+    # band-limited noise: flat over +/- bw/2, nothing outside
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal(n) + 1j * rng.standard_normal(n)
+    f = np.fft.fftfreq(n, 1 / fs)
+    X[np.abs(f) > bw / 2] = 0
+    return Signal(x=np.fft.ifft(X) * 0.05, fs_hz=fs, fc_hz=2.4e9)
+
+
+def test_chunked_batched_matches_welch():
+    s = _ofdm_like()
+    for overlap, noverlap in ((0.0, 0), (0.5, 512)):
+        sa = AveragedSpectrum(nfft=1024, overlap=overlap, max_block=7)
+        for c in s.chunks(12_345):
+            sa.update(c)
+        spec = sa.result()
+        f, p = welch(s.x, fs=s.fs_hz, window="hann", nperseg=1024, noverlap=noverlap,
+                     return_onesided=False, detrend=False)
+        np.testing.assert_allclose(spec.psd_w_hz, np.fft.fftshift(p), rtol=1e-9, atol=1e-12 * p.max())
+        np.testing.assert_allclose(spec.freqs_hz, np.fft.fftshift(f))
+
+    # trials on the leading axis are averaged together
+    batch = np.stack([s.x, _ofdm_like(seed=1).x])
+    sa = AveragedSpectrum(nfft=1024, overlap=0.0, fs_hz=s.fs_hz)
+    sa.update(batch)
+    p1 = welch(batch, fs=s.fs_hz, window="hann", nperseg=1024, noverlap=0,
+               return_onesided=False, detrend=False)[1].mean(axis=0)
+    np.testing.assert_allclose(sa.result().psd_w_hz, np.fft.fftshift(p1), rtol=1e-9, atol=1e-12 * p1.max())
+
+    # real input: one-sided, total power preserved
+    r = np.random.default_rng(3).standard_normal(50_000)
+    sa = AveragedSpectrum(nfft=512, fs_hz=1e6)
+    sa.update(r)
+    spec = sa.result()
+    assert spec.freqs_hz[0] == 0 and spec.freqs_hz[-1] == 0.5e6
+    assert np.sum(spec.psd_w_hz) * spec.bin_hz == pytest.approx(np.mean(r ** 2), rel=0.05)
+    with pytest.raises(ValueError):
+        sa.update(r + 0j)
+
+
+def test_aclr_and_mask_show_pa_regrowth():
+    s = _ofdm_like()
+    p_in = np.mean(np.abs(s.x) ** 2)
+    mask = [(7e6, -20.0), (9e6, -28.0), (16e6, -40.0)]
+
+    def measure(p1db_dbm):
+        pipe = Pipeline([PABlock(name="PA", params=PAParams(gain_db=10.0, p1db_out_dbm=p1db_dbm))])
+        sa = AveragedSpectrum(nfft=1024)
+        for _ in pipe.run_stream(s.chunks(50_000), taps={"PA": sa}):
+            pass
+        spec = sa.result()
+        return spec, spec.aclr(12e6, [-14e6, 14e6]), spec.check_mask(mask, rbw_hz=100e3)
+
+    spec, lin, lin_mask = measure(40.0)
+    _, sat, sat_mask = measure(10 * np.log10(p_in / 1e-3) + 10.0)
+
+    # channel power is the in-band power, adjacent channels hold only window leakage
+    assert lin.channel_power_w == pytest.approx(np.sum(spec.psd_w_hz) * spec.bin_hz, rel=1e-2)
+    assert lin.aclr_db.shape == (2,) and lin.worst_db > 50
+    assert sat.worst_db < lin.worst_db - 15
+    assert lin_mask.passed and lin_mask.margin_db > 0
+    assert not sat_mask.passed and abs(sat_mask.worst_freq_hz) >= 7e6
+    assert np.isnan(lin_mask.limit_db[np.abs(spec.freqs_hz) < 7e6]).all()
+
+
+def test_single_fft_leakage_is_returned_not_printed(capsys):
+    n, fs = 1000, 1e3
+    t = np.arange(n) / fs
+    coherent, leaky = np.cos(2 * np.pi * 50 * t), np.cos(2 * np.pi * 50.5 * t)
+
+    assert spectrum_analyser(coherent, fs, return_leakage=True)[2] is False
+    P, f, leakage = spectrum_analyser(leaky, fs, return_leakage=True)
+    assert leakage and P.shape == f.shape
+    with pytest.warns(RuntimeWarning, match="coherently sampled"):
+        spectrum_analyser(leaky, fs)
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,32 @@
+from .resample import (
+    PolyphaseResampler,
+    ResampleBlock,
+    ResampleParams,
+    UpsampleBlock,
+    DownsampleBlock,
+    OversampledBlock,
+    design_resample_taps,
+    oversample_section,
+)
+from .farrow import FarrowInterpolator, SampleClockBlock, SampleClockParams, lagrange_farrow_coeffs
+from .registry import _build_resample, _build_upsample, _build_downsample, _build_oversampled, _build_sample_clock
+
+__all__ = [
+    "PolyphaseResampler",
+    "ResampleBlock",
+    "ResampleParams",
+    "UpsampleBlock",
+    "DownsampleBlock",
+    "OversampledBlock",
+    "design_resample_taps",
+    "oversample_section",
+    "FarrowInterpolator",
+    "SampleClockBlock",
+    "SampleClockParams",
+    "lagrange_farrow_coeffs",
+    "_build_resample",
+    "_build_upsample",
+    "_build_downsample",
+    "_build_oversampled",
+    "_build_sample_clock",
+]
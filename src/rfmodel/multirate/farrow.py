@@ -0,0 +1,190 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Optional
+import numpy as np
+
+from rfmodel.core.block import Block
+from rfmodel.core.signal import Signal
+
+
+def lagrange_farrow_coeffs(order: int) -> np.ndarray:
+    """
+    Farrow coefficient matrix of Lagrange interpolation of the given order.
+
+    C[i, j] is the coefficient of mu^i in the Lagrange basis polynomial of
+    node j - (order - 1) // 2, so the value at position n + mu (0 <= mu < 1) is
+
+        y = sum_i mu^i * v_i[n],   v_i[n] = sum_j C[i, j] * x[n - (order - 1) // 2 + j]
+
+    i.e. order + 1 FIR branch filters combined by a Horner polynomial in mu.
+    """
+    if order < 1:
+        raise ValueError("order must be >= 1")
+    t = np.arange(order + 1) - (order - 1) // 2
+    C = np.empty((order + 1, order + 1))
+    for j in range(order + 1):
+        others = np.delete(t, j)
+        # np.poly gives the highest power first
+        C[:, j] = np.poly(others)[::-1] / np.prod(t[j] - others)
+    return C
+
+
+class FarrowInterpolator:
+    """
+    Streaming interpolation of x at arbitrary increasing fractional input
+    positions, with a Lagrange Farrow structure.
+
+    position(m) maps global output indices m (int array) to input positions
+    in samples; x[n] for n < 0 is taken as zero. Every call evaluates the
+    branch filters v_i over the span of input the new outputs need (one
+    sliding-window product for all branches and batch rows) and combines
+    them with a vectorized Horner step per output sample.
+
+    Streaming: the input tail and the global input / output counters are
+    kept between calls. Outputs whose interpolation window reaches past the
+    input received so far are held back; flush=True zero-pads the tail,
+    returns every output whose position lies inside the input and resets.
+    """
+
+    def __init__(self, order: int = 3):
+        self.order = order
+        self.C = lagrange_farrow_coeffs(order)
+        self.lo = (order - 1) // 2                # window: x[n - lo] .. x[n + hi]
+        self.hi = order - self.lo
+        self.reset()
+
+    def reset(self) -> None:
+        self._history: Optional[np.ndarray] = None
+        self._b0 = 0                                # global index of history[..., 0]
+        self._m_out = 0
+
+    def _n_valid(self, position: Callable, m0: int, n_last: float) -> tuple[np.ndarray, np.ndarray]:
+        # outputs m0, m0 + 1, ... with position <= n_last, evaluated in growing blocks
+        p0, p1 = position(np.array([m0, m0 + 1]))
+        step = max(p1 - p0, 1e-6)
+        k = max(int((n_last - p0) / step) + 8, 8)
+        while True:
+            m = np.arange(m0, m0 + k)
+            p = position(m)
+            ok = p <= n_last
+            if not ok[-1]:
+                n = int(np.argmin(ok))
+                return m[:n], p[:n]
+            k *= 2
+
+    def __call__(self, x: np.ndarray, position: Callable[[np.ndarray], np.ndarray], flush: bool = True) -> np.ndarray:
+        x = np.asarray(x)
+        if self._history is None:
+            # zeros in front, also for outputs that start at negative positions
+            first = float(position(np.array([0]))[0])
+            n_pre = self.lo + max(0, int(np.ceil(-first)))
+            self._history = np.zeros(x.shape[:-1] + (n_pre,), dtype=x.dtype)
+            self._b0 = -n_pre
+        elif self._history.shape[:-1] != x.shape[:-1]:
+            raise ValueError(
+                f"Batch shape changed between chunks ({self._history.shape[:-1]} -> "
+                f"{x.shape[:-1]}); call reset() before starting a new stream"
+            )
+
+        buf = np.concatenate([self._history, x], axis=-1)
+        b0 = self._b0
+        n_end = b0 + buf.shape[-1]                  # one past the last input
+        if flush:
+            m, p = self._n_valid(position, self._m_out, n_end - 1)
+            buf = np.concatenate([buf, np.zeros(x.shape[:-1] + (self.hi + 1,), dtype=buf.dtype)], axis=-1)
+        else:
+            # the window of floor(p) reaches x[floor(p) + hi]
+            m, p = self._n_valid(position, self._m_out, n_end - 1 - self.hi)
+
+        n = np.floor(p).astype(np.int64)
+        mu = p - n
+        dtype = np.result_type(buf.dtype, float)
+        y = np.zeros(x.shape[:-1] + (len(m),), dtype=dtype)
+        if len(m):
+            if n[0] - self.lo < b0:
+                raise ValueError("Interpolation position moved backwards past the kept input")
+            # branch filters over the needed span only: v[..., w, i] at n = w0 + w
+            w0 = n[0] - self.lo - b0
+            span = buf[..., w0:n[-1] + self.hi + 1 - b0]
+            win = np.lib.stride_tricks.sliding_window_view(span, self.order + 1, axis=-1)
+            v = win @ self.C.T
+            vn = v[..., n - n[0], :]
+            y = vn[..., self.order]
+            for i in range(self.order - 1, -1, -1):
+                y = y * mu + vn[..., i]
+
+        if flush:
+            self.reset()
+        else:
+            self._m_out += len(m)
+            p_next = float(position(np.array([self._m_out]))[0])
+            keep = int(min(np.floor(p_next) - self.lo, n_end - self.order))
+            keep = max(keep, b0)
+            self._history = buf[..., keep - b0:].copy()
+            self._b0 = keep
+        return y
+
+
+@dataclass
+class SampleClockParams:
+    delay_samples: float = 0.0           # static delay, fractional samples
+    sco_ppm: float = 0.0                 # sampling clock offset; > 0: clock fast, more samples
+    sco_drift_ppm_per_s: float = 0.0     # linear change of the offset over time
+    delay_mod_samples: float = 0.0       # sinusoidal delay (clock wander) amplitude
+    delay_mod_hz: float = 0.0
+    order: int = 3                       # Lagrange order (3: cubic)
+
+
+class SampleClockBlock(Block):
+    """
+    Sampling-clock impairment of a DAC / ADC: fractional delay and
+    sample-rate offset, applied with a Lagrange Farrow interpolator.
+
+    Output sample m is the input interpolated at position
+
+        p_m = m - 1e-6 * (sco_ppm * m + sco_drift_ppm_per_s * m^2 / (2 fs)) - d(t_m)
+        d(t) = delay_samples + delay_mod_samples * sin(2 pi delay_mod_hz t),  t_m = m / fs
+
+    (first order in the clock offset). fs_hz is unchanged: the samples are
+    labelled with the nominal rate, as the converter would. With a clock
+    offset the output has about N * (1 + sco_ppm * 1e-6) samples for N
+    inputs; in Pipeline.run_stream() chunk lengths vary accordingly and the
+    concatenated output matches a single run.
+
+    Parameters
+    ----------
+    delay_samples :
+        Static delay in samples; positive delays the signal.
+    sco_ppm :
+        Clock frequency offset in ppm.
+    sco_drift_ppm_per_s :
+        Rate of change of the offset, e.g. a temperature ramp.
+    delay_mod_samples, delay_mod_hz :
+        Sinusoidal timing wander.
+    order :
+        Lagrange interpolation order (1 linear, 3 cubic, 5 ...).
+    """
+
+    type_name = "sample_clock"
+
+    def __init__(self, name: str, params: SampleClockParams):
+        super().__init__(name=name)
+        self.params = params
+        self._farrow = FarrowInterpolator(params.order)
+
+    def reset(self, seed: int | None = None) -> None:
+        _ = seed
+        self._farrow.reset()
+
+    def positions(self, m: np.ndarray, fs_hz: float) -> np.ndarray:
+        """Input position (samples) of global output indices m."""
+        p = self.params
+        m = np.asarray(m, dtype=float)
+        p_m = m - 1e-6 * (p.sco_ppm * m + p.sco_drift_ppm_per_s * m * m / (2 * fs_hz)) - p.delay_samples
+        if p.delay_mod_samples:
+            p_m = p_m - p.delay_mod_samples * np.sin(2 * np.pi * p.delay_mod_hz * m / fs_hz)
+        return p_m
+
+    def process(self, s: Signal) -> Signal:
+        y = self._farrow(s.x, lambda m: self.positions(m, s.fs_hz), flush=s.is_stream_end)
+        return s.copy_with(x=y)
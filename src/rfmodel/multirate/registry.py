@@ -0,0 +1,86 @@
+from __future__ import annotations
+import numpy as np
+
+from rfmodel.core.factory import register_block, build_block
+from rfmodel.multirate.resample import (
+    ResampleBlock,
+    ResampleParams,
+    UpsampleBlock,
+    DownsampleBlock,
+    OversampledBlock,
+)
+from rfmodel.multirate.farrow import SampleClockBlock, SampleClockParams
+
+
+@register_block("resample")
+def _build_resample(cfg: dict) -> ResampleBlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    taps = p.get("taps", None)
+    params = ResampleParams(
+        up=int(p.get("up", 1)),
+        down=int(p.get("down", 1)),
+        half_len=int(p.get("half_len", 10)),
+        kaiser_beta=float(p.get("kaiser_beta", 5.0)),
+        taps=np.asarray(taps, dtype=float) if taps is not None else None,
+    )
+    return ResampleBlock(name=name, params=params)
+
+
+@register_block("upsample")
+def _build_upsample(cfg: dict) -> UpsampleBlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    return UpsampleBlock(
+        name=name,
+        factor=int(p["factor"]),
+        half_len=int(p.get("half_len", 10)),
+        kaiser_beta=float(p.get("kaiser_beta", 5.0)),
+    )
+
+
+@register_block("downsample")
+def _build_downsample(cfg: dict) -> DownsampleBlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    return DownsampleBlock(
+        name=name,
+        factor=int(p["factor"]),
+        half_len=int(p.get("half_len", 10)),
+        kaiser_beta=float(p.get("kaiser_beta", 5.0)),
+    )
+
+
+@register_block("oversampled")
+def _build_oversampled(cfg: dict) -> OversampledBlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+    block_cfgs = cfg.get("blocks", [])
+
+    blocks = [build_block(bcfg) for bcfg in block_cfgs]
+    return OversampledBlock(
+        name=name,
+        blocks=blocks,
+        factor=int(p["factor"]),
+        half_len=int(p.get("half_len", 10)),
+        kaiser_beta=float(p.get("kaiser_beta", 5.0)),
+    )
+
+
+@register_block("sample_clock")
+def _build_sample_clock(cfg: dict) -> SampleClockBlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    params = SampleClockParams(
+        delay_samples=float(p.get("delay_samples", 0.0)),
+        sco_ppm=float(p.get("sco_ppm", 0.0)),
+        sco_drift_ppm_per_s=float(p.get("sco_drift_ppm_per_s", 0.0)),
+        delay_mod_samples=float(p.get("delay_mod_samples", 0.0)),
+        delay_mod_hz=float(p.get("delay_mod_hz", 0.0)),
+        order=int(p.get("order", 3)),
+    )
+    return SampleClockBlock(name=name, params=params)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from math import gcd
+from typing import Optional
+import numpy as np
+
+from rfmodel.core.block import Block
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.signal import Signal
+
+
+def design_resample_taps(up: int, down: int, half_len: int = 10, kaiser_beta: float = 5.0) -> np.ndarray:
+    """
+    Kaiser-windowed sinc anti-imaging / anti-aliasing prototype at rate up*fs.
+
+    Cutoff is the lower of the input and output Nyquist frequencies, length is
+    2*half_len*max(up, down) + 1 (odd, linear phase) and the DC gain is `up`,
+    so amplitudes are preserved through the zero-stuffing.
+    """
+    g = gcd(up, down)
+    up, down = up // g, down // g
+    max_rate = max(up, down)
+    n_half = half_len * max_rate
+    k = np.arange(-n_half, n_half + 1)
+    fc = 1.0 / max_rate
+
+    h = fc * np.sinc(fc * k) * np.kaiser(2 * n_half + 1, kaiser_beta)
+    return up * h / np.sum(h)
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational resampler by up/down (upfirdn with a polyphase filter).
+
+    Output sample m is
+
+        y[m] = sum_k h[k] * xu[m*down + delay - k]
+
+    where xu is x zero-stuffed by `up` and delay = (len(h)-1)/2, i.e. the
+    linear-phase delay of the prototype is compensated and the output is time
+    aligned with the input. Only the taps of one polyphase branch are applied
+    per output sample, at the output rate.
+
+    Streaming: the last input samples and the global input/output counters are
+    kept between calls. Outputs that still need future input are held back
+    until the next call; `flush=True` zero-pads the tail and returns the rest
+    (ceil(N*up/down) outputs in total for N inputs) and resets the state.
+    """
+
+    def __init__(self, up: int, down: int, taps: np.ndarray):
+        if up < 1 or down < 1:
+            raise ValueError("up and down must be >= 1")
+        taps = np.asarray(taps)
+        if taps.ndim != 1 or len(taps) % 2 == 0:
+            raise ValueError("taps must be a 1D array of odd length (linear phase)")
+
+        g = gcd(up, down)
+        self.up = up // g
+        self.down = down // g
+        self.taps = taps
+        self.delay = (len(taps) - 1) // 2
+
+        # Polyphase matrix: branch phi holds taps h[phi + j*up], zero padded
+        self.n_poly = -(-len(taps) // self.up)
+        hp = np.zeros(self.n_poly * self.up, dtype=taps.dtype)
+        hp[:len(taps)] = taps
+        self.poly = hp.reshape(self.n_poly, self.up).T          # (up, n_poly)
+
+        self.reset()
+
+    def reset(self) -> None:
+        self._history: Optional[np.ndarray] = None
+        self._n_in = 0
+        self._m_out = 0
+
+    def __call__(self, x: np.ndarray, flush: bool = True) -> np.ndarray:
+        x = np.asarray(x)
+        U, D, Lp = self.up, self.down, self.n_poly
+
+        if self._history is None:
+            self._history = np.zeros(x.shape[:-1] + (Lp - 1,), dtype=x.dtype)
+        elif self._history.shape[:-1] != x.shape[:-1]:
+            raise ValueError(
+                f"Batch shape changed between chunks ({self._history.shape[:-1]} -> "
+                f"{x.shape[:-1]}); call reset() before starting a new stream"
+            )
+
+        n_end = self._n_in + x.shape[-1]          # global index one past the last input
+        buf = np.concatenate([self._history, x], axis=-1)
+        b0 = self._n_in - (Lp - 1)                # global index of buf[..., 0]
+
+        if flush:
+            m_stop = -(-n_end * U // D)
+            n0_last = ((m_stop - 1) * D + self.delay) // U if m_stop > 0 else 0
+            pad = max(0, n0_last - (n_end - 1))
+            buf = np.concatenate([buf, np.zeros(x.shape[:-1] + (pad,), dtype=buf.dtype)], axis=-1)
+        else:
+            # largest m with (m*D + delay)//U <= n_end - 1
+            m_stop = max(self._m_out, ((n_end - 1) * U + U - 1 - self.delay) // D + 1)
+
+        m = np.arange(self._m_out, m_stop)
+        p = m * D + self.delay
+        phase = p % U
+        local = p // U - b0                       # buf index of x[n0]
+
+        out_shape = x.shape[:-1] + (len(m),)
+        y = np.zeros(out_shape, dtype=np.result_type(buf.dtype, self.taps.dtype))
+        if len(m):
+            # win[..., i, j] = buf[..., i + j]; reverse so column j is x[n0 - j]
+            win = np.lib.stride_tricks.sliding_window_view(buf, Lp, axis=-1)
+            for ph in np.unique(phase):
+                sel = phase == ph
+                y[..., sel] = win[..., local[sel] - (Lp - 1), ::-1] @ self.poly[ph]
+
+        if flush:
+            self.reset()
+        else:
+            self._history = buf[..., buf.shape[-1] - (Lp - 1):].copy()
+            self._n_in = n_end
+            self._m_out = m_stop
+        return y
+
+
+@dataclass
+class ResampleParams:
+    up: int = 1
+    down: int = 1
+    half_len: int = 10                # prototype half length per max(up, down)
+    kaiser_beta: float = 5.0
+    taps: Optional[np.ndarray] = None  # custom odd-length prototype at rate up*fs
+
+
+class ResampleBlock(Block):
+    """
+    Rational sample-rate conversion by up/down with a polyphase FIR.
+
+    The output Signal has fs_hz = fs_hz * up / down, so downstream noise
+    bandwidths (B = fs/2 in LNA and mixer) follow the new rate. The filter
+    delay is compensated, so the output stays time aligned with the input
+    (needed e.g. for OFDM demodulation after a round trip).
+
+    In Pipeline.run_stream() the block holds back the outputs that need future
+    input and releases them with the last chunk; chunk lengths change
+    accordingly but the concatenated output matches a single run.
+
+    Parameters
+    ----------
+    up, down :
+        Interpolation and decimation factors.
+    half_len :
+        Prototype half length in units of max(up, down) taps.
+    kaiser_beta :
+        Kaiser window shape of the prototype.
+    taps :
+        Optional custom prototype (odd length, DC gain = up).
+    """
+
+    type_name = "resample"
+
+    def __init__(self, name: str, params: ResampleParams):
+        super().__init__(name=name)
+        self.params = params
+
+        taps = params.taps
+        if taps is None:
+            taps = design_resample_taps(params.up, params.down, params.half_len, params.kaiser_beta)
+        self._rs = PolyphaseResampler(params.up, params.down, taps)
+
+    @property
+    def ratio(self) -> float:
+        return self._rs.up / self._rs.down
+
+    def reset(self, seed: int | None = None) -> None:
+        _ = seed
+        self._rs.reset()
+
+    def process(self, s: Signal) -> Signal:
+        y = self._rs(s.x, flush=s.is_stream_end)
+        return s.copy_with(x=y, fs_hz=s.fs_hz * self.ratio)
+
+
+class UpsampleBlock(ResampleBlock):
+    """Interpolation by an integer factor (ResampleBlock with down = 1)."""
+
+    type_name = "upsample"
+
+    def __init__(self, name: str, factor: int, half_len: int = 10, kaiser_beta: float = 5.0):
+        super().__init__(name, ResampleParams(up=factor, down=1, half_len=half_len, kaiser_beta=kaiser_beta))
+
+
+class DownsampleBlock(ResampleBlock):
+    """Decimation by an integer factor with anti-alias filter (ResampleBlock with up = 1)."""
+
+    type_name = "downsample"
+
+    def __init__(self, name: str, factor: int, half_len: int = 10, kaiser_beta: float = 5.0):
+        super().__init__(name, ResampleParams(up=1, down=factor, half_len=half_len, kaiser_beta=kaiser_beta))
+
+
+class OversampledBlock(Block):
+    """
+    Runs a sub-chain of blocks at `factor` times the input rate:
+
+        upsample -> blocks... -> downsample
+
+    Use it around the nonlinear section (PA, LNA, mixer) so spectral regrowth
+    lands outside the original band instead of aliasing back in band, while
+    the rest of the chain stays at the baseband rate.
+    """
+
+    type_name = "oversampled"
+
+    def __init__(self, name: str, blocks: list[Block], factor: int, half_len: int = 10, kaiser_beta: float = 5.0):
+        super().__init__(name=name)
+        if factor < 1:
+            raise ValueError("factor must be >= 1")
+        self.blocks = blocks
+        self.factor = factor
+        self.up = UpsampleBlock(f"{name}_up", factor, half_len, kaiser_beta)
+        self.down = DownsampleBlock(f"{name}_down", factor, half_len, kaiser_beta)
+
+    def reset(self, seed: int | None = None) -> None:
+        self.up.reset(seed=seed)
+        for blk in self.blocks:
+            blk.reset(seed=seed)
+        self.down.reset(seed=seed)
+
+    def process(self, s: Signal) -> Signal:
+        y = self.up(s)
+        for blk in self.blocks:
+            y = blk(y)
+        return self.down(y)
+
+
+def oversample_section(pipe: Pipeline, first: str, last: str, factor: int, name: str | None = None) -> OversampledBlock:
+    """
+    Replace the blocks first..last (inclusive) of `pipe` by one OversampledBlock,
+    so only that section runs at `factor` times the sample rate.
+
+    Example:
+        oversample_section(pipe, "PA_TX", "PA_TX", factor=4)
+    """
+    i0 = pipe._index_of(first)
+    i1 = pipe._index_of(last)
+    if i1 < i0:
+        raise ValueError(f"Block '{last}' comes before '{first}' in the pipeline")
+
+    section = OversampledBlock(name or f"{first}_x{factor}", pipe.blocks[i0:i1 + 1], factor)
+    pipe.blocks[i0:i1 + 1] = [section]
+    return section
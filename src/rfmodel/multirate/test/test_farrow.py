@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from rfmodel.core.signal import Signal
+from rfmodel.core.pipeline import Pipeline
+from rfmodel.core.factory import build_block
+from rfmodel.multirate.farrow import SampleClockBlock, SampleClockParams, lagrange_farrow_coeffs
+import rfmodel.multirate.registry  # noqa: F401
+
+
+FS = 20e6
+
+
+def test_lagrange_is_exact_for_polynomials_up_to_its_order():
+    n = np.arange(300.0)
+    x = (n / 50) ** 3 - 2 * (n / 50)
+    for order, tol in ((1, 1e-2), (3, 1e-12), (5, 1e-12)):
+        blk = SampleClockBlock("clk", SampleClockParams(delay_samples=3.3, sco_ppm=500.0, order=order))
+        y = blk(Signal(x=x, fs_hz=1e6)).x
+        p = blk.positions(np.arange(y.size), 1e6)
+        ref = (p / 50) ** 3 - 2 * (p / 50)
+        assert np.max(np.abs(y - ref)[6:-6]) < tol
+
+    # rows of C sum to the polynomial in mu that interpolates a constant: 1
+    np.testing.assert_allclose(lagrange_farrow_coeffs(3).sum(axis=1), [1, 0, 0, 0], atol=1e-12)
+    with pytest.raises(ValueError):
+        lagrange_farrow_coeffs(0)
+
+
+def test_delay_and_clock_offset_on_a_tone():
+    n = 200_000
+    f = 1e6
+    x = np.exp(2j * np.pi * f * np.arange(n) / FS)
+
+    for params in (
+        SampleClockParams(delay_samples=0.37),
+        SampleClockParams(sco_ppm=100.0, sco_drift_ppm_per_s=50.0, delay_mod_samples=0.2, delay_mod_hz=1e3),
+    ):
+        blk = SampleClockBlock("clk", params)
+        y = blk(Signal(x=x, fs_hz=FS)).x
+        p = blk.positions(np.arange(y.size), FS)
+        assert y.size == int(np.sum(p <= n - 1))
+        assert np.max(np.abs(y - np.exp(2j * np.pi * f * p / FS))[5:-5]) < 1e-3
+
+    # +100 ppm: about 20 extra samples out of 200k
+    assert abs(y.size - n * (1 + 100e-6)) < 2
+
+
+def test_streaming_and_batches_match_single_run():
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((3, 50_000)) + 1j * rng.standard_normal((3, 50_000))
+    s = Signal(x=x, fs_hz=FS)
+    cfg = {"type": "sample_clock", "name": "clk", "params": {"delay_samples": -1.6, "sco_ppm": -250.0}}
+
+    pipe = Pipeline([build_block(cfg)])
+    y_full, _ = pipe.run(s)
+    assert y_full.fs_hz == FS and y_full.x.shape[0] == 3
+
+    pipe.reset()
+    y_chunks = np.concatenate([out.x for out, _ in pipe.run_stream(s.chunks(4099))], axis=-1)
+    np.testing.assert_allclose(y_chunks, y_full.x, atol=1e-12)
+
+    pipe.reset()
+    np.testing.assert_allclose(pipe.run(s.copy_with(x=x[1]))[0].x, y_full.x[1], atol=1e-12)
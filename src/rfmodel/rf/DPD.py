@@ -0,0 +1,256 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+import numpy as np
+
+from rfmodel.core.block import Block
+from rfmodel.core.signal import Signal
+from rfmodel.core.units import db_to_linear
+from rfmodel.rf.PA_memory import (
+    MemoryPolynomialPABlock,
+    MemoryPolynomialPAParams,
+    memory_polynomial_basis,
+    memory_polynomial_orders,
+)
+
+
+@dataclass
+class DPDParams:
+    coeffs: np.ndarray          # (K, M) complex memory polynomial coefficients
+    odd_only: bool = True
+    nfft: Optional[int] = None
+
+
+def identity_dpd_coeffs(n_orders: int, memory_depth: int) -> np.ndarray:
+    """Coefficients of a pass-through predistorter (a[0, 0] = 1, all others 0)."""
+    a = np.zeros((n_orders, memory_depth), dtype=np.complex128)
+    a[0, 0] = 1.0
+    return a
+
+
+class DPDBlock(Block):
+    """
+    Memory polynomial digital predistorter, placed in the TX chain ahead of the PA.
+
+    Applies the same memory polynomial as MemoryPolynomialPABlock (including
+    streaming filter state); coefficients normally come from train_dpd_ila()
+    and can be swapped with set_coeffs() without rebuilding the pipeline.
+
+    Parameters
+    ----------
+    coeffs :
+        Complex coefficient matrix of shape (K, M).
+    odd_only :
+        Use odd orders only (1, 3, 5, ...).
+    nfft :
+        Overlap-save FFT length, None selects one from the number of taps.
+    """
+
+    type_name = "dpd"
+
+    def __init__(self, name: str, params: DPDParams):
+        super().__init__(name=name)
+        self.params = params
+        self._mp = self._make_polynomial(params.coeffs)
+
+    def _make_polynomial(self, coeffs: np.ndarray) -> MemoryPolynomialPABlock:
+        return MemoryPolynomialPABlock(
+            name=f"{self.name}_mp",
+            params=MemoryPolynomialPAParams(
+                coeffs=coeffs, odd_only=self.params.odd_only, nfft=self.params.nfft
+            ),
+        )
+
+    @property
+    def coeffs(self) -> np.ndarray:
+        return self._mp.coeffs
+
+    def set_coeffs(self, coeffs: np.ndarray) -> None:
+        """Load new coefficients (e.g. after training). Clears filter state."""
+        self.params.coeffs = np.asarray(coeffs, dtype=np.complex128)
+        self._mp = self._make_polynomial(self.params.coeffs)
+
+    def reset(self, seed: int | None = None) -> None:
+        self._mp.reset(seed=seed)
+
+    def process(self, s: Signal) -> Signal:
+        return self._mp.process(s)
+
+
+class MemoryPolynomialLS:
+    """
+    Blocked least-squares fit of memory polynomial coefficients.
+
+    Solves  min_a || Phi(u) a - d ||^2  through the normal equations
+
+        (Phi^H Phi + lambda I) a = Phi^H d
+
+    where the Gram matrix Phi^H Phi (P x P, P = K*M) and Phi^H d are
+    accumulated chunk by chunk. Memory use is O(P^2 + chunk*P), independent
+    of the total capture length. The last M-1 input samples are carried
+    between update() calls so chunk boundaries do not lose delay terms.
+
+    The system is equilibrated to a unit diagonal before solving, so
+    `regularization` (lambda) is relative to the column energies.
+    """
+
+    def __init__(self, n_orders: int, memory_depth: int, odd_only: bool = True, regularization: float = 0.0):
+        if memory_depth < 1:
+            raise ValueError("memory_depth must be >= 1")
+        if regularization < 0:
+            raise ValueError("regularization must be >= 0")
+
+        self.orders = memory_polynomial_orders(n_orders, odd_only)
+        self.memory_depth = memory_depth
+        self.regularization = regularization
+        self.n_coeffs = len(self.orders) * memory_depth
+        self.reset()
+
+    def reset(self) -> None:
+        P = self.n_coeffs
+        self.gram = np.zeros((P, P), dtype=np.complex128)
+        self.cross = np.zeros(P, dtype=np.complex128)
+        self.energy = 0.0
+        self.n_samples = 0
+        self._u_prev = np.zeros(self.memory_depth - 1, dtype=np.complex128)
+
+    def update(self, u: np.ndarray, d: np.ndarray) -> None:
+        """Accumulate one chunk of basis input u and desired output d (1D, same length)."""
+        u = np.asarray(u, dtype=np.complex128)
+        d = np.asarray(d, dtype=np.complex128)
+        if u.shape != d.shape or u.ndim != 1:
+            raise ValueError("u and d must be 1D arrays of the same length")
+
+        phi = memory_polynomial_basis(u, self.orders, self.memory_depth, x_prev=self._u_prev)
+        phi = phi.reshape(len(u), self.n_coeffs)
+
+        self.gram += phi.conj().T @ phi
+        self.cross += phi.conj().T @ d
+        self.energy += float(np.vdot(d, d).real)
+        self.n_samples += len(u)
+
+        if self.memory_depth > 1:
+            self._u_prev = np.concatenate([self._u_prev, u])[-(self.memory_depth - 1):]
+
+    def solve(self) -> np.ndarray:
+        """Return the (K, M) coefficient matrix for the data accumulated so far."""
+        if self.n_samples == 0:
+            raise RuntimeError("No data accumulated; call update() first")
+
+        # Basis columns span many decades (x, x|x|^2, x|x|^4 ...): equilibrate the
+        # Gram matrix to unit diagonal before regularizing and solving.
+        diag = np.sqrt(np.maximum(self.gram.diagonal().real, np.finfo(float).tiny))
+        R = self.gram / np.outer(diag, diag)
+        if self.regularization > 0:
+            R = R + self.regularization * np.eye(self.n_coeffs)
+        rhs = self.cross / diag
+
+        try:
+            b = np.linalg.solve(R, rhs)
+        except np.linalg.LinAlgError:
+            b = np.linalg.lstsq(R, rhs, rcond=None)[0]
+
+        return (b / diag).reshape(len(self.orders), self.memory_depth)
+
+    def nmse_db(self, coeffs: np.ndarray) -> float:
+        """Normalized fit error of `coeffs` on the accumulated data, in dB."""
+        a = np.asarray(coeffs, dtype=np.complex128).ravel()
+        err = self.energy - 2.0 * np.vdot(a, self.cross).real + np.vdot(a, self.gram @ a).real
+        return 10.0 * np.log10(max(err, np.finfo(float).tiny) / self.energy)
+
+
+def _pa_gain_db(pa: Block) -> float:
+    p = getattr(pa, "params", None)
+    if hasattr(p, "gain_db"):
+        return float(p.gain_db)
+    if hasattr(getattr(p, "pa", None), "gain_db"):
+        return float(p.pa.gain_db)
+    raise ValueError(f"Cannot infer the gain of block '{pa.name}'; pass target_gain_db")
+
+
+def train_dpd_ila(
+    pa: Block,
+    s: Signal | Iterable[Signal] | Callable[[], Iterable[Signal]],
+    n_orders: int = 3,
+    memory_depth: int = 3,
+    *,
+    odd_only: bool = True,
+    n_iterations: int = 2,
+    target_gain_db: float | None = None,
+    chunk_size: int = 65536,
+    regularization: float = 1e-9,
+    dpd: DPDBlock | None = None,
+) -> DPDBlock:
+    """
+    Indirect-learning (ILA) training of a memory polynomial DPD.
+
+    Each iteration runs the excitation through DPD -> PA chunk by chunk,
+    fits a post-inverse mapping y/g -> u with MemoryPolynomialLS, and copies
+    the result into the predistorter. The capture is never held as a basis
+    matrix, so it can be far larger than RAM (e.g. a memmapped Signal, or
+    lambda: SignalFile.open("cap").chunks(1 << 20)).
+
+    Parameters
+    ----------
+    pa :
+        PA block to linearize (PABlock, memory PA models, ...).
+    s :
+        Training excitation: one Signal, a re-iterable sequence of chunk
+        Signals, or a callable returning a fresh chunk iterator (called once
+        per iteration). A one-shot iterator is only accepted with
+        n_iterations = 1, since every iteration reads the whole excitation.
+    n_orders, memory_depth, odd_only :
+        Size of the memory polynomial basis.
+    n_iterations :
+        Number of ILA iterations.
+    target_gain_db :
+        Linearized power gain. Defaults to the PA's small-signal gain_db.
+    chunk_size :
+        Samples per chunk when s is a single Signal.
+    regularization :
+        Ridge factor, relative to the (unit) diagonal of the equilibrated Gram matrix.
+    dpd :
+        Existing DPDBlock to update. A new one named 'DPD' is created if None.
+
+    Returns
+    -------
+    dpd : DPDBlock with the trained coefficients.
+    """
+    if n_iterations < 1:
+        raise ValueError("n_iterations must be >= 1")
+    if not isinstance(s, Signal) and not callable(s) and iter(s) is s and n_iterations > 1:
+        raise ValueError(
+            "s is a one-shot iterator, but every ILA iteration reads the whole excitation; "
+            "pass a callable that returns a fresh chunk iterator (e.g. lambda: f.chunks(n)) "
+            "or n_iterations=1"
+        )
+
+    g = np.sqrt(db_to_linear(target_gain_db if target_gain_db is not None else _pa_gain_db(pa)))
+
+    if dpd is None:
+        dpd = DPDBlock(
+            name="DPD",
+            params=DPDParams(coeffs=identity_dpd_coeffs(n_orders, memory_depth), odd_only=odd_only),
+        )
+
+    ls = MemoryPolynomialLS(n_orders, memory_depth, odd_only=odd_only, regularization=regularization)
+
+    for _ in range(n_iterations):
+        ls.reset()
+        dpd.reset()
+        pa.reset()
+
+        if isinstance(s, Signal):
+            chunks = s.chunks(chunk_size)
+        else:
+            chunks = s() if callable(s) else s
+        for chunk in chunks:
+            u = dpd.process(chunk)
+            y = pa.process(u)
+            ls.update(np.asarray(y.x) / g, np.asarray(u.x))
+
+        dpd.set_coeffs(ls.solve())
+
+    dpd.reset()
+    pa.reset()
+    return dpd
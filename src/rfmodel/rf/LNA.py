@@ -7,6 +7,8 @@ from rfmodel.core.units import db_to_linear, dbm_to_w
 from rfmodel.core.random import get_rng  # or however you manage RNG
 from rfmodel.core.signal import Signal
 from rfmodel.core.block import Block
+from rfmodel.core.fusion import Cubic, Noise
+from rfmodel.core.kernels import get_kernel
 
 
 @dataclass
@@ -40,10 +42,9 @@ class LNABlock(Block):
         self.params = params
         self._rng = get_rng(seed)
 
-    def process(self, s: Signal) -> Signal:
+    def _coefficients(self) -> tuple[float, float]:
         p = self.params
-        x = s.x
-        
+
         # 1. Linear gain
         G = db_to_linear(p.gain_db)
         alpha = np.sqrt(G)
@@ -52,8 +53,11 @@ class LNABlock(Block):
         # Relate IIP3 to the cubic coefficient alpha_3 (complex)
         Pin_iip3_w = dbm_to_w(p.IP3_dbm)
         beta = alpha / (2.0 * Pin_iip3_w)
-        
-        y = alpha * x - beta * (np.abs(x)**2) * x
+        return alpha, beta
+
+    def _noise_sigma(self, fs_hz: float) -> float:
+        p = self.params
+        G = db_to_linear(p.gain_db)
 
         # ---- Added output noise from NF ----
         # Added output noise PSD (one-sided): N0_out_added = (F - 1) * k * T * G  [W/Hz]
@@ -61,11 +65,26 @@ class LNABlock(Block):
         k = 1.380649e-23
         noise_psd_w_per_hz = (F - 1.0) * k * p.temp_k * G
 
-        B_hz = s.fs_hz / 2.0
+        B_hz = fs_hz / 2.0  # actual rate, e.g. fs*factor inside an OversampledBlock
         Pn_out_added_w = noise_psd_w_per_hz * B_hz  # [W] = E[|n|^2] per sample
 
         # Proper complex Gaussian: E[|n|^2] = 2*sigma^2  => sigma = sqrt(P/2)
-        sigma = np.sqrt(Pn_out_added_w / 2.0)
+        return np.sqrt(Pn_out_added_w / 2.0)
+
+    def supports_fusion(self) -> bool:
+        return True
+
+    def fusion_stages(self, fs_hz: float) -> list:
+        alpha, beta = self._coefficients()
+        return [Cubic(alpha, beta), Noise(self._rng, self._noise_sigma(fs_hz))]
+
+    def process(self, s: Signal) -> Signal:
+        x = s.x
+        alpha, beta = self._coefficients()
+        
+        y = get_kernel("cubic")(x, alpha, beta)
+
+        sigma = self._noise_sigma(s.fs_hz)
         n = (
             self._rng.normal(0.0, sigma, size=y.shape)
             + 1j * self._rng.normal(0.0, sigma, size=y.shape)
@@ -6,6 +6,9 @@ from rfmodel.core.units import db_to_linear, dbm_to_w
 from rfmodel.core.random import get_rng
 from rfmodel.core.signal import Signal
 from rfmodel.core.block import Block
+from rfmodel.core.fusion import Cubic, Noise
+from rfmodel.core.kernels import get_kernel
+from rfmodel.rf.sigma_delta import FracNParams, frac_n_phase_spectrum, mash_psd
 
 @dataclass
 class PLLParams:
@@ -15,6 +18,7 @@ class PLLParams:
     Tu: float  # OFDM usefull length of symbol length, i.e length of FFT interval
     enable_ofdm_weighting: bool = False #flag to enable OFDM weighting function
     f_range_limits: tuple[float, float] = (10, 1e10) # offset frequencies to evaluate the Phase noise over
+    frac_n: FracNParams | None = None # sigma-delta fractional-N divider (quantization noise and spurs)
 
 class PLL:
     def __init__(self, params: PLLParams, rng):
@@ -23,7 +27,7 @@ class PLL:
         self.alpha = 10**(float(self.p.VCO_Phase_Noise_dBc[0]) / 10) * (float(self.p.VCO_Phase_Noise_dBc[1]))**2
         self.SLF = 10**(self.p.SLF_dBc / 10)
 
-    def get_psd(self, f: np.ndarray) -> np.ndarray:
+    def get_psd(self, f: np.ndarray, include_sdm: bool = True) -> np.ndarray:
         f_L = self.p.f_L
         
         # Avoid division by zero at f=0
@@ -33,6 +37,10 @@ class PLL:
         hp_factor = (f_safe / f_L)**2 / (1 + (f_safe / f_L)**2)  # high-pass: VCO noise
         
         S_phi = self.SLF * lp_factor + (self.alpha / f_safe**2) * hp_factor
+
+        # MASH quantization noise through the same loop low pass (spurs are lines, see generate_lo_impairment)
+        if include_sdm and self.p.frac_n is not None:
+            S_phi = S_phi + mash_psd(f_safe, self.p.frac_n.f_ref_hz, self.p.frac_n.order, f_L)
         
         if self.p.enable_ofdm_weighting:
             denom = (np.pi * f_safe * self.p.Tu)**2
@@ -51,14 +59,18 @@ class PLL:
         df = fs / N
         f = np.fft.rfftfreq(N, 1/fs)
         
-        #Get the PSD for these specific frequencies
-        S_phi = self.get_psd(f)
+        #Get the PSD for these specific frequencies (sigma-delta noise is added as a realization below)
+        S_phi = self.get_psd(f, include_sdm=False)
 
         #Convert PSD to frequency-domain noise (amplitude scaling)
         phi_f = (self._rng.standard_normal(len(f)) + 1j * self._rng.standard_normal(len(f)))
         phi_f *= np.sqrt(S_phi * df) * (N / 2)
         phi_f[0] = 0.0  # zero DC: a constant phase offset has no physical meaning
 
+        if self.p.frac_n is not None:
+            # sigma-delta divider noise and spur lines on the same frequency grid
+            phi_f = phi_f + frac_n_phase_spectrum(self.p.frac_n, self.p.f_L, N, fs, self._rng)
+
         phi_t = np.fft.irfft(phi_f, n=N)
         
         #Return the LO phasor
@@ -84,6 +96,36 @@ class MixerBlock(Block):
             self.pll = PLL(self.params.pll, self._rng)
         else:
             self.pll = None
+
+    def supports_fusion(self) -> bool:
+        # the PLL phase noise is generated for the whole signal at once
+        return self.pll is None
+
+    def _coefficients(self) -> tuple[float, float]:
+        p = self.params
+        G = db_to_linear(p.gain_db)
+        alpha_lin = np.sqrt(G)
+        beta = alpha_lin / (2.0 * dbm_to_w(p.iip3_dbm))
+        return alpha_lin, beta
+
+    def _noise_sigma(self, fs_hz: float) -> float:
+        p = self.params
+        G = db_to_linear(p.gain_db)
+        F = db_to_linear(p.nf_db)
+        k = 1.380649e-23
+
+        noise_psd_w_per_hz = (F - 1.0) * k * p.temp_k * G
+        B_hz = fs_hz / 2.0  # actual rate, e.g. fs*factor inside an OversampledBlock
+        Pn_out_added_w = noise_psd_w_per_hz * B_hz
+
+        return np.sqrt(Pn_out_added_w / 2.0)
+
+    def fusion_stages(self, fs_hz: float) -> list:
+        if self.params.mixer_ideal:
+            return []
+        alpha_lin, beta = self._coefficients()
+        return [Cubic(alpha_lin, beta), Noise(self._rng, self._noise_sigma(fs_hz))]
+
     def process(self, s: Signal) -> Signal:
         p = self.params
         x = s.x
@@ -96,21 +138,11 @@ class MixerBlock(Block):
             return s.copy_with(x=x) # just skip the next stages
             
 
-        G = db_to_linear(p.gain_db)
-        alpha_lin = np.sqrt(G)
-
-        beta = alpha_lin / (2.0 * dbm_to_w(p.iip3_dbm))
-        y = alpha_lin * x - beta * (np.abs(x)**2) * x
+        alpha_lin, beta = self._coefficients()
+        y = get_kernel("cubic")(x, alpha_lin, beta)
 
         # Noise stage
-        F = db_to_linear(p.nf_db)
-        k = 1.380649e-23
-
-        noise_psd_w_per_hz = (F - 1.0) * k * p.temp_k * G
-        B_hz = s.fs_hz / 2.0
-        Pn_out_added_w = noise_psd_w_per_hz * B_hz
-
-        sigma = np.sqrt(Pn_out_added_w / 2.0)
+        sigma = self._noise_sigma(s.fs_hz)
         n = (
             self._rng.normal(0.0, sigma, size=y.shape)
             + 1j * self._rng.normal(0.0, sigma, size=y.shape)
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 import numpy as np
 
 from rfmodel.core.block import Block
+from rfmodel.core.fusion import Cubic, RappAMAM
+from rfmodel.core.kernels import get_kernel
 from rfmodel.core.signal import Signal
 from rfmodel.core.units import db_to_linear, dbm_to_w
 
@@ -62,20 +64,21 @@ class PABlock(Block):
 
         self.beta_cubic = (1-c) * c**2 * ( self.alpha**3 / (P1dB_out_w) )
 
+    def supports_fusion(self) -> bool:
+        return True
+
+    def fusion_stages(self, fs_hz: float) -> list:
+        _ = fs_hz
+        if self.params.enable_cubic:
+            return [Cubic(self.alpha, self.beta_cubic)]
+        return [RappAMAM(self.g, self.Asat, self.p)]
+
     def process(self, s: Signal) -> Signal:
         x = s.x
 
         if self.params.enable_cubic:
-            y = self.alpha * x - self.beta_cubic * (np.abs(x) ** 2) * x
+            y = get_kernel("cubic")(x, self.alpha, self.beta_cubic)
             return s.copy_with(x=y)
 
-        r = np.abs(x)
-        r_lin = self.g * r
-        r_out = r_lin / (1.0 + (r_lin / self.Asat) ** (2.0 * self.p)) ** (1.0 / (2.0 * self.p))
-
-        gain_amp = np.zeros_like(r_out)
-        nz = r > 0
-        gain_amp[nz] = r_out[nz] / r[nz]
-
-        y = gain_amp * x
+        y = get_kernel("rapp_amam")(x, self.g, self.Asat, self.p)
         return s.copy_with(x=y)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Optional
+import numpy as np
+
+from rfmodel.core.block import Block
+from rfmodel.core.signal import Signal
+from rfmodel.core.dsp import StreamingFIR, fir_filter
+from rfmodel.rf.PA import PABlock, PAParams
+
+
+def memory_polynomial_orders(n_orders: int, odd_only: bool = True) -> np.ndarray:
+    """
+    Nonlinearity orders k used by the memory polynomial basis x*|x|^(k-1).
+    odd_only=True gives 1, 3, 5, ... otherwise 1, 2, 3, ...
+    """
+    if n_orders < 1:
+        raise ValueError("n_orders must be >= 1")
+    step = 2 if odd_only else 1
+    return 1 + step * np.arange(n_orders)
+
+
+def memory_polynomial_branches(x: np.ndarray, orders: np.ndarray) -> np.ndarray:
+    """
+    Memoryless basis branches x*|x|^(k-1) for every order k.
+
+    x has shape (..., N); the result has shape (..., K, N). Built with one
+    broadcast power, no loop over orders.
+    """
+    x = np.asarray(x)
+    powers = np.asarray(orders)[:, None] - 1
+    return x[..., None, :] * np.abs(x)[..., None, :] ** powers
+
+
+def memory_polynomial_basis(
+    x: np.ndarray,
+    orders: np.ndarray,
+    memory_depth: int,
+    x_prev: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Memory polynomial regression matrix.
+
+    Column (k, m) holds x[n-m] * |x[n-m]|^(orders[k]-1), so for coefficients
+    a of shape (K, M)
+
+        y = basis.reshape(N, K*M) @ a.ravel()
+
+    reproduces the memory polynomial output.
+
+    Parameters
+    ----------
+    x :
+        1D input samples, length N.
+    orders :
+        Nonlinearity orders (see memory_polynomial_orders).
+    memory_depth :
+        Number of delay taps M.
+    x_prev :
+        The M-1 samples preceding x (from an earlier chunk). Zeros if None.
+
+    Returns
+    -------
+    basis : ndarray, shape (N, K, M)
+        Strided view onto the branch signals, no per-delay copies.
+    """
+    x = np.asarray(x)
+    if x.ndim != 1:
+        raise ValueError("memory_polynomial_basis expects a 1D array")
+    if memory_depth < 1:
+        raise ValueError("memory_depth must be >= 1")
+
+    n_hist = memory_depth - 1
+    if x_prev is None:
+        x_prev = np.zeros(n_hist, dtype=x.dtype)
+    x_prev = np.asarray(x_prev)
+    if x_prev.shape != (n_hist,):
+        raise ValueError(f"x_prev must have length memory_depth - 1 = {n_hist}")
+
+    x_ext = np.concatenate([x_prev, x])
+    branches = memory_polynomial_branches(x_ext, orders)           # (K, N+M-1)
+
+    # window[n, m'] = branches[n + m']; reverse m' so column m is delay m
+    win = np.lib.stride_tricks.sliding_window_view(branches, memory_depth, axis=-1)
+    return win[:, :, ::-1].transpose(1, 0, 2)
+
+
+@dataclass
+class MemoryPolynomialPAParams:
+    coeffs: np.ndarray          # (K, M) complex; row k -> order, column m -> delay
+    odd_only: bool = True       # orders 1,3,5,... (True) or 1,2,3,... (False)
+    nfft: Optional[int] = None  # overlap-save block length (None = automatic)
+
+
+class MemoryPolynomialPABlock(Block):
+    """
+    Memory polynomial PA model:
+
+        y[n] = sum_k sum_m a[k, m] * x[n-m] * |x[n-m]|^(order_k - 1)
+
+    Signal convention
+    -----------------
+    Power-normalized complex envelope: |x|^2 is instantaneous power in W,
+    so a[0, 0] = sqrt(G) for a PA with small-signal power gain G.
+
+    Each order branch is filtered by its row of taps with FFT overlap-save
+    (direct convolution for very short memory), so cost grows as O(N log M)
+    rather than O(N*M). The last M-1 input samples are kept between calls,
+    i.e. chunked (streaming) processing gives the same result as a single
+    call. reset() clears that history.
+
+    Parameters
+    ----------
+    coeffs :
+        Complex coefficient matrix of shape (K, M).
+    odd_only :
+        Use odd orders only (1, 3, 5, ...).
+    nfft :
+        Overlap-save FFT length, None selects one from the number of taps.
+    """
+
+    type_name = "pa_memory_poly"
+
+    def __init__(self, name: str, params: MemoryPolynomialPAParams):
+        super().__init__(name=name)
+        self.params = params
+
+        coeffs = np.atleast_2d(np.asarray(params.coeffs, dtype=np.complex128))
+        if coeffs.ndim != 2:
+            raise ValueError("coeffs must be a 2D (orders x memory depth) array")
+
+        self.coeffs = coeffs
+        self.orders = memory_polynomial_orders(coeffs.shape[0], params.odd_only)
+        self.memory_depth = coeffs.shape[1]
+        self._fir = StreamingFIR(coeffs, nfft=params.nfft)
+
+    def reset(self, seed: int | None = None) -> None:
+        _ = seed
+        self._fir.reset()
+
+    def process(self, s: Signal) -> Signal:
+        x_ext = self._fir.extend(np.asarray(s.x))
+        branches = memory_polynomial_branches(x_ext, self.orders)   # (..., K, N+M-1)
+
+        y = fir_filter(branches, self.coeffs, nfft=self.params.nfft).sum(axis=-2)
+        return s.copy_with(x=y)
+
+
+@dataclass
+class WienerHammersteinPAParams:
+    pa: PAParams                                                        # static AM-AM stage
+    h_in: np.ndarray = field(default_factory=lambda: np.ones(1))     # input (Wiener) filter taps
+    h_out: np.ndarray = field(default_factory=lambda: np.ones(1))    # output (Hammerstein) filter taps
+    nfft: Optional[int] = None
+
+
+class WienerHammersteinPABlock(Block):
+    """
+    Wiener-Hammerstein PA model: FIR h_in -> memoryless PABlock -> FIR h_out.
+
+    The static stage is the existing PABlock (Rapp or cubic AM-AM), so gain_db
+    and p1db_out_dbm keep their meaning when both filters are normalized to
+    unity DC gain. The two filters use FFT overlap-save and keep their input
+    history between calls for chunked (streaming) runs; reset() clears it.
+
+    Parameters
+    ----------
+    pa :
+        PAParams of the static nonlinearity.
+    h_in, h_out :
+        Complex FIR taps of the input and output linear sections.
+    nfft :
+        Overlap-save FFT length, None selects one from the number of taps.
+    """
+
+    type_name = "pa_wiener_hammerstein"
+
+    def __init__(self, name: str, params: WienerHammersteinPAParams):
+        super().__init__(name=name)
+        self.params = params
+
+        self.pa = PABlock(name=f"{name}_static", params=params.pa)
+        self._fir_in = StreamingFIR(np.asarray(params.h_in), nfft=params.nfft)
+        self._fir_out = StreamingFIR(np.asarray(params.h_out), nfft=params.nfft)
+
+    def reset(self, seed: int | None = None) -> None:
+        self.pa.reset(seed=seed)
+        self._fir_in.reset()
+        self._fir_out.reset()
+
+    def process(self, s: Signal) -> Signal:
+        v = self._fir_in(np.asarray(s.x))
+        w = self.pa.process(s.copy_with(x=v)).x
+        y = self._fir_out(w)
+        return s.copy_with(x=y)
@@ -1,18 +1,47 @@
 from .LNA import LNABlock, LNAParams
 from .PA import PABlock, PAParams
+from .PA_memory import (
+    MemoryPolynomialPABlock,
+    MemoryPolynomialPAParams,
+    WienerHammersteinPABlock,
+    WienerHammersteinPAParams,
+)
+from .DPD import DPDBlock, DPDParams, MemoryPolynomialLS, train_dpd_ila
 from .Mixer_PLL_block import PLL, PLLParams, MixerBlock, MixerParams
-from .registry import _build_lna, _build_pa, _build_mixer
+from .sigma_delta import FracNParams, mash_sequence, mash_psd
+from .registry import (
+    _build_lna,
+    _build_pa,
+    _build_mixer,
+    _build_pa_memory_poly,
+    _build_pa_wiener_hammerstein,
+    _build_dpd,
+)
 
 __all__ = [
     "LNABlock", 
     "LNAParams", 
     "PABlock", 
     "PAParams", 
+    "MemoryPolynomialPABlock",
+    "MemoryPolynomialPAParams",
+    "WienerHammersteinPABlock",
+    "WienerHammersteinPAParams",
+    "DPDBlock",
+    "DPDParams",
+    "MemoryPolynomialLS",
+    "train_dpd_ila",
     "PLL", 
     "PLLParams", 
     "MixerBlock", 
     "MixerParams",
+    "FracNParams",
+    "mash_sequence",
+    "mash_psd",
     "_build_lna",
     "_build_pa",
-    "_build_mixer"
+    "_build_mixer",
+    "_build_pa_memory_poly",
+    "_build_pa_wiener_hammerstein",
+    "_build_dpd",
 ]
\ No newline at end of file
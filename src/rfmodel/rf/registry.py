@@ -4,7 +4,15 @@ import numpy as np
 from rfmodel.core.factory import register_block
 from rfmodel.rf.LNA import LNABlock, LNAParams
 from rfmodel.rf.PA import PABlock, PAParams
+from rfmodel.rf.PA_memory import (
+    MemoryPolynomialPABlock,
+    MemoryPolynomialPAParams,
+    WienerHammersteinPABlock,
+    WienerHammersteinPAParams,
+)
+from rfmodel.rf.DPD import DPDBlock, DPDParams
 from rfmodel.rf.Mixer_PLL_block import MixerBlock, MixerParams, PLLParams
+from rfmodel.rf.sigma_delta import FracNParams
 
 @register_block("lna")
 def _build_lna(cfg: dict) -> LNABlock:
@@ -34,6 +42,62 @@ def _build_pa(cfg: dict) -> PABlock:
     )
     return PABlock(name=name, params=params)
 
+def _complex_array(v) -> np.ndarray:
+    """
+    YAML has no complex type: accept numbers or strings like "0.9-0.1j"
+    in (nested) lists.
+    """
+    def conv(c):
+        if isinstance(c, (list, tuple)):
+            return [conv(e) for e in c]
+        return complex(c)
+    return np.asarray(conv(v), dtype=np.complex128)
+
+
+@register_block("pa_memory_poly")
+def _build_pa_memory_poly(cfg: dict) -> MemoryPolynomialPABlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    params = MemoryPolynomialPAParams(
+        coeffs=_complex_array(p["coeffs"]),
+        odd_only=bool(p.get("odd_only", True)),
+        nfft=p.get("nfft", None),
+    )
+    return MemoryPolynomialPABlock(name=name, params=params)
+
+
+@register_block("pa_wiener_hammerstein")
+def _build_pa_wiener_hammerstein(cfg: dict) -> WienerHammersteinPABlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    pa_params = PAParams(
+        gain_db=float(p["gain_db"]),
+        p1db_out_dbm=float(p["p1db_out_dbm"]),
+        smoothness_p=float(p.get("smoothness_p", 2.0)),
+        enable_cubic=bool(p.get("enable_cubic", False)),
+    )
+    params = WienerHammersteinPAParams(
+        pa=pa_params,
+        h_in=_complex_array(p.get("h_in", [1.0])),
+        h_out=_complex_array(p.get("h_out", [1.0])),
+        nfft=p.get("nfft", None),
+    )
+    return WienerHammersteinPABlock(name=name, params=params)
+
+@register_block("dpd")
+def _build_dpd(cfg: dict) -> DPDBlock:
+    name = cfg["name"]
+    p = cfg.get("params", {})
+
+    params = DPDParams(
+        coeffs=_complex_array(p["coeffs"]),
+        odd_only=bool(p.get("odd_only", True)),
+        nfft=p.get("nfft", None),
+    )
+    return DPDBlock(name=name, params=params)
+
 @register_block("mixer")
 def _build_mixer(cfg: dict) -> MixerBlock:
     name = cfg["name"]
@@ -44,6 +108,19 @@ def _build_mixer(cfg: dict) -> MixerBlock:
     pll_cfg = p.get("pll")
     pll_params = None
     if pll_cfg:
+        frac_cfg = pll_cfg.get("frac_n")
+        frac_n = None
+        if frac_cfg:
+            ref_spur = frac_cfg.get("ref_spur_dbc", None)
+            frac_n = FracNParams(
+                f_ref_hz=float(frac_cfg["f_ref_hz"]),
+                frac=float(frac_cfg["frac"]),
+                order=int(frac_cfg.get("order", 3)),
+                modulus_bits=int(frac_cfg.get("modulus_bits", 24)),
+                dither=bool(frac_cfg.get("dither", True)),
+                frac_spurs_dbc=tuple(float(v) for v in frac_cfg.get("frac_spurs_dbc", ())),
+                ref_spur_dbc=float(ref_spur) if ref_spur is not None else None,
+            )
         pll_params = PLLParams(
             VCO_Phase_Noise_dBc=tuple(pll_cfg.get("VCO_PhaseNoise")),
             SLF_dBc=float(pll_cfg.get("LF_noise_floor")),
@@ -51,6 +128,7 @@ def _build_mixer(cfg: dict) -> MixerBlock:
             Tu=float(pll_cfg.get("Tu", 0.0)),  # must exist if weighting is used
             enable_ofdm_weighting=bool(pll_cfg.get("enable_ofdm_weighting", False)),
             f_range_limits=tuple(pll_cfg.get("Foffset_Range", (10, 1e10))),
+            frac_n=frac_n,
         )
     params = MixerParams(
         gain_db=float(p["gain_db"]),
@@ -0,0 +1,133 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from math import comb
+from typing import Optional
+import numpy as np
+
+
+@dataclass
+class FracNParams:
+    f_ref_hz: float                         # PFD reference frequency
+    frac: float                             # fractional part of the division ratio, 0 <= frac < 1
+    order: int = 3                          # MASH 1-1-...-1 stages
+    modulus_bits: int = 24
+    dither: bool = True                     # LSB dither on the first accumulator input
+    frac_spurs_dbc: tuple[float, ...] = ()  # lines at k * f_frac, k = 1, 2, ... (coupling spurs)
+    ref_spur_dbc: Optional[float] = None    # line at f_ref
+
+
+def _diff(x: np.ndarray) -> np.ndarray:
+    # 1 - z^-1 with zero initial state
+    d = x.copy()
+    d[1:] -= x[:-1]
+    return d
+
+
+def mash_sequence(
+    frac: float,
+    n: int,
+    *,
+    order: int = 3,
+    modulus_bits: int = 24,
+    dither: bool = False,
+    rng: Optional[np.random.Generator] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Output of a MASH 1-1-...-1 sigma-delta modulator (n samples at f_ref).
+
+    Each accumulator stage is evaluated for all samples at once: with
+    S_l = cumsum(input of stage l), the carry is c_l = diff(S_l >> bits)
+    and the residue S_l & (M - 1) is the input of the next stage. The
+    carries are combined as y = sum_l (1 - z^-1)^(l-1) c_l, so the divider
+    offset y averages to K / M with K = round(frac * M).
+
+    Returns (y, phase_cycles): the divider offset sequence (int) and the
+    accumulated division error sum(y - u / M) in VCO cycles (u: the
+    accumulator input, K plus dither). The sum telescopes to
+    -(S_1 & (M - 1)) / M + sum_{l>=2} (1 - z^-1)^(l-2) c_l, so no long
+    running sum is formed.
+    """
+    if order < 1:
+        raise ValueError("order must be >= 1")
+    if not 0.0 <= frac < 1.0:
+        raise ValueError("frac must be in [0, 1)")
+    M = 1 << modulus_bits
+    K = int(round(frac * M))
+
+    u = np.full(n, K, dtype=np.int64)
+    if dither:
+        rng = rng if rng is not None else np.random.default_rng()
+        u += rng.integers(0, 2, size=n)
+    S = np.cumsum(u)
+
+    y = np.zeros(n, dtype=np.int64)
+    phase_cycles = -(S & (M - 1)) / M
+    for level in range(order):
+        d = _diff(S >> modulus_bits)                # carry c_l
+        for i in range(level):
+            if i == level - 1:
+                phase_cycles += d
+            d = _diff(d)
+        y += d
+        if level < order - 1:
+            S = np.cumsum(S & (M - 1))
+    return y, phase_cycles
+
+
+def mash_psd(f: np.ndarray, f_ref_hz: float, order: int, f_L: float) -> np.ndarray:
+    """
+    One-sided phase PSD (rad^2/Hz) of MASH quantization noise at the PLL
+    output: (2 pi)^2 / (6 f_ref) * |2 sin(pi f / f_ref)|^(2 (order - 1)),
+    low-pass filtered by the loop as the reference noise in PLL.get_psd.
+    """
+    f = np.asarray(f, dtype=float)
+    shaped = (2 * np.pi) ** 2 / (6 * f_ref_hz) * np.abs(2 * np.sin(np.pi * f / f_ref_hz)) ** (2 * (order - 1))
+    return shaped / (1 + (f / f_L) ** 2)
+
+
+def frac_spur_lines(p: FracNParams) -> tuple[np.ndarray, np.ndarray]:
+    """Offsets (Hz) and levels (dBc) of the deterministic spur lines."""
+    f_frac = p.f_ref_hz * min(p.frac, 1.0 - p.frac)
+    offsets = [k * f_frac for k in range(1, len(p.frac_spurs_dbc) + 1)]
+    levels = list(p.frac_spurs_dbc)
+    if p.ref_spur_dbc is not None:
+        offsets.append(p.f_ref_hz)
+        levels.append(p.ref_spur_dbc)
+    return np.asarray(offsets, dtype=float), np.asarray(levels, dtype=float)
+
+
+def frac_n_phase_spectrum(p: FracNParams, f_L: float, N: int, fs: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    Output phase of the sigma-delta divider of a fractional-N PLL plus its
+    spur lines, as the rfft bins of an N-sample phase at fs (add to other
+    phase spectra, then np.fft.irfft(..., n=N)).
+
+    The MASH division error, accumulated over the same duration at f_ref,
+    is transformed once and filtered by the closed-loop low pass
+    1 / (1 + j f / f_L) (|H|^2 is the reference-noise factor of
+    PLL.get_psd); bins up to fs / 2 are kept, so nothing aliases. Spurs are
+    narrowband PM written directly as lines on the nearest bin: a line of
+    L dBc is a phase tone of amplitude 2 * 10^(L / 20) rad, with a random
+    phase. Lines at or above fs / 2 are not representable and are dropped.
+    """
+    n_bins = N // 2 + 1
+    n_ref = max(2, int(round(N * p.f_ref_hz / fs)))
+    _, cycles = mash_sequence(p.frac, n_ref, order=p.order, modulus_bits=p.modulus_bits,
+                              dither=p.dither, rng=rng)
+    X = np.fft.rfft(2 * np.pi * cycles)[:n_bins]
+    f = np.arange(X.size) * p.f_ref_hz / n_ref
+    X = X / (1 + 1j * f / f_L) * (N / n_ref)
+
+    phi_f = np.zeros(n_bins, dtype=complex)
+    phi_f[:X.size] = X
+    phi_f[0] = 0.0
+
+    offsets, levels = frac_spur_lines(p)
+    k = np.rint(offsets * N / fs).astype(np.int64)
+    keep = (k > 0) & (k < N / 2)
+    if keep.any():
+        beta = 2 * 10 ** (levels[keep] / 20)
+        theta = rng.uniform(0, 2 * np.pi, size=int(keep.sum()))
+        # rfft of beta * sin(2 pi k n / N + theta)
+        np.add.at(phi_f, k[keep], -0.5j * N * beta * np.exp(1j * theta))
+    return phi_f
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from scipy.signal import welch
+
+from rfmodel.rf.Mixer_PLL_block import PLL, PLLParams
+from rfmodel.rf.sigma_delta import FracNParams, mash_psd, mash_sequence
+
+
+def _loop_mash(frac: float, n: int, order: int, bits: int) -> np.ndarray:
+    # reference: the accumulators sample by sample
+    M, K = 1 << bits, int(round(frac * (1 << bits)))
+    acc = [0] * order
+    carries = np.zeros((order, n), dtype=np.int64)
+    for i in range(n):
+        inp = K
+        for l in range(order):
+            acc[l] += inp
+            carries[l, i], acc[l] = divmod(acc[l], M)
+            inp = acc[l]
+    y = carries[0].copy()
+    for l in range(1, order):
+        c = carries[l]
+        for _ in range(l):
+            c = np.diff(c, prepend=0)
+        y += c
+    return y
+
+
+def test_mash_matches_accumulator_loop_and_shapes_noise():
+    for order in (1, 2, 3, 4):
+        y, cycles = mash_sequence(0.3137, 5000, order=order, modulus_bits=12)
+        np.testing.assert_array_equal(y, _loop_mash(0.3137, 5000, order, 12))
+        assert y.min() >= -(2 ** (order - 1) - 1) and y.max() <= 2 ** (order - 1)
+        K = round(0.3137 * 4096)
+        np.testing.assert_allclose(cycles, np.cumsum(y) - np.arange(1, 5001) * K / 4096, atol=1e-9)
+
+    f_ref = 40e6
+    _, cycles = mash_sequence(0.41, 1 << 18, order=3, dither=True, rng=np.random.default_rng(0))
+    f, p = welch(2 * np.pi * cycles, fs=f_ref, nperseg=4096)
+    sel = (f > 1e6) & (f < 15e6)
+    err_db = 10 * np.log10(p[sel] / mash_psd(f[sel], f_ref, 3, np.inf))
+    assert abs(np.median(err_db)) < 0.3
+
+    with pytest.raises(ValueError):
+        mash_sequence(1.2, 10)
+
+
+def test_frac_n_lo_follows_psd_and_spur_lines():
+    fs, n = 20e6, 1 << 19
+    frac_n = FracNParams(f_ref_hz=40e6, frac=0.1, frac_spurs_dbc=(-60.0, -70.0))
+    pll = PLL(PLLParams((-100, 1e6), -120, 100e3, 3.2e-6, frac_n=frac_n), np.random.default_rng(1))
+    phi = np.unwrap(np.angle(pll.generate_lo_impairment(n, fs)))
+
+    f, p = welch(phi, fs=fs, nperseg=1 << 13, window="blackmanharris")
+    for lo, hi in ((1e3, 50e3), (500e3, 3e6), (5e6, 9e6)):
+        sel = (f > lo) & (f < hi) & (np.abs(f - 4e6) > 50e3) & (np.abs(f - 8e6) > 50e3)
+        assert abs(np.median(10 * np.log10(p[sel] / pll.get_psd(f[sel])))) < 0.5
+
+    # fractional spurs at k * 0.1 * f_ref as exact lines
+    X = np.abs(np.fft.rfft(phi)) / (n / 2)
+    for f_spur, level in ((4e6, -60.0), (8e6, -70.0)):
+        assert 20 * np.log10(X[round(f_spur * n / fs)] / 2) == pytest.approx(level, abs=0.5)
+
+    # sigma-delta noise dominates the smooth model far out
+    assert pll.get_psd(np.array([8e6]))[0] > 10 * pll.get_psd(np.array([8e6]), include_sdm=False)[0]
+
+
+def test_pll_without_frac_n_unchanged():
+    p = PLLParams((-100, 1e6), -120, 100e3, 3.2e-6)
+    a = PLL(p, np.random.default_rng(5)).generate_lo_impairment(4096, 20e6)
+    b = PLL(PLLParams((-100, 1e6), -120, 100e3, 3.2e-6, frac_n=None), np.random.default_rng(5))
+    np.testing.assert_array_equal(a, b.generate_lo_impairment(4096, 20e6))
+    f = np.array([1e4, 1e6])
+    np.testing.assert_array_equal(b.get_psd(f), b.get_psd(f, include_sdm=False))
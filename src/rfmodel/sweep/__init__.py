@@ -0,0 +1,29 @@
+from .shared import SharedArray, SharedSignal, SharedStore, process_pool, resolve
+from .spec import SweepSpec, apply_point, set_param
+from .adaptive import AdaptiveCurve, adaptive_sweep, run_adaptive_sweep
+from .runner import load_checkpoint, load_results, results_table, run_sweep, save_results
+from .surrogate import ActiveLearner, GaussianProcess, ParameterSpace, PipelineSimulator, PolynomialChaos
+
+__all__ = [
+    "SharedArray",
+    "SharedSignal",
+    "SharedStore",
+    "resolve",
+    "process_pool",
+    "SweepSpec",
+    "apply_point",
+    "set_param",
+    "run_sweep",
+    "load_checkpoint",
+    "load_results",
+    "results_table",
+    "save_results",
+    "AdaptiveCurve",
+    "adaptive_sweep",
+    "run_adaptive_sweep",
+    "ParameterSpace",
+    "GaussianProcess",
+    "PolynomialChaos",
+    "ActiveLearner",
+    "PipelineSimulator",
+]
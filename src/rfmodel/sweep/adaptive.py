@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import numpy as np
+
+from rfmodel.core.pipeline_builder import pipeline_from_config
+from rfmodel.sweep.runner import _import_registries, save_results
+from rfmodel.sweep.spec import SweepSpec, apply_point
+
+
+@dataclass
+class _Point:
+    x: float
+    kind: str = ""
+    k: int = 0                  # 'rate': errors
+    n: int = 0                  # 'rate': bits
+    samples: List[float] = field(default_factory=list)    # 'mean'
+    trials: int = 0
+
+    def add(self, r: Any) -> None:
+        kind = "rate" if isinstance(r, (tuple, list)) else "mean"
+        if self.kind and kind != self.kind:
+            raise TypeError("trial() must always return (errors, total) or always a number")
+        self.kind = kind
+        if kind == "rate":
+            self.k += int(r[0])
+            self.n += int(r[1])
+        else:
+            self.samples.append(float(r))
+        self.trials += 1
+
+    def estimate(self) -> float:
+        if self.kind == "rate":
+            return self.k / self.n if self.n else math.nan
+        return float(np.mean(self.samples)) if self.samples else math.nan
+
+    def interval(self, z: float) -> tuple[float, float]:
+        if self.kind == "rate":
+            # Wilson score interval: well behaved at k = 0
+            if not self.n:
+                return 0.0, 1.0
+            p, n, z2 = self.k / self.n, self.n, z * z
+            den = 1.0 + z2 / n
+            c = (p + z2 / (2 * n)) / den
+            h = z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / den
+            return max(c - h, 0.0), min(c + h, 1.0)
+        if len(self.samples) < 2:
+            return -math.inf, math.inf
+        m = float(np.mean(self.samples))
+        h = z * float(np.std(self.samples, ddof=1)) / math.sqrt(len(self.samples))
+        return m - h, m + h
+
+
+@dataclass
+class AdaptiveCurve:
+    """
+    Result of adaptive_sweep(), sorted by x.
+
+    value is the estimate per point (error rate k/n, or mean of the trial
+    values), [lo, hi] its confidence interval and n_trials the number of
+    trial() calls spent on it. For error rates a value of 0 means no errors
+    were seen; hi then bounds the rate (within tol of the floor, or at
+    max_trials).
+    """
+    x: np.ndarray
+    value: np.ndarray
+    lo: np.ndarray
+    hi: np.ndarray
+    n_trials: np.ndarray
+    kind: str
+    floor: float
+
+    @property
+    def n_evaluations(self) -> int:
+        return int(self.n_trials.sum())
+
+    def _y(self, v) -> np.ndarray:
+        v = np.asarray(v, dtype=float)
+        return np.log10(np.maximum(v, self.floor)) if self.kind == "rate" else v
+
+    def crossing(self, target: float) -> float:
+        """First x where the curve crosses target (interpolated, log scale for rates); NaN if none."""
+        y, t = self._y(self.value), self._y(target)
+        d = y - t
+        for i in range(len(d) - 1):
+            if d[i] == 0:
+                return float(self.x[i])
+            if d[i] * d[i + 1] < 0:
+                return float(self.x[i] + (self.x[i + 1] - self.x[i]) * d[i] / (d[i] - d[i + 1]))
+        return math.nan
+
+    def columns(self, x_name: str = "x") -> Dict[str, np.ndarray]:
+        return {x_name: self.x, "value": self.value, "lo": self.lo, "hi": self.hi, "n_trials": self.n_trials}
+
+
+def adaptive_sweep(
+    trial: Callable[[float, int], Any],
+    lo: float,
+    hi: float,
+    *,
+    n_init: int = 5,
+    tol: float = 0.2,
+    x_tol: Optional[float] = None,
+    targets: Sequence[float] = (),
+    z: float = 1.96,
+    min_trials: int = 2,
+    max_trials: int = 64,
+    max_points: int = 64,
+    max_evaluations: Optional[int] = None,
+    floor: float = 1e-6,
+) -> AdaptiveCurve:
+    """
+    Resolve a 1-D metric curve (BER/EVM vs SNR, power, ...) with as few
+    trial() calls as possible.
+
+    trial(x, i) runs one simulation at x (i counts the trials at that x, use
+    it to seed the noise) and returns either (errors, total) for an error
+    rate, or a single number (EVM in dB, ...) that is averaged.
+
+    The curve is compared on a log10 scale for error rates (values below
+    floor count as floor) and as-is otherwise; tol is in those units
+    (decades for rates).
+
+      1. Trial budget: each point gets min_trials, then trials go to the
+         point with the widest confidence interval (in units of tol), sized
+         from the current width, until every interval is narrower than tol
+         or its point has max_trials. Zero-error points keep running only
+         until the upper bound drops below floor.
+      2. Refinement: an interval is bisected where the middle of three
+         neighbouring points deviates from their chord by more than tol
+         (curvature), or where the curve crosses one of targets, as long as
+         it is wider than x_tol. Flat regions (e.g. BER below floor) stop
+         being refined.
+      3. Stops when nothing needs refining, or at max_points points or
+         max_evaluations trial() calls.
+
+    Returns
+    -------
+    AdaptiveCurve
+    """
+    if not hi > lo:
+        raise ValueError("hi must be greater than lo")
+    if n_init < 2:
+        raise ValueError("n_init must be >= 2")
+    x_tol = (hi - lo) / 64 if x_tol is None else float(x_tol)
+    budget = math.inf if max_evaluations is None else int(max_evaluations)
+    points: Dict[float, _Point] = {}
+    used = 0
+
+    def y(v: float, kind: str) -> float:
+        return math.log10(max(v, floor)) if kind == "rate" else v
+
+    def width(p: _Point) -> float:
+        a, b = p.interval(z)
+        if p.kind == "rate":
+            if b < floor:
+                return 0.0                   # resolved as "below the floor"
+            return y(b, "rate") - y(a, "rate")
+        return b - a
+
+    def run(p: _Point, n: int) -> None:
+        nonlocal used
+        for _ in range(n):
+            p.add(trial(p.x, p.trials))
+            used += 1
+
+    def allocate() -> None:
+        while used < budget:
+            open_ = [p for p in points.values() if p.trials < max_trials and width(p) > tol]
+            if not open_:
+                return
+            p = max(open_, key=width)
+            w = width(p)
+            # CI width ~ 1/sqrt(trials): estimate the trials needed, at most doubling per step
+            need = p.trials * ((w / tol) ** 2 - 1) if math.isfinite(w) else p.trials
+            extra = int(min(max(math.ceil(need), 1), p.trials, max_trials - p.trials, budget - used))
+            run(p, extra)
+
+    def refine() -> List[float]:
+        xs = sorted(points)
+        ys = [y(points[x].estimate(), points[x].kind) for x in xs]
+        score: Dict[float, float] = {}
+
+        def split(i: int, s: float) -> None:
+            if xs[i + 1] - xs[i] > x_tol:
+                m = 0.5 * (xs[i] + xs[i + 1])
+                score[m] = max(score.get(m, 0.0), s)
+
+        for i in range(1, len(xs) - 1):
+            x0, x1, x2 = xs[i - 1], xs[i], xs[i + 1]
+            chord = ys[i - 1] + (ys[i + 1] - ys[i - 1]) * (x1 - x0) / (x2 - x0)
+            e = abs(ys[i] - chord)
+            if e > tol:
+                split(i - 1, e)
+                split(i, e)
+        for t in targets:
+            yt = y(t, points[xs[0]].kind)
+            for i in range(len(xs) - 1):
+                if (ys[i] - yt) * (ys[i + 1] - yt) < 0:
+                    split(i, math.inf)
+        return sorted(score, key=score.get, reverse=True)
+
+    new = list(np.linspace(lo, hi, n_init))
+    while new and used < budget:
+        for x in new[: max(max_points - len(points), 0)]:
+            points[float(x)] = p = _Point(float(x))
+            run(p, min(min_trials, max_trials))
+        allocate()
+        if len(points) >= max_points:
+            break
+        new = refine()
+
+    xs = sorted(points)
+    pts = [points[x] for x in xs]
+    ci = np.array([p.interval(z) for p in pts]).reshape(-1, 2)
+    return AdaptiveCurve(
+        x=np.asarray(xs),
+        value=np.array([p.estimate() for p in pts]),
+        lo=ci[:, 0],
+        hi=ci[:, 1],
+        n_trials=np.array([p.trials for p in pts], dtype=np.int64),
+        kind=pts[0].kind if pts else "mean",
+        floor=floor,
+    )
+
+
+_OPTIONS = ("n_init", "tol", "x_tol", "targets", "z", "min_trials", "max_trials", "max_points",
+            "max_evaluations", "floor")
+
+
+def run_adaptive_sweep(
+    cfg: dict,
+    trial: Callable[[Any, float, int], Any],
+    **overrides: Any,
+) -> AdaptiveCurve:
+    """
+    Adaptive sweep from the 'sweep' section of a pipeline config:
+
+        sweep:
+          design: adaptive
+          params:
+            AWGN.params.snr_db: {range: [0, 30]}
+          tol: 0.2              # decades for error rates
+          targets: [1.0e-3]
+          results: runs/ber.npz
+
+    trial(pipe, x, i) runs one simulation on the pipeline built with the
+    parameter set to x. Options of adaptive_sweep() are read from the
+    section; keyword arguments override them.
+    """
+    _import_registries()
+    spec = SweepSpec.from_config(cfg["sweep"])
+    if spec.design != "adaptive":
+        raise ValueError("run_adaptive_sweep() needs 'design: adaptive'")
+    if len(spec.params) != 1:
+        raise ValueError("An adaptive sweep varies exactly one parameter")
+    (path, rng), = spec.params.items()
+    if not isinstance(rng, dict) or "range" not in rng:
+        raise ValueError(f"'{path}': adaptive sweeps need {{range: [lo, hi]}}")
+    lo, hi = (float(v) for v in rng["range"])
+
+    opts = {k: v for k, v in spec.options.items() if k in _OPTIONS}
+    opts.update(overrides)
+    base = {k: v for k, v in cfg.items() if k != "sweep"}
+    pipes: Dict[float, Any] = {}
+
+    def at(x: float, i: int) -> Any:
+        if x not in pipes:
+            pipes[x] = pipeline_from_config(apply_point(base, {path: x}))
+        return trial(pipes[x], x, i)
+
+    curve = adaptive_sweep(at, lo, hi, **opts)
+    if spec.options.get("results"):
+        save_results(curve.columns(path), spec.options["results"])
+    return curve
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from numbers import Number
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+import numpy as np
+
+from rfmodel.core.pipeline_builder import pipeline_from_config
+from rfmodel.sweep.shared import SharedStore, process_pool, resolve
+from rfmodel.sweep.spec import SweepSpec, apply_point
+
+
+def _import_registries() -> None:
+    # a spawned worker starts with an empty block registry
+    import rfmodel.channel.registry  # noqa: F401
+    import rfmodel.multirate.registry  # noqa: F401
+    import rfmodel.rf.registry  # noqa: F401
+
+
+def _scalar(v: Any) -> Any:
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, np.ndarray) and v.ndim == 0:
+        return v.item()
+    return v
+
+
+def _run_point(cfg: dict, point: Dict[str, Any], evaluate: Callable, data: Any) -> tuple[Dict[str, Any], float]:
+    _import_registries()
+    t0 = time.perf_counter()
+    pipe = pipeline_from_config(apply_point(cfg, point))
+    if data is None:
+        metrics = evaluate(pipe, point)
+    else:
+        metrics = evaluate(pipe, point, resolve(data))
+    if not isinstance(metrics, Mapping):
+        raise TypeError(f"evaluate() must return a mapping of metrics, got {type(metrics).__name__}")
+    return {str(k): _scalar(v) for k, v in metrics.items()}, time.perf_counter() - t0
+
+
+def _same(a: Any, b: Any) -> bool:
+    # compare as they would round-trip through the JSON checkpoint
+    return json.loads(json.dumps(a)) == json.loads(json.dumps(b))
+
+
+def _read_checkpoint(path: Path, points: List[Dict[str, Any]]) -> tuple[Dict[int, dict], int]:
+    # records and the byte length of the complete records (0 if there is no file)
+    done: Dict[int, dict] = {}
+    if not path.exists():
+        return done, 0
+    raw = path.read_bytes()
+    lines = raw.split(b"\n")
+    end = 0
+    for n, line in enumerate(lines):
+        last = n == len(lines) - 1
+        if line.strip():
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                if last:
+                    break
+                raise
+            i = rec["index"]
+            if i >= len(points) or not _same(rec["point"], points[i]):
+                raise ValueError(f"Checkpoint '{path}' does not match this sweep (point {i}).")
+            done[i] = rec
+        end += len(line) + (not last)
+    return done, end
+
+
+def load_checkpoint(path: str | Path, points: List[Dict[str, Any]]) -> Dict[int, dict]:
+    """
+    Completed points recorded in a checkpoint file, keyed by point index.
+
+    A truncated last line (the sweep was killed mid-write) is ignored. Raises
+    ValueError if a record does not match the point at its index, i.e. the
+    checkpoint belongs to a different sweep.
+    """
+    return _read_checkpoint(Path(path), points)[0]
+
+
+def _column(values: List[Any]) -> np.ndarray:
+    if all(isinstance(v, bool) for v in values):
+        return np.asarray(values, dtype=bool)
+    if all(isinstance(v, Number) and not isinstance(v, bool) for v in values):
+        return np.asarray(values)
+    if all(isinstance(v, str) for v in values):
+        return np.asarray(values, dtype=str)
+    # lists, mixed types, missing metrics: JSON text per cell
+    return np.asarray([v if isinstance(v, str) else json.dumps(v) for v in values], dtype=str)
+
+
+def results_table(records: List[dict], paths: List[str]) -> Dict[str, np.ndarray]:
+    """Columns 'index', the parameter paths, every metric and 'elapsed_s'."""
+    records = sorted(records, key=lambda r: r["index"])
+    metric_names: List[str] = []
+    for r in records:
+        metric_names += [k for k in r["metrics"] if k not in metric_names]
+
+    cols: Dict[str, np.ndarray] = {"index": np.asarray([r["index"] for r in records], dtype=np.int64)}
+    for p in paths:
+        cols[p] = _column([r["point"][p] for r in records])
+    for m in metric_names:
+        vals = [r["metrics"].get(m) for r in records]
+        if all(v is None or isinstance(v, Number) for v in vals):
+            vals = [np.nan if v is None else v for v in vals]
+        cols[m] = _column(vals)
+    cols["elapsed_s"] = np.asarray([r["elapsed_s"] for r in records], dtype=float)
+    return cols
+
+
+def save_results(columns: Dict[str, np.ndarray], path: str | Path) -> None:
+    """Write columns to '.npz' (one array per column) or '.csv'."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".npz":
+        with open(path, "wb") as f:
+            np.savez(f, **columns)
+    elif path.suffix == ".csv":
+        names = list(columns)
+        with open(path, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(names)
+            n = len(next(iter(columns.values()))) if columns else 0
+            for i in range(n):
+                w.writerow([columns[c][i] for c in names])
+    else:
+        raise ValueError(f"Unsupported results format '{path.suffix}' (use .npz or .csv)")
+
+
+def load_results(path: str | Path) -> Dict[str, np.ndarray]:
+    """Read a results file written by save_results() back into columns."""
+    path = Path(path)
+    if path.suffix == ".npz":
+        with np.load(path) as z:
+            return {k: z[k] for k in z.files}
+    if path.suffix == ".csv":
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+        cols = {}
+        for j, name in enumerate(rows[0]):
+            vals = [r[j] for r in rows[1:]]
+            try:
+                cols[name] = np.asarray(vals, dtype=float)
+            except ValueError:
+                cols[name] = np.asarray(vals, dtype=str)
+        return cols
+    raise ValueError(f"Unsupported results format '{path.suffix}' (use .npz or .csv)")
+
+
+def run_sweep(
+    cfg: dict,
+    evaluate: Callable[..., Mapping[str, Any]],
+    *,
+    data: Any = None,
+    spec: Optional[SweepSpec] = None,
+    checkpoint: Optional[str | Path] = None,
+    results: Optional[str | Path] = None,
+    n_workers: int = 1,
+) -> Dict[str, np.ndarray]:
+    """
+    Run the sweep section of a pipeline config.
+
+    For every point, the config is copied with the point's values applied,
+    the pipeline is built from it and evaluate(pipe, point) is called (or
+    evaluate(pipe, point, data) when data is given); it returns a mapping
+    of metric name -> value. The original config is never modified.
+
+    Each completed point is appended to the checkpoint file (JSON lines)
+    as soon as it finishes. Running the same sweep again with the same
+    checkpoint skips the points already recorded there, so an interrupted
+    sweep resumes where it stopped.
+
+    Parameters
+    ----------
+    cfg :
+        Pipeline config as returned by load_yaml(), with a 'sweep' section
+        unless spec is given. 'checkpoint' and 'results' keys of the sweep
+        section are used when the arguments are not.
+    evaluate :
+        Metric function. Must be picklable (module level) when n_workers > 1.
+    data :
+        Input waveforms / reference data shared by all points. With
+        n_workers > 1 they are put in a SharedStore once instead of being
+        pickled for every point; evaluate() receives views.
+    n_workers :
+        Worker processes; 1 runs the points in this process.
+
+    Returns
+    -------
+    Columns of all completed points: 'index', one per parameter path, one
+    per metric and 'elapsed_s' (per-point wall time). Also written to the
+    results file (.npz or .csv) if one is given.
+    """
+    if spec is None:
+        if "sweep" not in cfg:
+            raise KeyError("Config missing key: 'sweep'")
+        spec = SweepSpec.from_config(cfg["sweep"])
+    checkpoint = checkpoint if checkpoint is not None else spec.options.get("checkpoint")
+    results = results if results is not None else spec.options.get("results")
+
+    base = {k: v for k, v in cfg.items() if k != "sweep"}
+    points = spec.points()
+    done, ckpt_end = _read_checkpoint(Path(checkpoint), points) if checkpoint else ({}, 0)
+    todo = [i for i in range(len(points)) if i not in done]
+
+    ckpt = None
+    if checkpoint:
+        Path(checkpoint).parent.mkdir(parents=True, exist_ok=True)
+        ckpt = open(checkpoint, "ab")
+        # drop a half-written last line before appending after it
+        ckpt.truncate(ckpt_end)
+        if ckpt_end and not Path(checkpoint).read_bytes().endswith(b"\n"):
+            ckpt.write(b"\n")
+
+    def record(i: int, metrics: Dict[str, Any], elapsed: float) -> None:
+        rec = {"index": i, "point": points[i], "metrics": metrics, "elapsed_s": elapsed}
+        done[i] = json.loads(json.dumps(rec))
+        if ckpt is not None:
+            ckpt.write((json.dumps(rec) + "\n").encode())
+            ckpt.flush()
+            os.fsync(ckpt.fileno())
+
+    try:
+        if n_workers <= 1:
+            for i in todo:
+                record(i, *_run_point(base, points[i], evaluate, data))
+        elif todo:
+            with SharedStore() as store, process_pool(n_workers) as pool:
+                shared = store.put(data) if data is not None else None
+                running = {pool.submit(_run_point, base, points[i], evaluate, shared): i for i in todo}
+                try:
+                    while running:
+                        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for fut in finished:
+                            record(running.pop(fut), *fut.result())
+                except BaseException:
+                    for fut in running:
+                        fut.cancel()
+                    raise
+    finally:
+        if ckpt is not None:
+            ckpt.close()
+
+    columns = results_table(list(done.values()), spec.paths)
+    if results:
+        save_results(columns, results)
+    return columns
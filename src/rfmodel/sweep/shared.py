@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import uuid
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional
+import numpy as np
+
+from rfmodel.core.signal import Signal
+
+
+# Blocks created by a SharedStore in this process, and blocks / memmaps this
+# process has attached to. Attaching happens once per process, so every later
+# task that references the same waveform costs only a dict lookup.
+_owned: Dict[str, shared_memory.SharedMemory] = {}
+_attached: Dict[str, Any] = {}
+_retired: list = []
+_lock = threading.Lock()
+
+
+def _attach_shm(name: str) -> shared_memory.SharedMemory:
+    if name in _owned:
+        return _owned[name]
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Only the creating process may unlink. Workers started by
+    # multiprocessing share its resource tracker, which keeps one record per
+    # name: registering an attached block again is a no-op, and unlink() in
+    # the creator removes the record. Workers must not unregister it, that
+    # would drop the creator's record (KeyError in the tracker at unlink).
+    return shared_memory.SharedMemory(name=name)
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """
+    Picklable reference to a read-only array in shared memory ('shm') or a
+    memmapped file ('memmap'). Pickles to a few hundred bytes whatever the
+    array size; array() maps it into the current process without copying.
+    """
+    name: str            # shared memory block name, or file path for 'memmap'
+    shape: tuple
+    dtype: str
+    kind: str = "shm"
+
+    def array(self) -> np.ndarray:
+        with _lock:
+            buf = _attached.get(self.name)
+            if buf is None:
+                if self.kind == "shm":
+                    buf = _attach_shm(self.name)
+                else:
+                    buf = np.memmap(self.name, dtype=np.uint8, mode="r")
+                _attached[self.name] = buf
+
+        data = buf.buf if self.kind == "shm" else buf
+        n = int(np.prod(self.shape, dtype=np.int64))
+        a = np.frombuffer(data, dtype=np.dtype(self.dtype), count=n).reshape(self.shape)
+        a.flags.writeable = False
+        return a
+
+
+@dataclass(frozen=True)
+class SharedSignal:
+    """Picklable reference to a Signal whose samples live in a SharedArray."""
+    x: SharedArray
+    fs_hz: float
+    fc_hz: Optional[float] = None
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    def signal(self) -> Signal:
+        return Signal(x=self.x.array(), fs_hz=self.fs_hz, fc_hz=self.fc_hz, meta=dict(self.meta))
+
+
+def resolve(obj: Any) -> Any:
+    """
+    Replace SharedSignal / SharedArray handles (also inside dicts, lists and
+    tuples) by Signal / ndarray views. Call it on task arguments in a worker.
+    """
+    if isinstance(obj, SharedSignal):
+        return obj.signal()
+    if isinstance(obj, SharedArray):
+        return obj.array()
+    if isinstance(obj, dict):
+        return {k: resolve(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(resolve(v) for v in obj)
+    return obj
+
+
+def process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    ProcessPoolExecutor for sweep workers, started with 'forkserver' where
+    available ('spawn' otherwise). Forking a process whose thread pools are
+    running (numba TBB after a parallel kernel, BLAS) can hang the parent
+    at exit or the worker; forkserver workers never inherit those threads.
+    Tasks must be picklable by reference (module-level functions).
+    """
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
+
+
+def _unlink(kind: str, name: str) -> None:
+    if kind == "shm":
+        shm = _owned.pop(name, None)
+        _attached.pop(name, None)
+        if shm is not None:
+            try:
+                shm.close()
+            except BufferError:
+                _retired.append(shm)    # views still alive here: keep the mapping for them
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+    else:
+        _attached.pop(name, None)
+        try:
+            os.remove(name)
+        except FileNotFoundError:
+            pass
+
+
+def _cleanup(blocks: Dict[str, list], pid: int) -> None:
+    if os.getpid() != pid:
+        return                  # a forked worker never owns the store's blocks
+    for name, (kind, _) in list(blocks.items()):
+        _unlink(kind, name)
+    blocks.clear()
+
+
+class SharedStore:
+    """
+    Owner of the shared waveforms and reference data of a sweep.
+
+    put() copies an array, a Signal or a dict/list/tuple of them into shared
+    memory once and returns picklable handles to send with every task
+    instead of the data:
+
+        with SharedStore() as store:
+            ref = store.put({"sig": s_in, "bits": bits, "syms": qam_syms})
+            with process_pool() as pool:
+                futures = [pool.submit(task, ref, snr) for snr in snrs]
+        # in task():  d = resolve(ref); d["sig"].x is a view, no copy
+
+    Each array starts with one reference; retain() / release() adjust it and
+    the block is unlinked when it drops to zero. close() (or leaving the
+    with-block, or garbage collection of the store) unlinks everything still
+    held. Workers only map the blocks, they never unlink them.
+
+    Parameters
+    ----------
+    backend :
+        'shm' (multiprocessing.shared_memory) or 'memmap' (files in directory).
+    directory :
+        Where 'memmap' files go. Default: the system temp directory.
+    """
+
+    def __init__(self, backend: str = "shm", directory: Optional[str] = None):
+        if backend not in ("shm", "memmap"):
+            raise ValueError("backend must be 'shm' or 'memmap'")
+        self.backend = backend
+        self.directory = directory or tempfile.gettempdir()
+        self._blocks: Dict[str, list] = {}       # name -> [kind, refcount]
+        self._pid = os.getpid()
+        self._finalizer = weakref.finalize(self, _cleanup, self._blocks, self._pid)
+
+    def __enter__(self) -> "SharedStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def put_array(self, a: np.ndarray) -> SharedArray:
+        a = np.ascontiguousarray(a)
+        nbytes = max(a.nbytes, 1)
+
+        if self.backend == "shm":
+            shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            _owned[shm.name] = shm
+            name = shm.name
+            np.frombuffer(shm.buf, dtype=a.dtype, count=a.size)[:] = a.ravel()
+        else:
+            name = os.path.join(self.directory, f"rfmodel_{uuid.uuid4().hex}.bin")
+            mm = np.memmap(name, dtype=np.uint8, mode="w+", shape=(nbytes,))
+            mm[:a.nbytes] = a.view(np.uint8).ravel()
+            mm.flush()
+            del mm
+
+        self._blocks[name] = [self.backend, 1]
+        return SharedArray(name=name, shape=a.shape, dtype=a.dtype.str, kind=self.backend)
+
+    def put_signal(self, s: Signal) -> SharedSignal:
+        return SharedSignal(x=self.put_array(np.asarray(s.x)), fs_hz=s.fs_hz, fc_hz=s.fc_hz, meta=dict(s.meta))
+
+    def put(self, obj: Any) -> Any:
+        """Share arrays and Signals, recursing into dicts, lists and tuples."""
+        if isinstance(obj, Signal):
+            return self.put_signal(obj)
+        if isinstance(obj, np.ndarray):
+            return self.put_array(obj)
+        if isinstance(obj, dict):
+            return {k: self.put(v) for k, v in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return type(obj)(self.put(v) for v in obj)
+        return obj
+
+    def _names(self, handle: Any) -> list[str]:
+        if isinstance(handle, SharedSignal):
+            return [handle.x.name]
+        if isinstance(handle, SharedArray):
+            return [handle.name]
+        if isinstance(handle, dict):
+            return [n for v in handle.values() for n in self._names(v)]
+        if isinstance(handle, (list, tuple)):
+            return [n for v in handle for n in self._names(v)]
+        return []
+
+    def retain(self, handle: Any) -> None:
+        for n in self._names(handle):
+            self._blocks[n][1] += 1
+
+    def release(self, handle: Any) -> None:
+        for n in self._names(handle):
+            entry = self._blocks.get(n)
+            if entry is None:
+                continue
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self._blocks[n]
+                _unlink(entry[0], n)
+
+    def close(self) -> None:
+        _cleanup(self._blocks, self._pid)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import copy
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+
+DESIGNS = ("grid", "zip", "random", "adaptive")
+
+
+def _values(path: str, v: Any) -> list:
+    # explicit list, or a range shorthand {linspace: [a, b, n]} / {geomspace: [a, b, n]}
+    if isinstance(v, dict):
+        if len(v) != 1:
+            raise ValueError(f"'{path}': expected one of linspace/geomspace, got {list(v)}")
+        kind, args = next(iter(v.items()))
+        if kind == "linspace":
+            return np.linspace(float(args[0]), float(args[1]), int(args[2])).tolist()
+        if kind == "geomspace":
+            return np.geomspace(float(args[0]), float(args[1]), int(args[2])).tolist()
+        raise ValueError(f"'{path}': unknown range '{kind}' (use linspace or geomspace)")
+    if isinstance(v, (list, tuple)):
+        return list(v)
+    return [v]
+
+
+def _draw(path: str, v: Any, rng: np.random.Generator, n: int) -> list:
+    # {uniform: [a, b]}, {loguniform: [a, b]}, {randint: [a, b]} or {choice: [...]}
+    if not isinstance(v, dict) or len(v) != 1:
+        raise ValueError(f"'{path}': random designs need one of uniform/loguniform/randint/choice")
+    kind, args = next(iter(v.items()))
+    if kind == "uniform":
+        return rng.uniform(float(args[0]), float(args[1]), n).tolist()
+    if kind == "loguniform":
+        lo, hi = np.log(float(args[0])), np.log(float(args[1]))
+        return np.exp(rng.uniform(lo, hi, n)).tolist()
+    if kind == "randint":
+        return rng.integers(int(args[0]), int(args[1]), n, endpoint=True).tolist()
+    if kind == "choice":
+        return [args[i] for i in rng.integers(0, len(args), n)]
+    raise ValueError(f"'{path}': unknown distribution '{kind}'")
+
+
+@dataclass
+class SweepSpec:
+    """
+    Sweep design over block parameters addressed by path,
+    '<block name>.<key>.<key>...' into the block's YAML config, e.g.
+    'AWGN.params.snr_db' or 'mixer_and_pll_TX.params.pll.loop_bandwidth'.
+
+    Designs
+    -------
+    grid :
+        Cartesian product of the value lists (first path varies slowest).
+    zip :
+        Value lists of equal length, taken element by element.
+    random :
+        n_points draws from {uniform: [a, b]}, {loguniform: [a, b]},
+        {randint: [a, b]} or {choice: [...]} per path (seeded).
+    adaptive :
+        One path with {range: [lo, hi]}; the points are chosen while the
+        sweep runs (see rfmodel.sweep.adaptive.run_adaptive_sweep).
+
+    Value lists may be written as {linspace: [a, b, n]} or
+    {geomspace: [a, b, n]}.
+    """
+    params: Dict[str, Any]
+    design: str = "grid"
+    n_points: Optional[int] = None
+    seed: Optional[int] = None
+    options: Dict[str, Any] = field(default_factory=dict)   # other keys of the sweep section
+
+    def __post_init__(self):
+        if self.design not in DESIGNS:
+            raise ValueError(f"Unknown sweep design '{self.design}'. Available: {list(DESIGNS)}")
+        if not self.params:
+            raise ValueError("Sweep has no params")
+        if self.design == "random" and not self.n_points:
+            raise ValueError("A random sweep needs n_points")
+
+    @classmethod
+    def from_config(cls, scfg: dict) -> "SweepSpec":
+        scfg = dict(scfg)
+        params = scfg.pop("params", None)
+        if params is None:
+            raise KeyError("Sweep config missing key: 'params'")
+        return cls(
+            params=dict(params),
+            design=scfg.pop("design", "grid"),
+            n_points=scfg.pop("n_points", None),
+            seed=scfg.pop("seed", None),
+            options=scfg,
+        )
+
+    @property
+    def paths(self) -> List[str]:
+        return list(self.params)
+
+    def points(self) -> List[Dict[str, Any]]:
+        """All sweep points, as {path: value} dicts in run order."""
+        paths = self.paths
+        if self.design == "adaptive":
+            raise ValueError("Adaptive sweeps choose their points while running; use run_adaptive_sweep()")
+        if self.design == "random":
+            rng = np.random.default_rng(self.seed)
+            cols = [_draw(p, self.params[p], rng, self.n_points) for p in paths]
+            return [dict(zip(paths, row)) for row in zip(*cols)]
+
+        cols = [_values(p, self.params[p]) for p in paths]
+        if self.design == "zip":
+            if len({len(c) for c in cols}) != 1:
+                raise ValueError("All value lists of a zip sweep must have the same length")
+            return [dict(zip(paths, row)) for row in zip(*cols)]
+        return [dict(zip(paths, row)) for row in itertools.product(*cols)]
+
+
+def _find_block_cfg(cfg: dict, name: str) -> dict:
+    def search(blocks: list) -> Optional[dict]:
+        for b in blocks:
+            if b.get("name") == name:
+                return b
+            found = search(b.get("blocks", []))      # composite blocks (channel, oversampled)
+            if found is not None:
+                return found
+        return None
+
+    blocks = cfg["graph"]["nodes"] if "graph" in cfg else cfg.get("pipeline", [])
+    found = search(blocks)
+    if found is None:
+        raise KeyError(f"Block '{name}' not found in config.")
+    return found
+
+
+def set_param(cfg: dict, path: str, value: Any) -> None:
+    """Set the config entry addressed by '<block>.<key>...' (created if missing)."""
+    name, *keys = path.split(".")
+    if not keys:
+        raise ValueError(f"Parameter path '{path}' must be '<block>.<key>[.<key>...]'")
+    d = _find_block_cfg(cfg, name)
+    for k in keys[:-1]:
+        d = d.setdefault(k, {})
+        if not isinstance(d, dict):
+            raise TypeError(f"'{path}': '{k}' is not a mapping")
+    d[keys[-1]] = value
+
+
+def apply_point(cfg: dict, point: Dict[str, Any]) -> dict:
+    """Deep copy of cfg with every {path: value} of a sweep point applied."""
+    out = copy.deepcopy(cfg)
+    for path, v in point.items():
+        set_param(out, path, v)
+    return out
@@ -0,0 +1,450 @@
+"""
+Surrogate models of simulated metrics (EVM, BER, ...) over a box of design
+parameters, with active learning to choose the next simulation.
+
+Both models take and return physical parameter values; internally inputs
+are mapped to the unit cube (log-scaled dimensions in log space) and the
+metric is standardized.
+
+  - GaussianProcess: Matern 5/2 or RBF kernel with one length scale per
+    dimension; hyperparameters by maximum marginal likelihood.
+  - PolynomialChaos: total-degree Legendre expansion fitted by (ridge)
+    least squares; gives Sobol sensitivity indices for free.
+
+NumPy / SciPy only.
+"""
+from __future__ import annotations
+
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+import numpy as np
+from numpy.polynomial import legendre
+from scipy.linalg import cho_solve, cholesky, solve_triangular
+from scipy.optimize import minimize
+from scipy.stats import norm, qmc
+
+from rfmodel.core.pipeline_builder import pipeline_from_config
+from rfmodel.sweep.runner import _import_registries
+from rfmodel.sweep.shared import process_pool
+from rfmodel.sweep.spec import apply_point
+
+
+@dataclass(frozen=True)
+class Dimension:
+    name: str
+    lo: float
+    hi: float
+    log: bool = False
+
+
+class ParameterSpace:
+    """
+    Box of design parameters.
+
+    dims maps a name to (lo, hi) or (lo, hi, 'log'). Names are sweep paths
+    such as 'PA.params.p1db_out_dbm' when the points are applied to a
+    pipeline config (see PipelineSimulator); names without a '.' (e.g.
+    'pin_dbm') are only handed to the metric function.
+    """
+
+    def __init__(self, dims: Mapping[str, Sequence[Any]]):
+        self.dims: List[Dimension] = []
+        for name, spec in dims.items():
+            lo, hi = float(spec[0]), float(spec[1])
+            log = len(spec) > 2 and spec[2] == "log"
+            if not hi > lo or (log and lo <= 0):
+                raise ValueError(f"Invalid bounds for '{name}': {spec}")
+            self.dims.append(Dimension(name, lo, hi, log))
+
+    @property
+    def names(self) -> List[str]:
+        return [d.name for d in self.dims]
+
+    @property
+    def d(self) -> int:
+        return len(self.dims)
+
+    def _bounds(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        log = np.array([d.log for d in self.dims])
+        lo = np.array([math.log(d.lo) if d.log else d.lo for d in self.dims])
+        hi = np.array([math.log(d.hi) if d.log else d.hi for d in self.dims])
+        return lo, hi, log
+
+    def to_unit(self, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        lo, hi, log = self._bounds()
+        X = np.where(log, np.log(np.where(log, X, 1.0)), X)
+        return (X - lo) / (hi - lo)
+
+    def from_unit(self, U: np.ndarray) -> np.ndarray:
+        U = np.atleast_2d(np.asarray(U, dtype=float))
+        lo, hi, log = self._bounds()
+        X = lo + U * (hi - lo)
+        return np.where(log, np.exp(X), X)
+
+    def sample(self, n: int, *, seed: Optional[int] = None, method: str = "lhs") -> np.ndarray:
+        """n points (n, d): 'lhs' (Latin hypercube), 'sobol' or 'random'."""
+        if method == "lhs":
+            U = qmc.LatinHypercube(d=self.d, seed=seed).random(n)
+        elif method == "sobol":
+            U = qmc.Sobol(d=self.d, seed=seed).random(n)
+        elif method == "random":
+            U = np.random.default_rng(seed).random((n, self.d))
+        else:
+            raise ValueError(f"Unknown sampling method '{method}'")
+        return self.from_unit(U)
+
+    def grid(self, n: int | Sequence[int]) -> np.ndarray:
+        """Full factorial grid, (prod(n), d)."""
+        ns = [n] * self.d if isinstance(n, int) else list(n)
+        axes = [np.linspace(0.0, 1.0, k) for k in ns]
+        U = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, self.d)
+        return self.from_unit(U)
+
+    def points(self, X: np.ndarray) -> List[Dict[str, float]]:
+        return [dict(zip(self.names, map(float, row))) for row in np.atleast_2d(X)]
+
+    def array(self, points: Sequence[Mapping[str, float]]) -> np.ndarray:
+        return np.array([[float(p[n]) for n in self.names] for p in points])
+
+
+def _sqdist(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    d2 = A @ B.T
+    d2 *= -2.0
+    d2 += np.sum(A * A, 1)[:, None]
+    d2 += np.sum(B * B, 1)[None, :]
+    return np.maximum(d2, 0.0, out=d2)
+
+
+class GaussianProcess:
+    """
+    Gaussian process regression with an anisotropic Matern 5/2 ('matern52')
+    or squared exponential ('rbf') kernel and Gaussian noise.
+
+    fit() maximizes the log marginal likelihood over the length scales, the
+    signal variance and the noise variance (L-BFGS-B, n_restarts random
+    restarts). predict() is vectorized and works in batches, so evaluating
+    a dense grid over the whole space costs a few matrix products.
+    """
+
+    def __init__(self, space: ParameterSpace, *, kernel: str = "matern52", n_restarts: int = 3,
+                 noise_bounds: tuple[float, float] = (1e-8, 1.0), seed: Optional[int] = 0):
+        if kernel not in ("matern52", "rbf"):
+            raise ValueError("kernel must be 'matern52' or 'rbf'")
+        self.space = space
+        self.kernel = kernel
+        self.n_restarts = n_restarts
+        self.noise_bounds = noise_bounds
+        self.rng = np.random.default_rng(seed)
+        self.theta: Optional[np.ndarray] = None     # log length scales, log signal var, log noise var
+
+    def _k(self, A: np.ndarray, B: np.ndarray, theta: np.ndarray) -> np.ndarray:
+        ell, sf2 = np.exp(theta[:-2]), math.exp(theta[-2])
+        d2 = _sqdist(A / ell, B / ell)
+        if self.kernel == "rbf":
+            d2 *= -0.5
+            return sf2 * np.exp(d2, out=d2)
+        # in place: this runs on (batch, n_train) blocks in predict()
+        r = np.sqrt(d2 * 5.0, out=d2)
+        k = r * r
+        k *= 1.0 / 3.0
+        k += r
+        k += 1.0
+        k *= sf2
+        k *= np.exp(-r, out=r)
+        return k
+
+    def _nll(self, theta: np.ndarray, U: np.ndarray, y: np.ndarray) -> tuple[float, np.ndarray]:
+        # negative log marginal likelihood and its gradient in theta
+        n, d = U.shape
+        ell, sf2, sn2 = np.exp(theta[:-2]), math.exp(theta[-2]), math.exp(theta[-1])
+        D2 = (U[:, None, :] - U[None, :, :]) ** 2 / ell ** 2        # (n, n, d)
+        d2 = D2.sum(-1)
+        if self.kernel == "rbf":
+            Kf = sf2 * np.exp(-0.5 * d2)
+            dK_dd2 = 0.5 * Kf                                        # -dK/d(d2)
+        else:
+            r = np.sqrt(5.0 * d2)
+            e = np.exp(-r)
+            Kf = sf2 * (1.0 + r + r * r / 3.0) * e
+            dK_dd2 = sf2 * (5.0 / 6.0) * (1.0 + r) * e
+        K = Kf + (sn2 + 1e-10) * np.eye(n)
+        try:
+            L = cholesky(K, lower=True)
+        except np.linalg.LinAlgError:
+            return 1e25, np.zeros_like(theta)
+        a = cho_solve((L, True), y)
+        f = 0.5 * y @ a + np.sum(np.log(np.diag(L))) + 0.5 * n * math.log(2 * math.pi)
+
+        W = cho_solve((L, True), np.eye(n)) - np.outer(a, a)        # dNLL = 0.5 tr(W dK)
+        grad = np.empty_like(theta)
+        grad[:d] = np.einsum("ij,ijk->k", W * dK_dd2, D2)           # dK/dlog(ell_k) = 2 dK_dd2 D2_k
+        grad[-2] = 0.5 * np.sum(W * Kf)
+        grad[-1] = 0.5 * sn2 * np.trace(W)
+        return float(f), grad
+
+    def fit(self, X: np.ndarray, y: np.ndarray, *, optimize: bool = True) -> "GaussianProcess":
+        U = self.space.to_unit(X)
+        y = np.asarray(y, dtype=float).ravel()
+        if len(y) != len(U):
+            raise ValueError("X and y have different lengths")
+        self._mu, self._sd = float(np.mean(y)), float(np.std(y)) or 1.0
+        ys = (y - self._mu) / self._sd
+
+        d = self.space.d
+        bounds = [(math.log(1e-2), math.log(1e2))] * d + [(math.log(1e-2), math.log(1e2))] \
+            + [tuple(math.log(b) for b in self.noise_bounds)]
+        if optimize or self.theta is None:
+            starts = [np.r_[np.full(d, math.log(0.3)), 0.0, math.log(1e-3)]] if self.theta is None else [self.theta]
+            for _ in range(self.n_restarts):
+                starts.append(np.array([self.rng.uniform(lo, hi) for lo, hi in bounds]))
+            best = None
+            for t0 in starts:
+                r = minimize(self._nll, np.clip(t0, *np.array(bounds).T), args=(U, ys),
+                             method="L-BFGS-B", jac=True, bounds=bounds)
+                if best is None or r.fun < best.fun:
+                    best = r
+            self.theta = best.x
+
+        K = self._k(U, U, self.theta) + (math.exp(self.theta[-1]) + 1e-10) * np.eye(len(ys))
+        self._L = cholesky(K, lower=True)
+        self._alpha = cho_solve((self._L, True), ys)
+        self._L_inv = solve_triangular(self._L, np.eye(len(ys)), lower=True)
+        self._U = U
+        return self
+
+    @property
+    def length_scales(self) -> np.ndarray:
+        """Length scales in unit-cube coordinates (small = sensitive dimension)."""
+        return np.exp(self.theta[:-2])
+
+    @property
+    def noise_std(self) -> float:
+        return math.sqrt(math.exp(self.theta[-1])) * self._sd
+
+    def predict(self, X: np.ndarray, *, return_std: bool = False, batch: int = 1024):
+        U = self.space.to_unit(X)
+        mean = np.empty(len(U))
+        std = np.empty(len(U)) if return_std else None
+        sf2 = math.exp(self.theta[-2])
+        for s in range(0, len(U), batch):
+            Ks = self._k(U[s:s + batch], self._U, self.theta)
+            mean[s:s + batch] = Ks @ self._alpha
+            if return_std:
+                v = Ks @ self._L_inv.T
+                std[s:s + batch] = np.sqrt(np.maximum(sf2 - np.einsum("ij,ij->i", v, v), 0.0))
+        mean = self._mu + self._sd * mean
+        return (mean, std * self._sd) if return_std else mean
+
+
+class PolynomialChaos:
+    """
+    Legendre polynomial chaos expansion of total degree <= degree, in the
+    unit-cube coordinates mapped to [-1, 1].
+
+    predict(..., return_std=True) returns the least-squares standard error
+    of the fitted mean. sobol_indices() gives first-order and total Sobol
+    indices per dimension from the coefficients (uniform inputs).
+    """
+
+    def __init__(self, space: ParameterSpace, *, degree: int = 3, ridge: float = 1e-8):
+        self.space = space
+        self.degree = degree
+        self.ridge = ridge
+        self.index = np.array([m for m in itertools.product(range(degree + 1), repeat=space.d)
+                               if sum(m) <= degree], dtype=int)
+        self.coef: Optional[np.ndarray] = None
+
+    def _basis(self, X: np.ndarray) -> np.ndarray:
+        Z = 2.0 * self.space.to_unit(X) - 1.0
+        # orthonormal on U[-1, 1]: sqrt(2k + 1) P_k
+        norms = np.sqrt(2.0 * np.arange(self.degree + 1) + 1.0)
+        V = [legendre.legvander(Z[:, j], self.degree) * norms for j in range(self.space.d)]
+        Phi = np.ones((len(Z), len(self.index)))
+        for j in range(self.space.d):
+            Phi *= V[j][:, self.index[:, j]]
+        return Phi
+
+    def fit(self, X: np.ndarray, y: np.ndarray, *, optimize: bool = True) -> "PolynomialChaos":
+        Phi = self._basis(X)
+        y = np.asarray(y, dtype=float).ravel()
+        A = Phi.T @ Phi + self.ridge * len(y) * np.eye(Phi.shape[1])
+        self._A_inv = np.linalg.inv(A)
+        self.coef = self._A_inv @ Phi.T @ y
+        dof = len(y) - Phi.shape[1]
+        res = y - Phi @ self.coef
+        self._s2 = float(res @ res / dof) if dof > 0 else float(np.var(y)) or 1.0
+        return self
+
+    def predict(self, X: np.ndarray, *, return_std: bool = False, batch: int = 1024):
+        X = np.atleast_2d(X)
+        mean = np.empty(len(X))
+        std = np.empty(len(X)) if return_std else None
+        for s in range(0, len(X), batch):
+            Phi = self._basis(X[s:s + batch])
+            mean[s:s + batch] = Phi @ self.coef
+            if return_std:
+                std[s:s + batch] = np.sqrt(self._s2 * np.einsum("ij,jk,ik->i", Phi, self._A_inv, Phi))
+        return (mean, std) if return_std else mean
+
+    def sobol_indices(self) -> Dict[str, Dict[str, float]]:
+        c2 = self.coef[1:] ** 2
+        var = float(c2.sum()) or 1.0
+        idx = self.index[1:]
+        out = {}
+        for j, name in enumerate(self.space.names):
+            only = (idx[:, j] > 0) & (idx.sum(1) == idx[:, j])
+            out[name] = {"first": float(c2[only].sum() / var), "total": float(c2[idx[:, j] > 0].sum() / var)}
+        return out
+
+
+def acquisition(model, X: np.ndarray, kind: str, *, threshold: Optional[float] = None,
+                best: Optional[float] = None) -> np.ndarray:
+    """
+    Score candidate points (higher = simulate next).
+
+    'variance' : predictive std (global accuracy).
+    'threshold': straddle 1.96 std - |mean - threshold|; samples where the
+                 requirement boundary is still uncertain.
+    'min'      : expected improvement below best (minimization).
+    """
+    mu, sd = model.predict(X, return_std=True)
+    if kind == "variance":
+        return sd
+    if kind == "threshold":
+        if threshold is None:
+            raise ValueError("'threshold' acquisition needs a threshold")
+        return 1.96 * sd - np.abs(mu - threshold)
+    if kind == "min":
+        sd = np.maximum(sd, 1e-12)
+        z = (best - mu) / sd
+        return (best - mu) * norm.cdf(z) + sd * norm.pdf(z)
+    raise ValueError(f"Unknown acquisition '{kind}'")
+
+
+def probability_meets(model, X: np.ndarray, threshold: float, *, sense: str = "<=") -> np.ndarray:
+    """P(metric <= threshold) (or >=) under the model at each point of X."""
+    mu, sd = model.predict(X, return_std=True)
+    z = (threshold - mu) / np.maximum(sd, 1e-12)
+    return norm.cdf(z) if sense == "<=" else norm.sf(z)
+
+
+class PipelineSimulator:
+    """
+    simulate(point) for ActiveLearner: applies the point's config paths to
+    a copy of cfg, builds the pipeline and returns
+    evaluate(pipe, point)[metric]. Picklable if evaluate is module level.
+    """
+
+    def __init__(self, cfg: dict, evaluate: Callable[[Any, Dict[str, float]], Mapping[str, float]], metric: str):
+        self.cfg = {k: v for k, v in cfg.items() if k != "sweep"}
+        self.evaluate = evaluate
+        self.metric = metric
+
+    def __call__(self, point: Dict[str, float]) -> float:
+        _import_registries()
+        paths = {k: v for k, v in point.items() if "." in k}
+        pipe = pipeline_from_config(apply_point(self.cfg, paths))
+        return float(self.evaluate(pipe, point)[self.metric])
+
+
+class ActiveLearner:
+    """
+    Fit a surrogate to sparse simulations and choose the next ones.
+
+    Parameters
+    ----------
+    space :
+        ParameterSpace to explore.
+    simulate :
+        simulate(point_dict) -> float, e.g. a PipelineSimulator.
+    model :
+        'gp', 'pce', or a GaussianProcess / PolynomialChaos instance.
+    kind :
+        Acquisition, see acquisition(): 'variance', 'threshold' or 'min'.
+    threshold :
+        Requirement level for 'threshold' (e.g. EVM of -25 dB).
+    n_candidates :
+        Sobol candidates scored per step.
+    n_workers :
+        Processes for the simulations of a batch (simulate must be picklable).
+    """
+
+    def __init__(self, space: ParameterSpace, simulate: Callable[[Dict[str, float]], float], *,
+                 model: Any = "gp", kind: str = "variance", threshold: Optional[float] = None,
+                 n_candidates: int = 4096, n_workers: int = 1, seed: Optional[int] = 0):
+        self.space = space
+        self.simulate = simulate
+        if model == "gp":
+            model = GaussianProcess(space, seed=seed)
+        elif model == "pce":
+            model = PolynomialChaos(space)
+        self.model = model
+        self.kind = kind
+        self.threshold = threshold
+        self.n_candidates = n_candidates
+        self.n_workers = n_workers
+        self.seed = seed
+        self.X = np.empty((0, space.d))
+        self.y = np.empty(0)
+        self._step = 0
+
+    def _evaluate(self, X: np.ndarray) -> np.ndarray:
+        pts = self.space.points(X)
+        if self.n_workers > 1 and len(pts) > 1:
+            with process_pool(self.n_workers) as pool:
+                return np.array(list(pool.map(self.simulate, pts)), dtype=float)
+        return np.array([self.simulate(p) for p in pts], dtype=float)
+
+    def add(self, X: np.ndarray, y: np.ndarray) -> None:
+        """Add already simulated points (e.g. from run_sweep results)."""
+        self.X = np.vstack([self.X, np.atleast_2d(X)])
+        self.y = np.r_[self.y, np.asarray(y, dtype=float).ravel()]
+
+    def initialize(self, n: int) -> None:
+        """Simulate a Latin hypercube design of n points."""
+        X = self.space.sample(n, seed=self.seed, method="lhs")
+        self.add(X, self._evaluate(X))
+        self.model.fit(self.X, self.y)
+
+    def propose(self, batch_size: int = 1) -> np.ndarray:
+        """
+        Next batch_size points. Points after the first are chosen with the
+        model refitted on the earlier picks at their predicted values
+        (kriging believer), so a batch spreads out instead of clustering.
+        """
+        cand = self.space.sample(self.n_candidates, seed=None if self.seed is None else self.seed + 1 + self._step,
+                                 method="sobol")
+        self._step += 1
+        X, y = self.X, self.y
+        picks = []
+        for _ in range(batch_size):
+            best = float(np.min(y)) if len(y) else None
+            score = acquisition(self.model, cand, self.kind, threshold=self.threshold, best=best)
+            i = int(np.argmax(score))
+            picks.append(cand[i])
+            X = np.vstack([X, cand[i]])
+            y = np.r_[y, self.model.predict(cand[i:i + 1])]
+            cand = np.delete(cand, i, axis=0)
+            if len(picks) < batch_size:
+                self.model.fit(X, y, optimize=False)
+        if batch_size > 1:
+            self.model.fit(self.X, self.y, optimize=False)
+        return np.array(picks)
+
+    def step(self, batch_size: int = 1) -> np.ndarray:
+        """Propose, simulate and refit; returns the simulated points."""
+        X = self.propose(batch_size)
+        self.add(X, self._evaluate(X))
+        self.model.fit(self.X, self.y)
+        return X
+
+    def run(self, n_iter: int, *, n_init: Optional[int] = None, batch_size: int = 1) -> Any:
+        """Initial design (if nothing simulated yet), then n_iter steps. Returns the model."""
+        if not len(self.y):
+            self.initialize(n_init or max(2 * self.space.d + 2, 8))
+        for _ in range(n_iter):
+            self.step(batch_size)
+        return self.model
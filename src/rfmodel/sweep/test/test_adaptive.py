@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+import yaml
+from scipy.special import erfc
+
+from rfmodel.core.signal import Signal
+from rfmodel.sweep import adaptive_sweep, load_results, run_adaptive_sweep
+
+
+def _ber(x):
+    return 0.5 * erfc(np.sqrt(10 ** (np.asarray(x) / 10)))
+
+
+def _ber_trial(x, i):
+    rng = np.random.default_rng([int(x * 1000), i])
+    return int(rng.binomial(10_000, _ber(x))), 10_000
+
+
+def test_ber_waterfall_resolved_with_few_trials():
+    c = adaptive_sweep(_ber_trial, 0.0, 30.0, targets=[1e-3], tol=0.2, x_tol=0.1, floor=1e-5)
+
+    # the 1e-3 crossing is bracketed to x_tol
+    xs = np.linspace(0, 15, 15001)
+    x_true = xs[np.argmin(np.abs(np.log10(_ber(xs)) + 3))]
+    assert c.crossing(1e-3) == pytest.approx(x_true, abs=0.15)
+
+    # zero-error points are kept (resolved down to the floor), not dropped
+    zero = c.value == 0
+    assert zero.any() and np.all(np.log10(c.hi[zero] / 1e-5) <= 0.2)
+
+    # points concentrate on the waterfall, trials on the low-BER points
+    assert np.sum((c.x > 5) & (c.x < 11)) > np.sum(c.x > 15)
+    assert c.n_trials[c.x < 4].max() <= 2
+    assert c.n_evaluations < 15 * 64        # fixed 15-point grid at the same max_trials
+
+
+def test_mean_metric_refines_kink_only():
+    def evm(x, i):
+        rng = np.random.default_rng([int(x * 1000), i])
+        return -min(x, 20.0) + 0.3 * rng.standard_normal()
+
+    c = adaptive_sweep(evm, 0.0, 30.0, tol=0.5)
+    assert np.sum((c.x > 15) & (c.x < 25)) > np.sum(c.x < 10)
+    assert np.all(c.hi - c.lo <= 0.5 + 1e-12)
+    assert c.kind == "mean"
+
+
+def test_budget_limits():
+    c = adaptive_sweep(_ber_trial, 0.0, 30.0, targets=[1e-3], max_evaluations=40)
+    assert c.n_evaluations <= 40
+    c = adaptive_sweep(_ber_trial, 0.0, 30.0, targets=[1e-3], max_points=7)
+    assert len(c.x) == 7
+
+
+def test_run_adaptive_sweep_from_config(tmp_path):
+    cfg = yaml.safe_load(f"""
+pipeline:
+  - {{type: awgn, name: AWGN, seed: 1, params: {{snr_db: 10.0}}}}
+sweep:
+  design: adaptive
+  params:
+    AWGN.params.snr_db: {{range: [0, 30]}}
+  tol: 0.5
+  results: {tmp_path / 'curve.csv'}
+""")
+    x = np.exp(2j * np.pi * np.random.default_rng(0).random(4096))
+    s = Signal(x=x, fs_hz=1e6)
+
+    def trial(pipe, snr_db, i):
+        e = pipe.run(s)[0].x - x
+        return 10 * np.log10(1 / np.mean(np.abs(e) ** 2))
+
+    c = run_adaptive_sweep(cfg, trial)
+    np.testing.assert_allclose(c.value, c.x, atol=0.5)
+    cols = load_results(tmp_path / "curve.csv")
+    np.testing.assert_allclose(cols["AWGN.params.snr_db"], c.x)
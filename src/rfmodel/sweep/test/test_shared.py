@@ -0,0 +1,81 @@
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from rfmodel.core.signal import Signal
+from rfmodel.sweep.shared import SharedArray, SharedStore, process_pool, resolve
+
+
+def _task(ref, scale):
+    d = resolve(ref)
+    x = d["sig"].x
+    return (
+        float(np.sum(np.abs(x) ** 2) * scale),
+        int(d["bits"].sum()),
+        x.flags.owndata or x.flags.writeable,
+        d["sig"].fs_hz,
+    )
+
+
+@pytest.mark.parametrize("backend", ["shm", "memmap"])
+def test_workers_see_shared_views(backend, tmp_path):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal(200_000) + 1j * rng.standard_normal(200_000)
+    bits = rng.integers(0, 2, 5000).astype(np.uint8)
+
+    with SharedStore(backend=backend, directory=str(tmp_path)) as store:
+        ref = store.put({"sig": Signal(x=x, fs_hz=20e6), "bits": bits})
+        assert len(pickle.dumps(ref)) < 1000                # independent of the waveform size
+
+        with process_pool(2) as pool:
+            res = list(pool.map(_task, [ref] * 4, [1.0, 2.0, 3.0, 4.0]))
+
+        p = float(np.sum(np.abs(x) ** 2))
+        for k, (e, nb, copied, fs) in enumerate(res, start=1):
+            assert np.isclose(e, k * p) and nb == int(bits.sum()) and fs == 20e6
+            assert not copied
+
+        local = resolve(ref)
+        assert np.array_equal(local["sig"].x, x)
+
+    assert len(store) == 0
+    if backend == "memmap":
+        assert list(tmp_path.iterdir()) == []
+
+
+def test_reference_counting_unlinks_at_zero():
+    store = SharedStore()
+    h = store.put_array(np.arange(10.0))
+    store.retain(h)
+    store.release(h)
+    assert np.array_equal(h.array(), np.arange(10.0))
+
+    store.release(h)
+    assert len(store) == 0
+    fresh = SharedArray(name=h.name + "_x", shape=h.shape, dtype=h.dtype)
+    with pytest.raises(FileNotFoundError):
+        fresh.array()
+    store.close()
+
+
+def test_worker_attach_leaves_resource_tracker_clean():
+    # the tracker reports double unregistration (KeyError) and leaks on stderr
+    code = (
+        "import numpy as np\n"
+        "from rfmodel.sweep.shared import SharedStore, process_pool\n"
+        "from rfmodel.sweep.test.test_shared import _sum\n"
+        "if __name__ == '__main__':\n"
+        "    with SharedStore() as store, process_pool(2) as pool:\n"
+        "        hs = [store.put_array(np.arange(100.0) + i) for i in range(3)]\n"
+        "        assert list(pool.map(_sum, hs * 2)) == [4950.0, 5050.0, 5150.0] * 2\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    assert "KeyError" not in proc.stderr and "leaked" not in proc.stderr
+
+
+def _sum(h):
+    return float(h.array().sum())
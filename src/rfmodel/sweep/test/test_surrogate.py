@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+import yaml
+
+from rfmodel.core.signal import Signal
+from rfmodel.sweep.surrogate import (
+    ActiveLearner,
+    GaussianProcess,
+    ParameterSpace,
+    PipelineSimulator,
+    PolynomialChaos,
+    probability_meets,
+)
+
+
+SPACE = ParameterSpace({
+    "PA.params.p1db_out_dbm": (0.0, 12.0),
+    "MIX.params.pll.loop_bandwidth": (1e4, 1e6, "log"),
+    "pin_dbm": (-20.0, 0.0),
+})
+
+
+def _evm(point):
+    # smooth stand-in for a full-chain EVM: compression + phase noise floor
+    backoff = point["PA.params.p1db_out_dbm"] - point["pin_dbm"] - 10.0
+    pn = -30.0 - 4.0 * (np.log10(point["MIX.params.pll.loop_bandwidth"]) - 5.0) ** 2
+    return float(10 * np.log10(10 ** (-backoff / 5.0) + 10 ** (pn / 10.0) + 1e-4))
+
+
+def test_space_round_trip():
+    X = SPACE.sample(50, seed=1)
+    assert np.all(X[:, 1] >= 1e4) and np.all(X[:, 1] <= 1e6)
+    np.testing.assert_allclose(SPACE.from_unit(SPACE.to_unit(X)), X)
+    assert SPACE.grid(4).shape == (64, 3)
+    np.testing.assert_allclose(SPACE.array(SPACE.points(X)), X)
+
+
+def test_pce_recovers_polynomial_and_sobol():
+    space = ParameterSpace({"a": (-1.0, 1.0), "b": (0.0, 2.0)})
+    X = space.sample(40, seed=0)
+    f = lambda X: 1.0 + 2.0 * X[:, 0] + 0.5 * (X[:, 1] - 1.0) ** 2     # noqa: E731
+    pce = PolynomialChaos(space, degree=2).fit(X, f(X))
+    Xt = space.sample(200, seed=5, method="random")
+    np.testing.assert_allclose(pce.predict(Xt), f(Xt), atol=1e-6)
+    s = pce.sobol_indices()
+    assert s["a"]["first"] > 0.9 and s["a"]["total"] == pytest.approx(s["a"]["first"])
+
+
+def test_gp_active_learning_maps_requirement_boundary():
+    learner = ActiveLearner(SPACE, _evm, kind="threshold", threshold=-25.0, n_candidates=1024)
+    gp = learner.run(20, n_init=16, batch_size=2)
+    assert isinstance(gp, GaussianProcess) and len(learner.y) == 56
+
+    Xt = SPACE.sample(2000, seed=7, method="random")
+    truth = np.array([_evm(p) for p in SPACE.points(Xt)])
+    pred = gp.predict(Xt)
+    ok_true, ok_pred = truth <= -25.0, pred <= -25.0
+    assert np.mean(ok_true == ok_pred) > 0.93
+
+    p = probability_meets(gp, Xt, -25.0)
+    assert np.all((p >= 0) & (p <= 1))
+    assert np.mean(p[ok_true]) > np.mean(p[~ok_true])
+
+
+def test_variance_acquisition_reduces_error():
+    Xt = SPACE.sample(1000, seed=3, method="random")
+    truth = np.array([_evm(p) for p in SPACE.points(Xt)])
+    learner = ActiveLearner(SPACE, _evm, n_candidates=1024)
+    learner.initialize(10)
+    e0 = np.sqrt(np.mean((learner.model.predict(Xt) - truth) ** 2))
+    learner.run(25)
+    e1 = np.sqrt(np.mean((learner.model.predict(Xt) - truth) ** 2))
+    assert e1 < 0.5 * e0
+
+
+def _measured_snr(pipe, point):
+    x = np.exp(2j * np.pi * np.random.default_rng(0).random(4096))
+    e = pipe.run(Signal(x=x, fs_hz=1e6))[0].x - x
+    return {"snr_db": 10 * np.log10(1 / np.mean(np.abs(e) ** 2))}
+
+
+def test_pipeline_simulator():
+    cfg = yaml.safe_load("pipeline:\n  - {type: awgn, name: AWGN, seed: 1, params: {snr_db: 10.0}}\n")
+    sim = PipelineSimulator(cfg, _measured_snr, "snr_db")
+    assert sim({"AWGN.params.snr_db": 20.0, "pin_dbm": -3.0}) == pytest.approx(20.0, abs=0.3)
@@ -0,0 +1,107 @@
+import json
+
+import numpy as np
+import pytest
+import yaml
+
+from rfmodel.core.signal import Signal
+from rfmodel.sweep import SweepSpec, apply_point, load_results, run_sweep
+
+
+CFG = yaml.safe_load("""
+pipeline:
+  - type: pathloss
+    name: PL
+    params: {freq_hz: 2.4e9, distance_m: 10.0}
+  - type: awgn
+    name: AWGN
+    seed: 3
+    params: {snr_db: 10.0}
+sweep:
+  design: grid
+  params:
+    AWGN.params.snr_db: [0.0, 10.0, 20.0]
+    PL.params.distance_m: {geomspace: [1.0, 100.0, 2]}
+""")
+
+
+def _snr(pipe, point, data):
+    y = pipe.run(data["sig"])[0].x
+    ref = pipe.get("PL").amplitude_gain() * data["sig"].x
+    e = y - ref
+    return {"snr_est_db": 10 * np.log10(np.mean(np.abs(ref) ** 2) / np.mean(np.abs(e) ** 2)), "n": y.size}
+
+
+def _data():
+    rng = np.random.default_rng(0)
+    return {"sig": Signal(x=np.exp(2j * np.pi * rng.random(20_000)), fs_hz=1e6)}
+
+
+def test_designs():
+    grid = SweepSpec.from_config(CFG["sweep"]).points()
+    assert len(grid) == 6
+    assert grid[0] == {"AWGN.params.snr_db": 0.0, "PL.params.distance_m": 1.0}
+    assert grid[1]["PL.params.distance_m"] == pytest.approx(100.0)
+
+    z = SweepSpec(params={"a.x": [1, 2, 3], "b.y": [4, 5, 6]}, design="zip").points()
+    assert [p["b.y"] for p in z] == [4, 5, 6]
+    with pytest.raises(ValueError):
+        SweepSpec(params={"a.x": [1, 2], "b.y": [4]}, design="zip").points()
+
+    spec = SweepSpec(params={"a.x": {"uniform": [0, 1]}, "a.y": {"choice": ["p", "q"]}},
+                     design="random", n_points=5, seed=1)
+    r = spec.points()
+    assert r == spec.points() and len(r) == 5
+    assert all(0 <= p["a.x"] <= 1 and p["a.y"] in ("p", "q") for p in r)
+
+
+def test_apply_point_nested_paths():
+    cfg = {"pipeline": [{"type": "mixer", "name": "MIX", "params": {"pll": {"loop_bandwidth": 1e5}}}]}
+    out = apply_point(cfg, {"MIX.params.pll.loop_bandwidth": 3e4, "MIX.params.lo_freq": 2e9})
+    assert out["pipeline"][0]["params"]["pll"] == {"loop_bandwidth": 3e4}
+    assert out["pipeline"][0]["params"]["lo_freq"] == 2e9
+    assert cfg["pipeline"][0]["params"]["pll"]["loop_bandwidth"] == 1e5     # original untouched
+    with pytest.raises(KeyError):
+        apply_point(cfg, {"NOPE.params.x": 1})
+
+
+def test_run_resume_and_results(tmp_path):
+    ckpt, res = tmp_path / "ckpt.jsonl", tmp_path / "res.npz"
+    cols = run_sweep(CFG, _snr, data=_data(), checkpoint=ckpt, results=res)
+
+    assert list(cols["index"]) == list(range(6))
+    np.testing.assert_allclose(cols["snr_est_db"], cols["AWGN.params.snr_db"], atol=0.3)
+    loaded = load_results(res)
+    np.testing.assert_array_equal(loaded["snr_est_db"], cols["snr_est_db"])
+
+    # interrupted sweep: keep 2 records plus a half-written line, then resume
+    lines = ckpt.read_text().splitlines()
+    ckpt.write_text("\n".join(lines[:2]) + "\n" + lines[2][:15])
+    calls = []
+
+    def counting(pipe, point, data):
+        calls.append(point)
+        return _snr(pipe, point, data)
+
+    cols2 = run_sweep(CFG, counting, data=_data(), checkpoint=ckpt)
+    assert len(calls) == 4
+    np.testing.assert_allclose(cols2["snr_est_db"], cols["snr_est_db"])
+
+    # the partial line was replaced, so the checkpoint resumes again cleanly
+    calls.clear()
+    cols3 = run_sweep(CFG, counting, data=_data(), checkpoint=ckpt)
+    assert calls == [] and len(ckpt.read_text().splitlines()) == 6
+    np.testing.assert_allclose(cols3["snr_est_db"], cols["snr_est_db"])
+
+    # a checkpoint from a different sweep is rejected
+    other = json.loads(json.dumps(CFG))
+    other["sweep"]["params"]["AWGN.params.snr_db"] = [5.0, 10.0, 20.0]
+    with pytest.raises(ValueError):
+        run_sweep(other, _snr, data=_data(), checkpoint=ckpt)
+
+
+def test_parallel_matches_serial(tmp_path):
+    serial = run_sweep(CFG, _snr, data=_data())
+    par = run_sweep(CFG, _snr, data=_data(), n_workers=2, results=tmp_path / "r.csv")
+    np.testing.assert_allclose(par["snr_est_db"], serial["snr_est_db"])
+    np.testing.assert_allclose(load_results(tmp_path / "r.csv")["snr_est_db"], serial["snr_est_db"])